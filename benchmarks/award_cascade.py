@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Compare the lookups of a cascading award cancellation.
+
+An auction gets ``lots`` lots with ``awards`` awards each (interleaved, as
+awards of different lots are appended as they are qualified) and a contract
+per award. For every award the benchmark collects the awards of its lot
+from it on and their contracts, either by scanning the auction as the
+award view used to or through ``AwardIndex``.
+
+Usage: bin/py benchmarks/award_cascade.py [lots] [awards] [repeat]
+"""
+import sys
+import timeit
+
+from openprocurement.auctions.dgf.awarding import AwardIndex
+
+
+class Item(object):
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+def make_auction(lots, awards):
+    auction = Item(awards=[], contracts=[])
+    for n in range(awards):
+        for lot in range(lots):
+            award = Item(id='{}-{}'.format(lot, n), lotID=str(lot), complaints=[])
+            auction.awards.append(award)
+            auction.contracts.append(Item(awardID=award.id))
+    return auction
+
+
+def scan(auction, award):
+    cancelled = []
+    for i in auction.awards[auction.awards.index(award):]:
+        if i.lotID != award.lotID:
+            continue
+        cancelled.append(i.id)
+    return [i for i in auction.contracts if i.awardID in cancelled]
+
+
+def indexed(auction, award):
+    index = auction._award_index.update(auction)
+    return [c for i in index.lot_awards_from(award) for c in index.award_contracts(i.id)]
+
+
+def main(lots=100, awards=20, repeat=3):
+    auction = make_auction(lots, awards)
+    auction._award_index = AwardIndex()
+    targets = auction.awards[::max(len(auction.awards) // 100, 1)]
+    assert [len(scan(auction, i)) for i in targets] == [len(indexed(auction, i)) for i in targets]
+    print('{} lots x {} awards, {} cascades'.format(lots, awards, len(targets)))
+    build = min(timeit.repeat(lambda: AwardIndex().update(auction), number=1, repeat=repeat))
+    print('{:<24} {:10.3f} ms'.format('index build', build * 1000))
+    for name, func in [('scan (before)', scan), ('indexed', indexed)]:
+        elapsed = min(timeit.repeat(lambda: [func(auction, i) for i in targets], number=1, repeat=repeat))
+        print('{:<24} {:10.3f} ms per cascade'.format(name, elapsed * 1000 / len(targets)))
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:]])
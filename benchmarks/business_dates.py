@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Evaluate next_check of complaint-heavy auctions with and without the
+business calendar LRU.
+
+Every run loads the auction into a fresh model, as a request does, so the
+per-instance next-check index starts empty and each open claim asks the
+business calendar for its stand-still end.
+
+Usage: bin/py benchmarks/business_dates.py [complaints] [runs]
+"""
+import sys
+from copy import deepcopy
+from datetime import timedelta
+from timeit import timeit
+from uuid import uuid4
+
+from openprocurement.api.models import get_now
+from openprocurement.auctions.dgf.business_dates import BUSINESS_CALENDAR
+from openprocurement.auctions.dgf.models import DGFOtherAssets
+from openprocurement.auctions.dgf.tests.base import test_auction_data, test_organization
+
+
+def complaint_heavy_auction(complaints):
+    now = get_now()
+    data = deepcopy(test_auction_data)
+    data.update({
+        'id': uuid4().hex,
+        'auctionID': 'UA-EA-2016-01-01-000001',
+        'status': 'active.qualification',
+        'complaints': [
+            {
+                'id': uuid4().hex,
+                'title': 'complaint title',
+                'author': test_organization,
+                'status': 'claim',
+                'dateSubmitted': (now - timedelta(hours=i % 240)).isoformat(),
+            }
+            for i in range(complaints)
+        ],
+    })
+    return data
+
+
+def main(complaints=500, runs=50):
+    data = complaint_heavy_auction(int(complaints))
+    runs = int(runs)
+    evaluate = lambda: DGFOtherAssets(data).next_check
+    size = BUSINESS_CALENDAR.size
+
+    BUSINESS_CALENDAR.resize(0)
+    uncached = timeit(evaluate, number=runs)
+    BUSINESS_CALENDAR.resize(size)
+    BUSINESS_CALENDAR.clear()
+    cold = timeit(evaluate, number=1)
+    warm = timeit(evaluate, number=runs)
+
+    print('{} complaints, {} runs'.format(complaints, runs))
+    print('{:<30} {:8.2f} ms/run'.format('without calendar LRU', uncached * 1000 / runs))
+    print('{:<30} {:8.2f} ms/run'.format('calendar LRU, first run', cold * 1000))
+    print('{:<30} {:8.2f} ms/run'.format('calendar LRU, warm', warm * 1000 / runs))
+    print('{:<30} {}'.format('calendar', BUSINESS_CALENDAR.stats()))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""Compare list-based CAV code validation with the CodeRegistry lookup.
+
+Usage: bin/py benchmarks/cav_codes.py [items]
+"""
+import random
+import sys
+from timeit import timeit
+
+from schematics.types import StringType
+
+from openprocurement.auctions.dgf.models import CAV_CODES, read_json
+
+
+def main(items=500, repeat=20):
+    codes_list = read_json('cav.json')
+    sample = [random.choice(codes_list) for i in range(items)]
+    list_type = StringType(required=True, choices=codes_list)
+    registry_type = StringType(required=True, choices=CAV_CODES)
+
+    results = [
+        ('list membership', timeit(lambda: [i in codes_list for i in sample], number=repeat)),
+        ('registry membership', timeit(lambda: [i in CAV_CODES for i in sample], number=repeat)),
+        ('list StringType.validate', timeit(lambda: [list_type.validate(i) for i in sample], number=repeat)),
+        ('registry StringType.validate', timeit(lambda: [registry_type.validate(i) for i in sample], number=repeat)),
+    ]
+    print('{} codes, {} items x {} runs'.format(len(codes_list), items, repeat))
+    for name, seconds in results:
+        print('{:<30} {:8.2f} ms/run'.format(name, seconds * 1000 / repeat))
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:]])
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Find due auctions through the next_check view versus a document scan.
+
+Fills a scratch CouchDB database with ``count`` synthetic dgf auctions whose
+``next_check`` is spread over two months around now, then measures the
+initial view build, paging through the auctions due now, the view catching
+up after a batch of saves, and the same question answered by scanning
+``_all_docs``. The database is deleted afterwards.
+
+Usage: bin/py benchmarks/due_auctions.py [couchdb_url] [count]
+"""
+import random
+import sys
+import time
+from datetime import timedelta
+from uuid import uuid4
+
+from couchdb import Server
+from iso8601 import parse_date
+from openprocurement.api.models import get_now
+from openprocurement.auctions.dgf.chronograph import due_auctions
+from openprocurement.auctions.dgf.design import sync_design
+
+BATCH = 1000
+TYPES = ['dgfOtherAssets', 'dgfFinancialAssets']
+
+
+def synthetic_auction(now):
+    return {
+        '_id': uuid4().hex,
+        'doc_type': 'Auction',
+        'procurementMethodType': random.choice(TYPES),
+        'status': 'active.tendering',
+        'next_check': (now + timedelta(seconds=random.randint(-30 * 86400, 30 * 86400))).isoformat(),
+    }
+
+
+def fill(db, count, now):
+    for start in range(0, count, BATCH):
+        db.update([synthetic_auction(now) for i in range(min(BATCH, count - start))])
+
+
+def timed(name, func):
+    start = time.time()
+    result = func()
+    print('{:<40} {:10.1f} ms'.format(name, (time.time() - start) * 1000))
+    return result
+
+
+def page_all(db, before, procurementMethodType=None):
+    found, offset = [], None
+    while True:
+        page, offset = due_auctions(db, before, procurementMethodType, 1000, offset)
+        found.extend(page)
+        if not offset:
+            return found
+
+
+def scan(db, before):
+    found = []
+    for row in db.iterview('_all_docs', BATCH, include_docs=True):
+        doc = row.doc
+        if doc.get('doc_type') == 'Auction' and doc.get('procurementMethodType') in TYPES and \
+                doc.get('next_check') and parse_date(doc['next_check']) <= before:
+            found.append(doc['_id'])
+    return found
+
+
+def main(url='http://127.0.0.1:5984/', count=100000):
+    count = int(count)
+    server = Server(url)
+    name = 'dgf_due_benchmark_{}'.format(uuid4().hex[:8])
+    db = server.create(name)
+    try:
+        now = get_now()
+        timed('insert {} auctions'.format(count), lambda: fill(db, count, now))
+        sync_design(db)
+        timed('view build (first query)', lambda: due_auctions(db, now, limit=1))
+        due = timed('page through due auctions', lambda: page_all(db, now))
+        print('{:<40} {:10d}'.format('due auctions', len(due)))
+        timed('first page of 100', lambda: due_auctions(db, now))
+        timed('first page of 100, one type', lambda: due_auctions(db, now, TYPES[0]))
+        fill(db, BATCH, now)
+        timed('view update after {} saves'.format(BATCH), lambda: due_auctions(db, now, limit=1))
+        scanned = timed('_all_docs scan (before)', lambda: scan(db, now))
+        print('{:<40} {:10d}'.format('due auctions by scan', len(scanned)))
+    finally:
+        del server[name]
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Compare the stock JSON rendering of a large auction with the dgf
+renderer's encoders.
+
+The payload is test_auction_data scaled to ``items`` items, serialized with
+the role of its status as a GET returns it.
+
+Usage: bin/py benchmarks/json_encoding.py [items] [runs]
+"""
+import json
+import sys
+from copy import deepcopy
+from timeit import timeit
+from uuid import uuid4
+
+from openprocurement.auctions.dgf.models import DGFOtherAssets
+from openprocurement.auctions.dgf.renderers import ENCODERS, JSONRenderer, default
+from openprocurement.auctions.dgf.tests.base import test_auction_data
+
+
+def payload(items):
+    data = deepcopy(test_auction_data)
+    item = data['items'][0]
+    data.update({
+        'id': uuid4().hex,
+        'auctionID': 'UA-EA-2016-01-01-000001',
+        'status': 'active.tendering',
+        'description': data['title'] * 20,
+        'items': [dict(deepcopy(item), id=uuid4().hex) for i in range(items)],
+    })
+    auction = DGFOtherAssets(data)
+    return {'data': auction.serialize(auction.status)}
+
+
+def main(items=300, runs=50):
+    value = payload(int(items))
+    runs = int(runs)
+    print('{} items, {} runs'.format(items, runs))
+    stock = lambda: json.dumps(value, default=default)
+    results = [('stock json (ensure_ascii)', stock, len(stock()))]
+    for name, factory in ENCODERS:
+        renderer = JSONRenderer(name)
+        if renderer.name != name:
+            print('{:<30} not available'.format(name))
+            continue
+        results.append((name, lambda renderer=renderer: renderer.encode(value), len(renderer.encode(value))))
+    for name, func, size in results:
+        seconds = timeit(func, number=runs)
+        print('{:<30} {:8.2f} ms/run {:10d} bytes'.format(name, seconds * 1000 / runs, size))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Compare building a stored auction with many bids and documents eagerly
+and with the lazy lists of ``lazy``.
+
+Usage: bin/py benchmarks/lazy_auction.py [bids] [runs]
+"""
+import sys
+from copy import deepcopy
+from timeit import timeit
+from uuid import uuid4
+
+from openprocurement.api.models import get_now
+from openprocurement.auctions.dgf.models import DGFOtherAssets
+from openprocurement.auctions.dgf.tests.base import test_auction_data, test_organization
+
+
+def stored_doc(bids):
+    now = get_now().isoformat()
+    data = deepcopy(test_auction_data)
+    data.update({
+        'id': uuid4().hex,
+        'auctionID': 'UA-EA-2016-01-01-000001',
+        'status': 'active.tendering',
+        'bids': [{
+            'id': uuid4().hex,
+            'date': now,
+            'status': 'active',
+            'qualified': True,
+            'tenderers': [test_organization],
+            'value': {'amount': 500 + i},
+        } for i in range(bids)],
+        'documents': [{
+            'id': uuid4().hex,
+            'title': u'document{}.doc'.format(i),
+            'url': 'http://localhost/{}'.format(uuid4().hex),
+            'format': 'application/msword',
+            'datePublished': now,
+            'dateModified': now,
+        } for i in range(bids)],
+    })
+    return DGFOtherAssets(data).to_primitive()
+
+
+def main(bids=300, runs=20):
+    doc = stored_doc(int(bids))
+    runs = int(runs)
+    eager_doc = dict(doc, _rev=None)
+    doc['_rev'] = '1-{}'.format(uuid4().hex)
+    print('{} bids and documents, {} runs'.format(bids, runs))
+    cases = [
+        ('eager build', lambda: DGFOtherAssets(eager_doc)),
+        ('lazy build', lambda: DGFOtherAssets(doc)),
+        ('lazy build + items', lambda: DGFOtherAssets(doc).items),
+        ('lazy build + bids', lambda: DGFOtherAssets(doc).bids),
+    ]
+    for name, func in cases:
+        seconds = timeit(func, number=runs)
+        print('{:<20} {:8.2f} ms/run'.format(name, seconds * 1000 / runs))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Compare a full role serialization of a large auction with ?opt_fields
+projections of it.
+
+Usage: bin/py benchmarks/opt_fields.py [items] [documents] [runs]
+"""
+import sys
+from copy import deepcopy
+from timeit import timeit
+from uuid import uuid4
+
+from openprocurement.auctions.dgf.models import DGFOtherAssets
+from openprocurement.auctions.dgf.projection import parse_fields, project
+from openprocurement.auctions.dgf.tests.base import test_auction_data
+
+PROJECTIONS = [
+    'status,next_check',
+    'status,dateModified,tenderPeriod,auctionPeriod',
+    'items.classification',
+]
+
+
+def large_auction(items, documents):
+    data = deepcopy(test_auction_data)
+    item = data['items'][0]
+    data.update({
+        'id': uuid4().hex,
+        'auctionID': 'UA-EA-2016-01-01-000001',
+        'status': 'active.tendering',
+        'items': [dict(deepcopy(item), id=uuid4().hex) for i in range(items)],
+        'documents': [
+            {
+                'id': uuid4().hex,
+                'title': u'document{}.pdf'.format(i),
+                'format': 'application/pdf',
+                'url': 'http://localhost/get/{}'.format(uuid4().hex),
+                'datePublished': data['tenderPeriod']['endDate'],
+                'dateModified': data['tenderPeriod']['endDate'],
+            }
+            for i in range(documents)
+        ],
+    })
+    return DGFOtherAssets(data)
+
+
+def main(items=500, documents=500, runs=20):
+    auction = large_auction(int(items), int(documents))
+    runs = int(runs)
+    role = auction.status
+    print('{} items, {} documents, {} runs'.format(items, documents, runs))
+    seconds = timeit(lambda: auction.serialize(role), number=runs)
+    print('{:<50} {:8.2f} ms/run'.format('full serialize', seconds * 1000 / runs))
+    for value in PROJECTIONS:
+        fields = parse_fields(value)
+        seconds = timeit(lambda: project(auction, role, fields), number=runs)
+        print('{:<50} {:8.2f} ms/run'.format('opt_fields=' + value, seconds * 1000 / runs))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
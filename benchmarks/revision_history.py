@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Compare reading and writing an auction with a long revision history
+inline and with all but a window of it archived (see ``history``).
+
+The history is made of ``revisions`` saves, each changing the title and
+adding a document.
+
+Usage: bin/py benchmarks/revision_history.py [revisions] [window] [runs]
+"""
+import json
+import sys
+from base64 import b64decode
+from copy import deepcopy
+from timeit import timeit
+from uuid import uuid4
+
+from openprocurement.api.models import get_now
+from openprocurement.api.utils import get_revision_changes
+from openprocurement.auctions.dgf.history import compact_revisions, decode_chunk, historic_state
+from openprocurement.auctions.dgf.models import DGFOtherAssets
+from openprocurement.auctions.dgf.tests.base import test_auction_data
+
+
+def long_lived_auction(revisions):
+    data = deepcopy(test_auction_data)
+    data.update({'id': uuid4().hex, 'auctionID': 'UA-EA-2016-01-01-000001', 'status': 'active.tendering'})
+    auction = DGFOtherAssets(data)
+    model_class = DGFOtherAssets.revisions.model_class
+    src = {}
+    for i in range(revisions):
+        now = get_now().isoformat()
+        auction.title = u'title {}'.format(i)
+        auction.documents.append(type(auction).documents.model_class({
+            'title': u'document{}.doc'.format(i), 'url': 'http://localhost/{}'.format(uuid4().hex),
+            'format': 'application/msword', 'datePublished': now, 'dateModified': now,
+        }))
+        dst = auction.serialize('plain')
+        auction.revisions.append(model_class({'author': 'broker', 'changes': get_revision_changes(dst, src), 'rev': None}))
+        src = dst
+    return auction, src
+
+
+def main(revisions=1000, window=50, runs=20):
+    revisions, window, runs = int(revisions), int(window), int(runs)
+    auction, src = long_lived_auction(revisions)
+    inline = auction.to_primitive()
+    compact_revisions(auction, window)
+    compacted = auction.to_primitive()
+    chunk = compacted['_attachments'].popitem()[1]
+    print('{} revisions, window {}, {} runs'.format(revisions, window, runs))
+    for name, doc in [('inline', inline), ('compacted', compacted)]:
+        body = json.dumps(doc)
+        load = timeit(lambda: DGFOtherAssets(dict(json.loads(body), _rev='1-a')).serialize('plain'), number=runs)
+        print('{:<12} {:10d} bytes   read and serialize {:8.2f} ms/run'.format(name, len(body), load * 1000 / runs))
+    archived = decode_chunk(b64decode(chunk['data']))
+    history = archived + [i.serialize() for i in auction.revisions]
+    seconds = timeit(lambda: historic_state(src, history, 1), number=runs)
+    print('{:<12} {:10d} bytes   reconstruct revision 1 {:8.2f} ms/run'.format('archive', len(chunk['data']), seconds * 1000 / runs))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
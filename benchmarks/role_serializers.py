@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Profile plain serialize() against the compiled role serializers on a
+large auction.
+
+Prints the time per run for a few roles and the busiest functions of one
+profiled run of each.
+
+Usage: bin/py benchmarks/role_serializers.py [items] [runs]
+"""
+import cProfile
+import pstats
+import sys
+from copy import deepcopy
+from timeit import timeit
+from uuid import uuid4
+
+from openprocurement.auctions.dgf.models import DGFOtherAssets
+from openprocurement.auctions.dgf.serializers import serialize_role
+from openprocurement.auctions.dgf.tests.base import test_auction_data
+
+ROLES = ['active.tendering', 'view', 'plain']
+
+
+def large_auction(items):
+    data = deepcopy(test_auction_data)
+    item = data['items'][0]
+    data.update({
+        'id': uuid4().hex,
+        'auctionID': 'UA-EA-2016-01-01-000001',
+        'status': 'active.tendering',
+        'items': [dict(deepcopy(item), id=uuid4().hex) for i in range(items)],
+    })
+    return DGFOtherAssets(data)
+
+
+def profile(name, func):
+    profiler = cProfile.Profile()
+    profiler.runcall(func)
+    stats = pstats.Stats(profiler)
+    print('{} - {} calls'.format(name, stats.total_calls))
+    stats.sort_stats('tottime').print_stats(5)
+
+
+def main(items=500, runs=20):
+    auction = large_auction(int(items))
+    runs = int(runs)
+    print('{} items, {} runs'.format(items, runs))
+    for role in ROLES:
+        assert serialize_role(auction, role) == auction.serialize(role)
+        plain = timeit(lambda: auction.serialize(role), number=runs)
+        compiled = timeit(lambda: serialize_role(auction, role), number=runs)
+        print('{:<20} serialize() {:8.2f} ms/run   compiled {:8.2f} ms/run'.format(
+            role, plain * 1000 / runs, compiled * 1000 / runs))
+    profile('serialize()', lambda: auction.serialize(ROLES[0]))
+    profile('compiled', lambda: serialize_role(auction, ROLES[0]))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Measure worker startup cost of the dgf plugin.
+
+Each sample runs in a fresh interpreter: importing the package, building
+the API app from the test config with and without the dgf plugin (the
+difference is what ``includeme`` costs), the first validation of a CAV
+classification, which loads the code table, with and without the marshal
+cache, and loading the table alone from JSON and from the cache.
+
+Building the app needs the CouchDB of ``tests.ini``.
+
+Usage: bin/py benchmarks/startup.py [samples]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+import openprocurement.auctions.dgf.tests
+
+TESTS_DIR = os.path.dirname(openprocurement.auctions.dgf.tests.__file__)
+
+APP = """
+from paste.deploy import appconfig
+from openprocurement.api.app import main
+conf = appconfig('config:tests.ini', relative_to={tests_dir!r})
+main(conf.global_conf, **dict(conf.local_conf, **{settings!r}))
+"""
+
+VALIDATION = """
+from openprocurement.auctions.dgf.models import CAVClassification
+CAVClassification({'scheme': u'CAV', 'id': u'06000000-2', 'description': u'Land'}).validate()
+"""
+
+SNIPPETS = [
+    ('import (lazy tables)', """
+import openprocurement.auctions.dgf
+"""),
+    ('app without dgf', APP.format(tests_dir=TESTS_DIR, settings={'plugins': 'auctions.core'})),
+    ('app with dgf (includeme)', APP.format(tests_dir=TESTS_DIR, settings={})),
+    ('app + first validation', APP.format(tests_dir=TESTS_DIR, settings={}) + VALIDATION),
+    ('app + first validation, cached', APP.format(tests_dir=TESTS_DIR, settings={'dgf.codes_cache_dir': '{cache_dir}'}) + VALIDATION),
+    ('cav.json from JSON', """
+from openprocurement.auctions.dgf import codes
+codes.load_json('cav.json')
+"""),
+    ('cav.json from marshal cache', """
+from openprocurement.auctions.dgf import codes
+codes.configure_codes_cache({cache_dir!r})
+codes.load_json('cav.json')
+"""),
+]
+
+TIMER = """
+import time
+start = time.time()
+{}
+print(time.time() - start)
+"""
+
+
+def run(snippet):
+    output = subprocess.check_output([sys.executable, '-c', TIMER.format(snippet)])
+    return float(output.strip().splitlines()[-1])
+
+
+def main(samples=10):
+    cache_dir = tempfile.mkdtemp()
+    for name, snippet in SNIPPETS:
+        snippet = snippet.replace('{cache_dir!r}', repr(cache_dir)).replace('{cache_dir}', cache_dir)
+        run(snippet)
+        timings = sorted(run(snippet) for i in range(samples))
+        print('{:<32} {:8.2f} ms (median of {})'.format(name, timings[len(timings) // 2] * 1000, samples))
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:]])
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Compare the stored size and the write and read time of a large auction
+without and with the storage codecs (see ``storage``).
+
+The synthetic auction has ``items`` items with long Ukrainian descriptions,
+as many documents and a revision per item.
+
+Usage: bin/py benchmarks/storage_codec.py [items] [runs]
+"""
+import json
+import sys
+from copy import deepcopy
+from timeit import timeit
+from uuid import uuid4
+
+from openprocurement.api.models import get_now
+from openprocurement.auctions.dgf.models import DGFOtherAssets
+from openprocurement.auctions.dgf.storage import CODECS, StorageCodec
+from openprocurement.auctions.dgf.tests.base import test_auction_data
+
+DESCRIPTION = u'Нежитлове приміщення загальною площею 130,6 кв.м., розташоване за адресою м. Київ, вул. Хрещатик. '
+
+
+def large_auction(items):
+    now = get_now().isoformat()
+    data = deepcopy(test_auction_data)
+    item = data['items'][0]
+    data.update({
+        'id': uuid4().hex,
+        'auctionID': 'UA-EA-2016-01-01-000001',
+        'status': 'active.tendering',
+        'items': [dict(deepcopy(item), id=uuid4().hex, description=DESCRIPTION * 10) for i in range(items)],
+        'documents': [{
+            'id': uuid4().hex,
+            'title': u'Паспорт лоту {}.pdf'.format(i),
+            'description': DESCRIPTION,
+            'url': 'http://localhost/{}'.format(uuid4().hex),
+            'format': 'application/pdf',
+            'datePublished': now,
+            'dateModified': now,
+        } for i in range(items)],
+        'revisions': [{
+            'author': 'broker',
+            'date': now,
+            'rev': '1-{}'.format(uuid4().hex),
+            'changes': [{'op': 'remove', 'path': '/documents/{}'.format(i)}],
+        } for i in range(items)],
+    })
+    return DGFOtherAssets(data)
+
+
+def main(items=300, runs=20):
+    auction = large_auction(int(items))
+    runs = int(runs)
+    print('{} items, {} runs'.format(items, runs))
+    for name in [None] + [i[0] for i in CODECS]:
+        codec = StorageCodec()
+        codec.configure(name, 0)
+        if codec.name != name:
+            print('{:<8} not available'.format(name))
+            continue
+        body = json.dumps(codec.encode(auction.to_primitive()))
+        write = timeit(lambda: json.dumps(codec.encode(auction.to_primitive())), number=runs)
+        read = timeit(lambda: DGFOtherAssets(dict(json.loads(body), _rev='1-a')).items, number=runs)
+        print('{:<8} {:10d} bytes   write {:8.2f} ms/run   read {:8.2f} ms/run'.format(
+            name or 'none', len(body), write * 1000 / runs, read * 1000 / runs))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Compare the revision changes of a document PATCH worked out from two
+plain serializations of a large auction with the tracked changes of the
+patched document only.
+
+Usage: bin/py benchmarks/tracked_revisions.py [documents] [runs]
+"""
+import sys
+from copy import deepcopy
+from timeit import timeit
+from uuid import uuid4
+
+from openprocurement.api.models import get_now
+from openprocurement.api.utils import get_revision_changes
+from openprocurement.auctions.dgf.models import DGFOtherAssets
+from openprocurement.auctions.dgf.tests.base import test_auction_data
+from openprocurement.auctions.dgf.tracking import revision_changes, tracked_parts
+
+
+def large_auction(documents):
+    now = get_now().isoformat()
+    data = deepcopy(test_auction_data)
+    item = data['items'][0]
+    data.update({
+        'id': uuid4().hex,
+        'auctionID': 'UA-EA-2016-01-01-000001',
+        'status': 'active.tendering',
+        'items': [dict(deepcopy(item), id=uuid4().hex) for i in range(documents)],
+        'documents': [{
+            'id': uuid4().hex,
+            'title': u'document{}.doc'.format(i),
+            'url': 'http://localhost/{}'.format(uuid4().hex),
+            'format': 'application/msword',
+            'datePublished': now,
+            'dateModified': now,
+        } for i in range(documents)],
+    })
+    return DGFOtherAssets(data)
+
+
+def main(documents=300, runs=20):
+    auction = large_auction(int(documents))
+    runs = int(runs)
+    src = auction.serialize('plain')
+    document = auction.documents[len(auction.documents) // 2]
+    document.__parent__ = auction
+    document.import_data({'title': u'renamed.doc'})
+    full = lambda: get_revision_changes(auction.serialize('plain'), src)
+    tracked = lambda: revision_changes(tracked_parts(auction, document, src))
+    assert sorted(map(repr, full())) == sorted(map(repr, tracked()))
+    print('{} items and documents, {} runs'.format(documents, runs))
+    for name, func in [('full diff', full), ('tracked', tracked)]:
+        seconds = timeit(func, number=runs)
+        print('{:<20} {:8.2f} ms/run'.format(name, seconds * 1000 / runs))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
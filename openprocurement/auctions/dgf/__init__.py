@@ -1,7 +1,47 @@
+from pyramid.events import ApplicationCreated, NewResponse
+from pyramid.settings import asbool
+from openprocurement.auctions.dgf.business_dates import BUSINESS_CALENDAR
+from openprocurement.auctions.dgf.cache import SerializationCache, DEFAULT_SERIALIZATION_CACHE_SIZE
+from openprocurement.auctions.dgf.codes import configure_codes_cache
+from openprocurement.auctions.dgf.design import sync_design
+from openprocurement.auctions.dgf.etag import set_etag
 from openprocurement.auctions.dgf.models import DGFOtherAssets, DGFFinancialAssets
+from openprocurement.auctions.dgf.renderers import JSONRenderer
+from openprocurement.auctions.dgf.storage import DEFAULT_MAX_SIZE, DEFAULT_MIN_SIZE, STORAGE
+from openprocurement.auctions.dgf.warmer import CacheWarmer
+
+
+def sync_design_on_start(event):
+    db = getattr(event.app.registry, 'db', None)
+    if db is not None:
+        sync_design(db)
+
+
+def start_cache_warmer(event):
+    registry = event.app.registry
+    db = getattr(registry, 'db', None)
+    if db is not None and registry.serialization_cache.size and asbool(registry.settings.get('dgf.cache_warmer')):
+        registry.cache_warmer = CacheWarmer(db, registry.serialization_cache)
+        registry.cache_warmer.start()
 
 
 def includeme(config):
+    settings = config.registry.settings
+    if settings.get('dgf.codes_cache_dir'):
+        configure_codes_cache(settings['dgf.codes_cache_dir'])
+    if settings.get('dgf.business_calendar_size'):
+        BUSINESS_CALENDAR.resize(int(settings['dgf.business_calendar_size']))
+    STORAGE.configure(settings.get('dgf.storage_codec'),
+                      int(settings.get('dgf.storage_codec_min_size', DEFAULT_MIN_SIZE)),
+                      int(settings.get('dgf.storage_codec_max_size', DEFAULT_MAX_SIZE)))
+    config.registry.serialization_cache = SerializationCache(
+        int(settings.get('dgf.serialization_cache_size', DEFAULT_SERIALIZATION_CACHE_SIZE)))
+    config.add_renderer('dgf_json', JSONRenderer(settings.get('dgf.json_encoder', 'auto')))
+    config.add_subscriber(set_etag, NewResponse)
+    config.add_tween('openprocurement.auctions.dgf.etag.conditional_get_tween_factory')
+    config.add_subscriber(sync_design_on_start, ApplicationCreated)
+    config.add_subscriber(start_cache_warmer, ApplicationCreated)
+
     config.add_auction_procurementMethodType(DGFOtherAssets)
     config.scan("openprocurement.auctions.dgf.views.other")
 
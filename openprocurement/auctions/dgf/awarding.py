@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""Award status transitions.
+
+``TRANSITIONS`` maps an award's (old, new) status to an optional guard and
+the handler that applies the side effects of the change to the auction.
+Handlers look awards and contracts up through an ``AwardIndex``, so
+cascading a cancellation only touches the awards of the affected lot.
+"""
+from openprocurement.api.models import get_now
+from openprocurement.auctions.core.utils import add_next_award
+
+FINAL_COMPLAINT_STATUSES = ['invalid', 'resolved', 'declined']
+OPEN_COMPLAINT_STATUSES = ['claim', 'answered', 'pending', 'resolved']
+
+
+class AwardIndex(object):
+    """Awards of an auction by lot and its contracts by award.
+
+    Awards and contracts are only ever appended, so the index follows both
+    lists as they grow and is rebuilt if either was replaced or shrank.
+    """
+
+    def __init__(self):
+        self.lots = {}
+        self.positions = {}
+        self.contracts = {}
+        self._awards = (0, None)
+        self._contracts = (0, None)
+
+    @staticmethod
+    def _follows(items, mark):
+        size, last = mark
+        return size <= len(items) and (not size or items[size - 1] is last)
+
+    def update(self, auction):
+        if not self._follows(auction.awards, self._awards) or not self._follows(auction.contracts, self._contracts):
+            self.__init__()
+        for award in auction.awards[self._awards[0]:]:
+            lot_awards = self.lots.setdefault(award.lotID, [])
+            self.positions[award.id] = len(lot_awards)
+            lot_awards.append(award)
+        for contract in auction.contracts[self._contracts[0]:]:
+            self.contracts.setdefault(contract.awardID, []).append(contract)
+        self._awards = (len(auction.awards), auction.awards[-1] if auction.awards else None)
+        self._contracts = (len(auction.contracts), auction.contracts[-1] if auction.contracts else None)
+        return self
+
+    def lot_awards_from(self, award):
+        """Awards of ``award``'s lot, from ``award`` on."""
+        return self.lots[award.lotID][self.positions[award.id]:]
+
+    def award_contracts(self, award_id):
+        return self.contracts.get(award_id, [])
+
+
+def award_index(auction):
+    index = getattr(auction, '_award_index', None)
+    if index is None:
+        index = auction._award_index = AwardIndex()
+    return index.update(auction)
+
+
+def cancel_complaints(award, now):
+    for complaint in award.complaints:
+        if complaint.status not in FINAL_COMPLAINT_STATUSES:
+            complaint.status = 'cancelled'
+            complaint.cancellationReason = 'cancelled'
+            complaint.dateCanceled = now
+
+
+def activate_award(request, auction, award):
+    award.complaintPeriod.endDate = get_now()
+    auction.contracts.append(type(auction).contracts.model_class({
+        'awardID': award.id,
+        'suppliers': award.suppliers,
+        'value': award.value,
+        'date': get_now(),
+        'items': list(auction.lot_items(award.lotID)),
+        'contractID': '{}-{}{}'.format(auction.auctionID, request.registry.server_id, len(auction.contracts) + 1)}))
+    add_next_award(request)
+
+
+def cancel_active_award(request, auction, award):
+    now = get_now()
+    if award.complaintPeriod.endDate > now:
+        award.complaintPeriod.endDate = now
+    cancel_complaints(award, now)
+    for contract in award_index(auction).award_contracts(award.id):
+        contract.status = 'cancelled'
+    add_next_award(request)
+
+
+def disqualify_award(request, auction, award):
+    award.complaintPeriod.endDate = get_now()
+    add_next_award(request)
+
+
+def has_open_complaints(award):
+    return any([i.status in OPEN_COMPLAINT_STATUSES for i in award.complaints])
+
+
+def cancel_unsuccessful_award(request, auction, award):
+    if auction.status == 'active.awarded':
+        auction.status = 'active.qualification'
+        auction.awardPeriod.endDate = None
+    now = get_now()
+    award.complaintPeriod.endDate = now
+    index = award_index(auction)
+    for i in index.lot_awards_from(award):
+        i.complaintPeriod.endDate = now
+        i.status = 'cancelled'
+        cancel_complaints(i, now)
+        for contract in index.award_contracts(i.id):
+            contract.status = 'cancelled'
+    add_next_award(request)
+
+
+def keep_award(request, auction, award):
+    pass
+
+
+# (old status, new status): (guard, handler)
+TRANSITIONS = {
+    ('pending', 'pending'): (None, keep_award),
+    ('pending', 'active'): (None, activate_award),
+    ('pending', 'unsuccessful'): (None, disqualify_award),
+    ('active', 'cancelled'): (None, cancel_active_award),
+    ('unsuccessful', 'cancelled'): (has_open_complaints, cancel_unsuccessful_award),
+}
+
+
+def apply_award_transition(request, auction, award, award_status):
+    """Apply the side effects of ``award`` having moved from ``award_status``.
+
+    Returns False if there is no such transition for the award.
+    """
+    guard, handler = TRANSITIONS.get((award_status, award.status), (None, None))
+    if handler is None or guard is not None and not guard(award):
+        return False
+    handler(request, auction, award)
+    return True
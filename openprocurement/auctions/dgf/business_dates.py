@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+
+from openprocurement.api.utils import calculate_business_date
+
+DEFAULT_BUSINESS_CALENDAR_SIZE = 10000
+
+
+class BusinessCalendar(object):
+    """Per-process LRU of ``calculate_business_date`` results.
+
+    The result only depends on the start date, the delta, whether working
+    days are counted and the auction's acceleration mode (its
+    ``procurementMethodDetails``), which together form the key.
+    """
+
+    def __init__(self, size=DEFAULT_BUSINESS_CALENDAR_SIZE):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._dates = OrderedDict()
+
+    def calculate(self, date_obj, timedelta_obj, context=None, working_days=False):
+        details = context['procurementMethodDetails'] if context and 'procurementMethodDetails' in context else None
+        context = {'procurementMethodDetails': details} if details else None
+        if not self.size:
+            return calculate_business_date(date_obj, timedelta_obj, context, working_days)
+        key = (date_obj, timedelta_obj, working_days, details)
+        result = self._dates.pop(key, None)
+        if result is None:
+            self.misses += 1
+            result = calculate_business_date(date_obj, timedelta_obj, context, working_days)
+        else:
+            self.hits += 1
+        self._dates[key] = result
+        while len(self._dates) > self.size:
+            self._dates.popitem(last=False)
+        return result
+
+    def resize(self, size):
+        self.size = size
+        while len(self._dates) > size:
+            self._dates.popitem(last=False)
+
+    def clear(self):
+        self._dates.clear()
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'dates': len(self._dates)}
+
+
+BUSINESS_CALENDAR = BusinessCalendar()
+
+
+def business_date(date_obj, timedelta_obj, context=None, working_days=False):
+    return BUSINESS_CALENDAR.calculate(date_obj, timedelta_obj, context, working_days)
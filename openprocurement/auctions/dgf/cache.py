@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+from threading import RLock
+
+from iso8601 import parse_date
+from openprocurement.api.models import get_now
+
+DEFAULT_SERIALIZATION_CACHE_SIZE = 500
+
+
+class SerializationCache(object):
+    """Per-worker LRU of serialized auction views.
+
+    Entries are grouped by auction id and tagged with the revision and
+    ``dateModified`` they were built from, so a stored view is only reused
+    for the very same state of the document. Views that carry a
+    ``next_check`` are time dependent and expire once that moment passes.
+    The cache is shared with the worker's ``CacheWarmer`` thread.
+    """
+
+    def __init__(self, size=DEFAULT_SERIALIZATION_CACHE_SIZE):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._auctions = OrderedDict()
+        self._lock = RLock()
+
+    def _entries(self, auction):
+        state = (auction.rev, auction.dateModified)
+        with self._lock:
+            cached = self._auctions.pop(auction.id, None)
+            if cached is None or cached[0] != state:
+                cached = (state, {})
+            self._auctions[auction.id] = cached
+            while len(self._auctions) > self.size:
+                self._auctions.popitem(last=False)
+        return cached[1]
+
+    def get(self, auction, key, serialize):
+        """Return ``serialize()`` for ``auction``, reusing a stored result for ``key``.
+
+        The result is shared between requests and must not be modified.
+        """
+        if not self.size or not auction.rev:
+            return serialize()
+        entries = self._entries(auction)
+        if key in entries:
+            expires, data = entries[key]
+            if expires is None or get_now() < expires:
+                self.hits += 1
+                return data
+        self.misses += 1
+        data = serialize()
+        next_check = data.get('next_check') if isinstance(data, dict) else None
+        entries[key] = (next_check and parse_date(next_check), data)
+        return data
+
+    def invalidate(self, auction_id):
+        with self._lock:
+            self._auctions.pop(auction_id, None)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'auctions': len(self._auctions)}
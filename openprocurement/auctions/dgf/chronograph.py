@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Chronograph support: due auctions and checks of many auctions per request.
+
+Auctions due for a check are found through the ``auctions_dgf/by_next_check``
+view, which CouchDB keeps sorted by ``next_check`` as auctions are saved.
+Bulk checks read auctions with one ``_all_docs`` request, run each through
+the same ``check_status`` as a chronograph PATCH, and store the changed ones
+with a single ``_bulk_docs`` write.
+"""
+from calendar import timegm
+from logging import getLogger
+
+from couchdb.http import ResourceConflict, ResourceNotFound
+from schematics.exceptions import ModelValidationError
+from openprocurement.api.utils import context_unpack, get_revision_changes, set_modetest_titles
+from openprocurement.auctions.core.utils import check_status
+from openprocurement.auctions.dgf.design import next_check_view, sync_design
+from openprocurement.auctions.dgf.history import compact_revisions
+from openprocurement.auctions.dgf.models import DGFOtherAssets, DGFFinancialAssets
+from openprocurement.auctions.dgf.storage import STORAGE
+from openprocurement.auctions.dgf.utils import add_revision, invalidate_cached
+
+LOGGER = getLogger(__name__)
+MODELS = {
+    'dgfOtherAssets': DGFOtherAssets,
+    'dgfFinancialAssets': DGFFinancialAssets,
+}
+DEFAULT_DUE_LIMIT = 100
+
+
+def timestamp_ms(date):
+    return timegm(date.utctimetuple()) * 1000 + date.microsecond // 1000
+
+
+def due_auctions(db, before, procurementMethodType=None, limit=DEFAULT_DUE_LIMIT, offset=None):
+    """Auctions with ``next_check`` up to ``before``, earliest first.
+
+    ``offset`` is the ``next_offset`` of the previous page. Returns the page
+    as a list of dicts with ``id``, ``next_check`` and
+    ``procurementMethodType``, and the offset of the next page or None.
+    """
+    prefix = procurementMethodType or ''
+    params = {'endkey': [prefix, timestamp_ms(before)], 'limit': limit + 1}
+    if offset:
+        time, doc_id = offset.split('.', 1)
+        params.update(startkey=[prefix, int(time)], startkey_docid=doc_id)
+    else:
+        params['startkey'] = [prefix]
+    try:
+        rows = list(next_check_view(db, **params))
+    except ResourceNotFound:
+        sync_design(db)
+        rows = list(next_check_view(db, **params))
+    next_offset = '{}.{}'.format(rows[limit].key[1], rows[limit].id) if len(rows) > limit else None
+    return [
+        {'id': i.id, 'next_check': i.value[0], 'procurementMethodType': i.value[1]}
+        for i in rows[:limit]
+    ], next_offset
+
+
+def check_auction(request, doc):
+    """Run ``check_status`` on the auction stored as ``doc``.
+
+    Returns the auction if it has changes to store, otherwise None.
+    """
+    auction = MODELS[doc['procurementMethodType']](doc)
+    auction.__parent__ = request.context
+    request.validated['auction'] = auction
+    request.validated['auction_src'] = auction.serialize('plain')
+    request.validated['auction_status'] = auction.status
+    check_status(request)
+    if auction.mode == u'test':
+        set_modetest_titles(auction)
+    if add_revision(request, auction, get_revision_changes(auction.serialize('plain'), request.validated['auction_src'])):
+        compact_revisions(auction, int(request.registry.settings.get('dgf.revisions_window', 0)))
+        auction.validate()
+        return auction
+
+
+def check_auctions(request, auction_ids):
+    """Check ``auction_ids`` and store the changed auctions in one bulk write.
+
+    Returns a result per id: ``updated`` (with the new ``next_check``),
+    ``unchanged``, ``not found``, ``invalid``, ``conflict`` or ``error``.
+    """
+    results = {}
+    changed = []
+    for row in request.registry.db.view('_all_docs', keys=auction_ids, include_docs=True):
+        doc = row.doc
+        if not doc or doc.get('doc_type') != 'Auction' or doc.get('procurementMethodType') not in MODELS:
+            results[row.key] = {'result': 'not found'}
+            continue
+        try:
+            auction = check_auction(request, doc)
+        except ModelValidationError as e:
+            results[row.key] = {'result': 'invalid', 'errors': e.message}
+            continue
+        if auction is None:
+            results[row.key] = {'result': 'unchanged'}
+        else:
+            changed.append(auction)
+    if changed:
+        stored = request.registry.db.update([STORAGE.encode(i.to_primitive()) for i in changed])
+        for (success, auction_id, rev), auction in zip(stored, changed):
+            if success:
+                auction._rev = rev
+                invalidate_cached(request, auction.id)
+                results[auction.id] = {'result': 'updated', 'next_check': auction.next_check}
+            elif isinstance(rev, ResourceConflict):
+                results[auction.id] = {'result': 'conflict'}
+            else:
+                results[auction.id] = {'result': 'error', 'errors': str(rev)}
+    LOGGER.info('Checked {} auctions, updated {}'.format(len(auction_ids), len([i for i in results.values() if i['result'] == 'updated'])),
+                extra=context_unpack(request, {'MESSAGE_ID': 'auctions_chronograph_batch'}))
+    return [dict(results[i], id=i) for i in auction_ids]
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+import json
+import marshal
+import os
+import sys
+from logging import getLogger
+
+LOGGER = getLogger(__name__)
+CURRENT_DIR = os.path.dirname(os.path.realpath(__file__))
+CACHE = {'dir': None}
+_loaded = {}
+
+
+def configure_codes_cache(cache_dir):
+    """Enable the precompiled (marshal) form of the code tables in ``cache_dir``."""
+    CACHE['dir'] = cache_dir
+
+
+def _read_cache(cache_path, stamp):
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            cached_stamp, data = marshal.load(cache_file)
+    except (IOError, OSError, EOFError, ValueError, TypeError):
+        return None
+    if cached_stamp == stamp:
+        return data
+
+
+def _write_cache(cache_path, stamp, data):
+    tmp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+    try:
+        with open(tmp_path, 'wb') as cache_file:
+            marshal.dump((stamp, data), cache_file)
+        os.rename(tmp_path, cache_path)
+    except (IOError, OSError, ValueError) as e:
+        LOGGER.warning('Failed to write code table cache {}: {}'.format(cache_path, e))
+
+
+def load_json(name):
+    """Read a JSON table shipped with the package, at most once per process.
+
+    When a cache directory is configured the parsed table is also kept there
+    in marshal format, stamped with the source file's mtime and size, and
+    reused by later workers as long as the stamp still matches.
+    """
+    if name in _loaded:
+        return _loaded[name]
+    file_path = os.path.join(CURRENT_DIR, name)
+    data = None
+    cache_path = None
+    if CACHE['dir']:
+        stat = os.stat(file_path)
+        stamp = (stat.st_mtime, stat.st_size, sys.version_info[:2])
+        cache_path = os.path.join(CACHE['dir'], '{}.marshal'.format(name))
+        data = _read_cache(cache_path, stamp)
+    if data is None:
+        with open(file_path) as lang_file:
+            data = json.loads(lang_file.read())
+        if cache_path:
+            _write_cache(cache_path, stamp, data)
+    _loaded[name] = data
+    return data
+
+
+def significant_prefix(code):
+    """Hierarchy prefix of a CPV-style code: '04111000-9' -> '04111'."""
+    return code.split('-')[0].rstrip('0').ljust(2, '0')
+
+
+class CodeRegistry(list):
+    """Classification codes with constant-time lookup and a hierarchy index.
+
+    The registry is a list of codes, so it can still be given as ``choices``
+    to a schematics type, but it is filled from ``loader`` only on first use
+    and membership tests are answered from a set instead of a scan. It is
+    always true, so the ``if choices`` check of a type does not load it.
+    """
+
+    def __init__(self, loader):
+        super(CodeRegistry, self).__init__()
+        self._loader = loader
+        self._codes = None
+
+    def _load(self):
+        if self._codes is None:
+            self[:] = self._loader()
+            self._prefixes = {}
+            self._descendants = {}
+            for code in super(CodeRegistry, self).__iter__():
+                prefix = significant_prefix(code)
+                self._prefixes[prefix] = code
+                for end in range(2, len(prefix) + 1):
+                    self._descendants.setdefault(prefix[:end], []).append(code)
+            self._codes = frozenset(super(CodeRegistry, self).__iter__())
+        return self
+
+    def __contains__(self, code):
+        return code in self._load()._codes
+
+    def __iter__(self):
+        return super(CodeRegistry, self._load()).__iter__()
+
+    def __nonzero__(self):
+        return True
+    __bool__ = __nonzero__
+
+    def __len__(self):
+        return super(CodeRegistry, self._load()).__len__()
+
+    def __getitem__(self, index):
+        return super(CodeRegistry, self._load()).__getitem__(index)
+
+    def __repr__(self):
+        return super(CodeRegistry, self._load()).__repr__()
+
+    def division(self, code):
+        return code[:2]
+
+    def group(self, code):
+        return code[:3]
+
+    def parent(self, code):
+        """Closest registered ancestor of ``code`` or None for a division."""
+        prefix = significant_prefix(code)
+        for end in range(len(prefix) - 1, 1, -1):
+            if prefix[:end] in self._load()._prefixes:
+                return self._prefixes[prefix[:end]]
+
+    def descendants(self, code):
+        """Registered codes below ``code`` in the hierarchy, itself included."""
+        return tuple(self._load()._descendants.get(significant_prefix(code), ()))
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Resolution of CouchDB revision conflicts on auction saves.
+
+When a save loses the race for a revision, the changes the request made
+(a JSON patch from ``auction_src`` to the state being saved) are replayed
+on a fresh copy of the document. Appending to a list, like a new bid or a
+document version, commutes with concurrent writes and is always replayed
+at the end of the current list. Any other change is replayed only if the
+value it touches is still the one the request started from; otherwise the
+conflict is real and is reported to the client.
+"""
+from jsonpatch import JsonPatchException, make_patch, apply_patch as apply_json_patch
+from jsonpointer import resolve_pointer
+
+DEFAULT_CONFLICT_RETRIES = 3
+# Counters allocated from again after a merge instead of being replayed.
+REALLOCATED_FIELDS = ['complaintSequence']
+MISSING = object()
+
+
+class ConflictStats(object):
+    """Per-worker counters of saves, revision conflicts and their outcome."""
+
+    def __init__(self):
+        self.saves = 0
+        self.conflicts = 0
+        self.retries = 0
+        self.merged = 0
+        self.failed = 0
+
+    @property
+    def conflict_rate(self):
+        return float(self.conflicts) / self.saves if self.saves else 0.0
+
+    def as_dict(self):
+        return {
+            'saves': self.saves,
+            'conflicts': self.conflicts,
+            'retries': self.retries,
+            'merged': self.merged,
+            'failed': self.failed,
+            'conflict_rate': self.conflict_rate,
+        }
+
+
+STATS = ConflictStats()
+
+
+def split_pointer(path):
+    return [i.replace('~1', '/').replace('~0', '~') for i in path.split('/')[1:]]
+
+
+def join_pointer(tokens):
+    return ''.join(['/' + i.replace('~', '~0').replace('/', '~1') for i in tokens])
+
+
+def same_target(src, fresh, tokens):
+    """Check that ``tokens`` lead to the same objects in both documents.
+
+    List positions are only trusted when the elements found there carry the
+    same ``id``, so an index shifted by a concurrent removal is detected.
+    """
+    for token in tokens:
+        if isinstance(src, list):
+            if not token.isdigit() or not isinstance(fresh, list):
+                return False
+            index = int(token)
+            if index >= len(src) or index >= len(fresh):
+                return False
+            src, fresh = src[index], fresh[index]
+            if isinstance(src, dict) and src.get('id') != (fresh.get('id') if isinstance(fresh, dict) else None):
+                return False
+        elif isinstance(src, dict):
+            if not isinstance(fresh, dict) or token not in src or token not in fresh:
+                return False
+            src, fresh = src[token], fresh[token]
+        else:
+            return False
+    return True
+
+
+def rebase_operations(src, dst, fresh, skip=()):
+    """Translate the changes ``src`` -> ``dst`` to apply on top of ``fresh``.
+
+    Returns the list of JSON patch operations or None if some change
+    overlaps with a concurrent one.
+    """
+    operations = []
+    for operation in make_patch(src, dst).patch:
+        tokens = split_pointer(operation['path'])
+        if tokens[0] in skip:
+            continue
+        if operation['op'] not in ('add', 'remove', 'replace'):
+            return None
+        parent = tokens[:-1]
+        if not same_target(src, fresh, parent):
+            return None
+        src_parent = resolve_pointer(src, join_pointer(parent))
+        fresh_parent = resolve_pointer(fresh, join_pointer(parent))
+        key = tokens[-1]
+        if operation['op'] == 'add' and isinstance(src_parent, list):
+            if key == '-' or key.isdigit() and int(key) >= len(src_parent):
+                operation = dict(operation, path=join_pointer(parent + ['-']))
+            elif src_parent != fresh_parent:
+                return None
+        elif operation['op'] == 'add':
+            if key in fresh_parent and fresh_parent[key] != src_parent.get(key, MISSING):
+                return None
+        elif not same_target(src, fresh, tokens) or \
+                resolve_pointer(src, operation['path']) != resolve_pointer(fresh, operation['path']):
+            return None
+        operations.append(operation)
+    return operations
+
+
+def merge_conflict(request, auction, dst):
+    """Rebuild ``auction`` from the current document with this request's changes replayed.
+
+    ``dst`` is the plain serialization the request tried to save. Returns
+    the merged auction and its fresh plain source, or None on a real conflict.
+    """
+    model = type(auction)
+    fresh_doc = request.registry.db.get(auction.id)
+    if fresh_doc is None:
+        return None
+    merged = model(fresh_doc)
+    fresh_src = merged.serialize('plain')
+    computed = [i for i in model._serializables if i not in model._fields]
+    operations = rebase_operations(request.validated['auction_src'], dst, fresh_src, skip=computed + REALLOCATED_FIELDS)
+    if operations is None:
+        return None
+    try:
+        data = apply_json_patch(fresh_src, operations)
+    except JsonPatchException:
+        return None
+    merged.import_data(data)
+    merged.__parent__ = auction.__parent__
+    merged.modified = getattr(auction, 'modified', True)
+    return merged, fresh_src
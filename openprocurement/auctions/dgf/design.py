@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+from couchdb.design import ViewDefinition
+
+
+DESIGN_ID = '_design/auctions_dgf'
+CHANGES_FILTER = 'auctions_dgf/changes'
+
+
+def sync_design(db):
+    views = [j for i, j in globals().items() if "_view" in i]
+    ViewDefinition.sync_many(db, views)
+    sync_filters(db)
+
+
+def sync_filters(db):
+    doc = db.get(DESIGN_ID, {'_id': DESIGN_ID})
+    if doc.get('filters') != FILTERS:
+        doc['filters'] = FILTERS
+        db.save(doc)
+
+
+# Keys are [procurementMethodType, next_check in ms since epoch (UTC)]; every
+# auction is emitted a second time under '' to query all dgf types at once.
+next_check_view = ViewDefinition('auctions_dgf', 'by_next_check', '''function(doc) {
+    if(doc.doc_type == 'Auction' && doc.next_check && (doc.procurementMethodType == 'dgfOtherAssets' || doc.procurementMethodType == 'dgfFinancialAssets')) {
+        var m = doc.next_check.match(/^(\\d{4})-(\\d{2})-(\\d{2})T(\\d{2}):(\\d{2}):(\\d{2})(\\.\\d+)?(Z|([+-])(\\d{2}):(\\d{2}))?$/);
+        if(m) {
+            var time = Date.UTC(+m[1], m[2] - 1, +m[3], +m[4], +m[5], +m[6], m[7] ? Math.floor(parseFloat(m[7]) * 1000) : 0);
+            if(m[9]) {
+                time -= (m[9] == '-' ? -1 : 1) * (m[10] * 60 + +m[11]) * 60000;
+            }
+            emit([doc.procurementMethodType, time], [doc.next_check, doc.procurementMethodType]);
+            emit(['', time], [doc.next_check, doc.procurementMethodType]);
+        }
+    }
+}''')
+
+
+# Changes of dgf auctions, and deletions, which carry no doc_type.
+FILTERS = {
+    'changes': '''function(doc, req) {
+    return doc._deleted || (doc.doc_type == 'Auction' && (doc.procurementMethodType == 'dgfOtherAssets' || doc.procurementMethodType == 'dgfFinancialAssets'));
+}''',
+}
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+
+class DocumentIndex(object):
+    """Versions of a container's documents grouped by document id.
+
+    Versions of a document share its id and are appended to the container's
+    ``documents``; the last one appended is the current version. The index
+    follows the list as it grows and only indexes new items, and is rebuilt
+    if the list was replaced or shrank.
+    """
+
+    def __init__(self):
+        self.size = 0
+        self.last = None
+        self.versions = {}
+        self.latest = {}
+
+    def update(self, documents):
+        if self.size > len(documents) or self.size and documents[self.size - 1] is not self.last:
+            self.__init__()
+        for document in documents[self.size:]:
+            self.versions.setdefault(document.id, []).append(document)
+            self.latest[document.id] = document
+        self.size = len(documents)
+        self.last = documents[-1] if documents else None
+        return self
+
+    def current(self):
+        """Current versions ordered by dateModified."""
+        return sorted(self.latest.values(), key=lambda i: i.dateModified)
+
+
+def document_index(container):
+    index = getattr(container, '_document_index', None)
+    if index is None:
+        index = container._document_index = DocumentIndex()
+    return index.update(container.documents)
+
+
+def paginate(request, items):
+    """Slice ``items`` by the ``offset`` and ``limit`` query parameters.
+
+    Returns None and sets a 422 error if either is not a non-negative integer.
+    """
+    bounds = {}
+    for name in ('offset', 'limit'):
+        value = request.params.get(name, '')
+        if not value:
+            continue
+        if not value.isdigit():
+            request.errors.add('querystring', name, 'Should be a non-negative integer')
+            request.errors.status = 422
+            return
+        bounds[name] = int(value)
+    offset = bounds.get('offset', 0)
+    if 'limit' in bounds:
+        return items[offset:offset + bounds['limit']]
+    return items[offset:]
+
+
+def documents_collection(request, container):
+    """Serialized documents of ``container`` for a collection GET.
+
+    With ``?all`` every version is listed in upload order, otherwise only the
+    current version of each document; both support ``?offset``/``?limit``.
+    """
+    if request.params.get('all', ''):
+        documents = container.documents
+    else:
+        documents = document_index(container).current()
+    page = paginate(request, documents)
+    if page is None:
+        return
+    return {'data': [i.serialize("view") for i in page]}
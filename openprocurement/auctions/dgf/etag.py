@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Strong ETags and conditional GETs for dgf auction resources.
+
+An ETag is minted from the auction revision, the requested path with its
+query, the authenticated user and the moment the representation stops being
+valid (the auction's ``next_check``), and carries that moment in clear so a
+later ``If-None-Match`` can be answered from a HEAD on the stored document,
+before the auction is loaded and deserialized.
+"""
+import re
+from calendar import timegm
+from hashlib import sha1
+from logging import getLogger
+
+from couchdb.http import HTTPError
+from iso8601 import parse_date
+from pyramid.httpexceptions import HTTPNotModified
+from openprocurement.api.models import get_now
+
+LOGGER = getLogger(__name__)
+AUCTION_PATH = re.compile(r'/auctions/(\w+)')
+DGF_TYPES = ('dgfOtherAssets', 'dgfFinancialAssets')
+
+
+def timestamp(date):
+    return timegm(date.utctimetuple())
+
+
+def compute_etag(request, rev, expires):
+    key = u'\0'.join([rev, request.path_qs, request.authenticated_userid or u'', str(expires)])
+    return '{}-{}'.format(sha1(key.encode('utf-8')).hexdigest(), expires)
+
+
+def parse_if_none_match(request):
+    header = request.headers.get('If-None-Match', '')
+    etags = [i.strip() for i in header.split(',') if i.strip()]
+    return [(i[2:] if i.startswith('W/') else i).strip('"') for i in etags]
+
+
+def auction_etag(request, auction):
+    next_check = auction.next_check
+    return compute_etag(request, auction.rev, timestamp(parse_date(next_check)) if next_check else 0)
+
+
+def set_etag(event):
+    """NewResponse subscriber: tag successful GETs of dgf auction resources."""
+    request, response = event.request, event.response
+    if request.method != 'GET' or response.status_int != 200 or 'download' in request.params:
+        return
+    auction = getattr(request, 'validated', {}).get('auction')
+    if auction is None or auction.procurementMethodType not in DGF_TYPES or not auction.rev:
+        return
+    response.etag = auction_etag(request, auction)
+    response.conditional_response = True
+
+
+def conditional_get_tween_factory(handler, registry):
+    """Answer 304 for a still valid dgf ETag without loading the auction."""
+    def conditional_get_tween(request):
+        if request.method != 'GET' or 'If-None-Match' not in request.headers or 'download' in request.params:
+            return handler(request)
+        match = AUCTION_PATH.search(request.path)
+        etags = [i for i in parse_if_none_match(request) if '-' in i]
+        if not match or not etags:
+            return handler(request)
+        try:
+            status, headers, body = registry.db.resource(match.group(1)).head()
+        except HTTPError:
+            return handler(request)
+        rev = headers.get('ETag', '').strip('"')
+        now = timestamp(get_now())
+        for etag in etags:
+            expires = etag.rsplit('-', 1)[1]
+            if not expires.isdigit() or (int(expires) and int(expires) <= now):
+                continue
+            if etag == compute_etag(request, rev, int(expires)):
+                response = HTTPNotModified()
+                response.etag = etag
+                return response
+        return handler(request)
+    return conditional_get_tween
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""Columnar snapshots of dgf auctions for analytics.
+
+Auctions are read from CouchDB in batches, serialized with the role of
+their status (the data the public API returns for them) and flattened into
+the tables of ``TABLES``. Every table is written in chunks of at most
+``chunk_size`` rows, one file per column and chunk, so memory use depends on
+the chunk size and not on the number of auctions.
+
+Column files are little-endian arrays that ``numpy.fromfile`` reads as is:
+
+* ``float`` - float64, NaN when missing;
+* ``int`` - int64, -2**63 when missing;
+* ``datetime`` - int64 milliseconds since the epoch (UTC), -2**63 when
+  missing, which is NaT for ``datetime64[ms]``;
+* ``category`` - int32 codes into the chunk's dictionary in the manifest,
+  -1 when missing;
+* ``string`` - UTF-8 data in ``<column>.bin`` and int64 offsets (one more
+  than rows) in ``<column>.offsets``; missing values are empty.
+
+``manifest.json`` lists the tables, their columns and chunks.
+"""
+import argparse
+import json
+import os
+import sys
+from array import array
+from logging import getLogger
+
+from couchdb import Server
+from iso8601 import parse_date
+from openprocurement.auctions.dgf.chronograph import MODELS, timestamp_ms
+
+LOGGER = getLogger(__name__)
+FORMAT_VERSION = 1
+BATCH_SIZE = 2 ** 10
+DEFAULT_CHUNK_SIZE = 2 ** 16
+MISSING_INT = -2 ** 63
+
+
+def int64_typecode():
+    """The ``array`` typecode of 64-bit integers: ``q`` is missing from Python 2."""
+    for typecode in ('q', 'l'):
+        try:
+            if array(typecode).itemsize == 8:
+                return typecode
+        except ValueError:
+            continue
+    raise ImportError('No 64-bit integer array type on this platform')
+
+
+INT64 = int64_typecode()
+TABLES = [
+    ('auctions', None, [
+        ('id', 'string'),
+        ('auctionID', 'string'),
+        ('procurementMethodType', 'category'),
+        ('status', 'category'),
+        ('value.amount', 'float'),
+        ('value.currency', 'category'),
+        ('minimalStep.amount', 'float'),
+        ('guarantee.amount', 'float'),
+        ('numberOfBids', 'int'),
+        ('date', 'datetime'),
+        ('dateModified', 'datetime'),
+        ('tenderPeriod.startDate', 'datetime'),
+        ('tenderPeriod.endDate', 'datetime'),
+        ('auctionPeriod.startDate', 'datetime'),
+        ('auctionPeriod.endDate', 'datetime'),
+        ('procuringEntity.identifier.id', 'string'),
+    ]),
+    ('items', 'items', [
+        ('id', 'string'),
+        ('classification.id', 'category'),
+        ('quantity', 'int'),
+        ('unit.code', 'category'),
+        ('deliveryAddress.region', 'category'),
+    ]),
+    ('bids', 'bids', [
+        ('id', 'string'),
+        ('status', 'category'),
+        ('value.amount', 'float'),
+        ('date', 'datetime'),
+    ]),
+    ('awards', 'awards', [
+        ('id', 'string'),
+        ('bid_id', 'string'),
+        ('status', 'category'),
+        ('value.amount', 'float'),
+        ('date', 'datetime'),
+        ('complaintPeriod.endDate', 'datetime'),
+    ]),
+    ('contracts', 'contracts', [
+        ('id', 'string'),
+        ('awardID', 'string'),
+        ('status', 'category'),
+        ('value.amount', 'float'),
+        ('dateSigned', 'datetime'),
+    ]),
+]
+
+
+def get_path(data, path):
+    for name in path.split('.'):
+        if not isinstance(data, dict):
+            return
+        data = data.get(name)
+    return data
+
+
+class Column(object):
+
+    def __init__(self, name, kind):
+        self.name = name
+        self.kind = kind
+        self.reset()
+
+    def reset(self):
+        if self.kind == 'float':
+            self.values = array('d')
+        elif self.kind == 'string':
+            self.values = array(INT64, [0])
+            self.data = []
+            self.size = 0
+        else:
+            self.values = array('i' if self.kind == 'category' else INT64)
+        self.dictionary = {}
+
+    def append(self, value):
+        if self.kind == 'float':
+            self.values.append(float('nan') if value is None else float(value))
+        elif self.kind == 'int':
+            self.values.append(MISSING_INT if value is None else int(value))
+        elif self.kind == 'datetime':
+            self.values.append(MISSING_INT if value is None else timestamp_ms(parse_date(value)))
+        elif self.kind == 'category':
+            self.values.append(-1 if value is None else self.dictionary.setdefault(value, len(self.dictionary)))
+        else:
+            value = value.encode('utf-8') if value else b''
+            self.data.append(value)
+            self.size += len(value)
+            self.values.append(self.size)
+
+    def write(self, path):
+        values = self.values
+        if sys.byteorder == 'big':
+            values = array(values.typecode, values)
+            values.byteswap()
+        with open(os.path.join(path, self.name + ('.offsets' if self.kind == 'string' else '.bin')), 'wb') as f:
+            values.tofile(f)
+        if self.kind == 'string':
+            with open(os.path.join(path, self.name + '.bin'), 'wb') as f:
+                f.write(b''.join(self.data))
+        if self.kind == 'category':
+            return [value for value, code in sorted(self.dictionary.items(), key=lambda i: i[1])]
+
+
+class TableWriter(object):
+    """Buffers rows of one table and writes them out chunk by chunk."""
+
+    def __init__(self, path, name, columns, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.path = os.path.join(path, name)
+        self.name = name
+        self.columns = [Column(i, kind) for i, kind in columns]
+        self.chunk_size = chunk_size
+        self.chunks = []
+        self.rows = 0
+
+    def append(self, row):
+        for column in self.columns:
+            column.append(get_path(row, column.name))
+        self.rows += 1
+        if self.rows >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+        path = os.path.join(self.path, '{:06d}'.format(len(self.chunks)))
+        os.makedirs(path)
+        dictionaries = {}
+        for column in self.columns:
+            dictionary = column.write(path)
+            if dictionary is not None:
+                dictionaries[column.name] = dictionary
+            column.reset()
+        self.chunks.append({'rows': self.rows, 'dictionaries': dictionaries})
+        self.rows = 0
+
+    def manifest(self):
+        return {
+            'columns': [[i.name, i.kind] for i in self.columns],
+            'chunks': self.chunks,
+        }
+
+
+def public_auctions(db, batch_size=BATCH_SIZE):
+    """Public data of the dgf auctions in ``db``, one auction at a time."""
+    for row in db.iterview('_all_docs', batch_size, include_docs=True):
+        doc = row.doc
+        if doc.get('doc_type') != 'Auction' or doc.get('procurementMethodType') not in MODELS:
+            continue
+        auction = MODELS[doc['procurementMethodType']](doc)
+        yield auction.serialize(auction.status)
+
+
+def export_auctions(auctions, path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Write ``auctions`` (public auction data) as a columnar snapshot to ``path``.
+
+    Returns the number of auctions written.
+    """
+    writers = []
+    for name, field, columns in TABLES:
+        if field is not None:
+            columns = [('auction_id', 'string')] + columns
+        writers.append((field, TableWriter(path, name, columns, chunk_size)))
+    count = 0
+    for auction in auctions:
+        for field, writer in writers:
+            if field is None:
+                writer.append(auction)
+                continue
+            for row in auction.get(field, []):
+                writer.append(dict(row, auction_id=auction['id']))
+        count += 1
+    for field, writer in writers:
+        writer.flush()
+    manifest = {
+        'format': FORMAT_VERSION,
+        'byteorder': 'little',
+        'auctions': count,
+        'tables': dict([(writer.name, writer.manifest()) for field, writer in writers]),
+    }
+    with open(os.path.join(path, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return count
+
+
+def read_column(path, table, column):
+    """Values of a column, chunk by chunk, as decoded Python lists."""
+    with open(os.path.join(path, 'manifest.json')) as f:
+        manifest = json.load(f)
+    kind = dict(manifest['tables'][table]['columns'])[column]
+    for number, chunk in enumerate(manifest['tables'][table]['chunks']):
+        base = os.path.join(path, table, '{:06d}'.format(number), column)
+        values = array({'float': 'd', 'category': 'i'}.get(kind, INT64))
+        with open(base + ('.offsets' if kind == 'string' else '.bin'), 'rb') as f:
+            values.fromfile(f, chunk['rows'] + 1 if kind == 'string' else chunk['rows'])
+        if sys.byteorder == 'big':
+            values.byteswap()
+        if kind == 'string':
+            with open(base + '.bin', 'rb') as f:
+                data = f.read()
+            yield [data[values[i]:values[i + 1]].decode('utf-8') for i in range(chunk['rows'])]
+        elif kind == 'category':
+            dictionary = chunk['dictionaries'][column]
+            yield [dictionary[i] if i >= 0 else None for i in values]
+        elif kind == 'float':
+            yield [None if i != i else i for i in values]
+        else:
+            yield [None if i == MISSING_INT else i for i in values]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export dgf auctions as a columnar snapshot.')
+    parser.add_argument('couchdb_url')
+    parser.add_argument('db_name')
+    parser.add_argument('path', help='output directory, created if missing')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+    if not os.path.isdir(args.path):
+        os.makedirs(args.path)
+    db = Server(args.couchdb_url)[args.db_name]
+    count = export_auctions(public_auctions(db), args.path, args.chunk_size)
+    LOGGER.info('Exported {} auctions to {}'.format(count, args.path), extra={'MESSAGE_ID': 'dgf_export'})
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+import os
+from hashlib import md5
+from logging import getLogger
+from urllib import quote
+
+from couchdb.http import ResourceConflict, ResourceNotFound
+from rfc6266 import build_header
+from openprocurement.api.utils import error_handler, generate_id, get_filename, update_logging_context
+
+LOGGER = getLogger(__name__)
+BLOCK_SIZE = 64 * 1024
+DEFAULT_MAX_UPLOAD_SIZE = 0  # no limit
+
+
+class AttachmentIter(object):
+    """Chunked iterator over a CouchDB attachment.
+
+    The attachment is read ``block_size`` bytes at a time, so the worker
+    never holds more than one block. Byte ranges (webob calls
+    ``app_iter_range`` for conditional responses) are requested from
+    CouchDB with a Range header; if the server answers with the whole
+    attachment the unwanted bytes are skipped while streaming.
+    """
+
+    def __init__(self, db, doc_id, filename, block_size=BLOCK_SIZE):
+        self.resource = db.resource(doc_id, filename)
+        self.block_size = block_size
+
+    def __iter__(self):
+        status, headers, body = self.resource.get()
+        return self._read(body)
+
+    def app_iter_range(self, start, stop):
+        headers = {'Range': 'bytes={}-{}'.format(start, '' if stop is None else stop - 1)}
+        status, response_headers, body = self.resource.get(headers=headers)
+        if status == 206:
+            return self._read(body)
+        return self._read(body, start, stop)
+
+    def _read(self, body, start=0, stop=None):
+        position = 0
+        try:
+            while stop is None or position < stop:
+                size = self.block_size if stop is None else min(self.block_size, stop - position)
+                chunk = body.read(size)
+                if not chunk:
+                    break
+                if position + len(chunk) > start:
+                    yield chunk[max(start - position, 0):]
+                position += len(chunk)
+        finally:
+            body.close()
+
+
+def stream_attachment(request, auction, document, filename):
+    response = request.response
+    response.content_type = document.format.encode('utf-8')
+    response.content_disposition = build_header(document.title, filename_compat=quote(document.title.encode('utf-8')))
+    response.app_iter = AttachmentIter(request.registry.db, auction.id, filename)
+    response.content_length = auction._attachments[filename]['length']
+    response.headers['Accept-Ranges'] = 'bytes'
+    response.conditional_response = True
+    return response
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+class HashingReader(object):
+    """File-like wrapper that hashes and counts the bytes read through it.
+
+    Reading past ``limit`` bytes (if set) raises ``UploadTooLarge``.
+    """
+
+    def __init__(self, fileobj, block_size=BLOCK_SIZE, limit=0):
+        self.fileobj = fileobj
+        self.block_size = block_size
+        self.limit = limit
+        self.md5 = md5()
+        self.size = 0
+
+    def read(self, size=-1):
+        chunk = self.fileobj.read(self.block_size if size is None or size < 0 else min(size, self.block_size))
+        self.md5.update(chunk)
+        self.size += len(chunk)
+        if self.limit and self.size > self.limit:
+            raise UploadTooLarge(self.size)
+        return chunk
+
+    @property
+    def hash(self):
+        return 'md5:' + self.md5.hexdigest()
+
+
+def max_upload_size(request):
+    return int(request.registry.settings.get('dgf.max_upload_size', DEFAULT_MAX_UPLOAD_SIZE))
+
+
+def upload_too_large(request, size, location='body', name='file'):
+    limit = max_upload_size(request)
+    if limit and size is not None and size > limit:
+        request.errors.add(location, name, 'File size exceeds the limit of {} bytes'.format(limit))
+        request.errors.status = 413
+        return True
+
+
+def file_size(in_file):
+    try:
+        return os.fstat(in_file.fileno()).st_size
+    except (AttributeError, IOError, OSError, ValueError):
+        pass
+    try:
+        position = in_file.tell()
+        in_file.seek(0, os.SEEK_END)
+        size = in_file.tell() - position
+        in_file.seek(position)
+        return size
+    except (AttributeError, IOError, OSError, ValueError):
+        return None
+
+
+def stream_upload(request, first_document, blacklisted_fields):
+    """Store an uploaded file as an auction attachment without buffering it.
+
+    The content is sent to CouchDB block by block straight from the upload
+    (multipart parts are already spooled to disk by webob) and hashed on the
+    way; the upload fails with 413 once more than ``dgf.max_upload_size``
+    bytes were read, whatever size the request announced. The auction document only gets a stub for the new attachment, so
+    the following ``save_auction`` does not carry the file again. Until that
+    save succeeds the attachment is listed in ``request.validated['uploads']``
+    and it is deleted when the request ends (see ``discard_uploads``).
+    """
+    if request.content_type == 'multipart/form-data':
+        data = request.validated['file']
+        filename = get_filename(data)
+        content_type = data.type
+        in_file = data.file
+    else:
+        filename = first_document.title
+        content_type = request.content_type
+        in_file = request.body_file
+    if hasattr(request.context, "documents"):
+        # upload new document
+        model = type(request.context).documents.model_class
+    else:
+        # update document
+        model = type(request.context)
+    document = model({'title': filename, 'format': content_type})
+    document.__parent__ = request.context
+    if 'document_id' in request.validated:
+        document.id = request.validated['document_id']
+    if first_document:
+        for attr_name in type(first_document)._fields:
+            if attr_name not in blacklisted_fields:
+                setattr(document, attr_name, getattr(first_document, attr_name))
+    key = generate_id()
+    document_route = request.matched_route.name.replace("collection_", "")
+    document_path = request.current_route_path(_route_name=document_route, document_id=document.id, _query={'download': key})
+    document.url = '/' + '/'.join(document_path.split('/')[3:])
+    auction = request.validated['auction']
+    attachment = "{}_{}".format(document.id, key)
+    reader = HashingReader(in_file, limit=max_upload_size(request))
+    doc = {'_id': auction.id, '_rev': auction.rev}
+    try:
+        request.registry.db.put_attachment(doc, reader, attachment, document.format)
+    except ResourceConflict as e:
+        request.errors.add('body', 'data', str(e))
+        request.errors.status = 409
+        raise error_handler(request.errors)
+    except UploadTooLarge as e:
+        upload_too_large(request, e.args[0])
+        raise error_handler(request.errors)
+    auction._rev = doc['_rev']
+    if auction._attachments is None:
+        auction._attachments = {}
+    auction._attachments[attachment] = {'stub': True, 'content_type': document.format, 'length': reader.size}
+    if 'uploads' not in request.validated:
+        request.validated['uploads'] = []
+        request.add_finished_callback(discard_uploads)
+    request.validated['uploads'].append((auction.id, attachment))
+    document.hash = reader.hash
+    update_logging_context(request, {'file_size': reader.size, 'file_hash': reader.hash})
+    return document
+
+
+def discard_uploads(request):
+    """Delete the attachments streamed by ``request`` that no save took up.
+
+    ``save_auction`` clears ``request.validated['uploads']`` once the auction
+    is stored with them; whatever is left belongs to a failed request.
+    """
+    uploads = request.validated.pop('uploads', None)
+    if not uploads:
+        return
+    db = request.registry.db
+    for doc_id, attachment in uploads:
+        try:
+            doc = db.get(doc_id)
+            if doc is not None and attachment in doc.get('_attachments', {}):
+                db.delete_attachment(doc, attachment)
+        except (ResourceConflict, ResourceNotFound) as e:
+            LOGGER.warning('Failed to delete attachment {} of auction {}: {}'.format(attachment, doc_id, e))
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Archived revisions and historic states of auctions.
+
+With ``dgf.revisions_window`` set, a save that leaves an auction with twice
+that many revisions moves all but the last ``window`` of them into a gzipped
+JSON attachment of the auction, ``revisions-<first>-<last>.json.gz`` (0-based
+revision numbers). CouchDB returns attachments as stubs, so the archived
+revisions no longer travel with every read and write of the document.
+
+``load_revisions`` puts the archived and inline revisions back together and
+``historic_auction`` rebuilds the auction as it was saved by any of them, by
+applying the revision changes backwards from the current state.
+"""
+import json
+import re
+import zlib
+from base64 import b64encode
+from copy import deepcopy
+
+from jsonpatch import apply_patch as apply_json_patch
+
+ARCHIVE = re.compile(r'^revisions-(\d{8})-(\d{8})\.json\.gz$')
+CONTENT_TYPE = 'application/gzip'
+GZIP = 16 + zlib.MAX_WBITS
+
+
+def archive_name(first, last):
+    return 'revisions-{:08d}-{:08d}.json.gz'.format(first, last)
+
+
+def archived_chunks(auction):
+    """``(first, last, name)`` of the revision archives of ``auction``, oldest first."""
+    chunks = []
+    for name in auction._attachments or {}:
+        match = ARCHIVE.match(name)
+        if match:
+            chunks.append((int(match.group(1)), int(match.group(2)), name))
+    return sorted(chunks)
+
+
+def encode_chunk(revisions):
+    compressor = zlib.compressobj(9, zlib.DEFLATED, GZIP)
+    data = json.dumps(revisions, separators=(',', ':')).encode('utf-8')
+    return compressor.compress(data) + compressor.flush()
+
+
+def decode_chunk(data):
+    return json.loads(zlib.decompress(data, GZIP).decode('utf-8'))
+
+
+def compact_revisions(auction, window):
+    """Archive all but the last ``window`` revisions once ``auction`` has ``2 * window``.
+
+    Returns the number of revisions archived.
+    """
+    if not window or len(auction.revisions) < 2 * window:
+        return 0
+    chunks = archived_chunks(auction)
+    first = chunks[-1][1] + 1 if chunks else 0
+    archived = auction.revisions[:-window]
+    if auction._attachments is None:
+        auction._attachments = {}
+    auction._attachments[archive_name(first, first + len(archived) - 1)] = {
+        'content_type': CONTENT_TYPE,
+        'data': b64encode(encode_chunk([i.serialize() for i in archived])).decode('ascii'),
+    }
+    auction.revisions = auction.revisions[-window:]
+    return len(archived)
+
+
+def load_revisions(db, auction):
+    """All revisions of ``auction`` as stored dicts: the archived ones, then those inline."""
+    revisions = []
+    for first, last, name in archived_chunks(auction):
+        attachment = db.get_attachment(auction.id, name)
+        if attachment is None:
+            raise KeyError(name)
+        revisions.extend(decode_chunk(attachment.read()))
+    revisions.extend(i.serialize() for i in auction.revisions)
+    return revisions
+
+
+def historic_state(src, revisions, number):
+    """The plain state saved by revision ``number`` (1-based).
+
+    ``src`` is the current plain state and ``revisions`` all revisions that
+    led to it; the changes of the later revisions are undone newest first.
+    """
+    state = deepcopy(src)
+    for revision in reversed(revisions[number:]):
+        state = apply_json_patch(state, revision['changes'], in_place=True)
+    return state
+
+
+def historic_auction(auction, src, revisions, number):
+    """``auction`` as it was saved by revision ``number``, as a model of the same type."""
+    state = historic_state(src, revisions, number)
+    state['dateModified'] = revisions[number - 1]['date']
+    historic = type(auction)(state)
+    historic.__parent__ = auction.__parent__
+    return historic
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Lazy conversion of the large lists of stored auctions.
+
+An auction built from a stored document (raw data with a ``_rev``) keeps
+the ``LAZY_FIELDS`` it has as raw lists and converts each of them into
+models on first access, so a request that only reads a lot or one award
+does not build every bid, document and contract of the auction. Data that
+is not stored yet, such as a POST or a PATCH, is converted at once and
+reports conversion errors as before.
+"""
+from schematics.models import FieldDescriptor
+
+LAZY_FIELDS = ('awards', 'bids', 'complaints', 'contracts', 'documents')
+
+
+class Pending(object):
+    """Raw value of a lazy field that has not been converted yet."""
+
+    def __init__(self, field, raw):
+        self.field = field
+        self.raw = raw
+
+    def convert(self):
+        return self.field.to_native(self.raw)
+
+
+class LazyFieldDescriptor(FieldDescriptor):
+
+    def __get__(self, instance, cls):
+        if instance is None:
+            return cls._fields[self.name]
+        try:
+            value = instance._data[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+        if isinstance(value, Pending):
+            value = instance._data[self.name] = value.convert()
+        return value
+
+
+def lazy_fields(cls):
+    """Class decorator making the ``LAZY_FIELDS`` of ``cls`` lazy.
+
+    Schematics gives every model class its own field descriptors, so
+    subclasses need the decorator too.
+    """
+    for name in LAZY_FIELDS:
+        if name in cls._fields:
+            setattr(cls, name, LazyFieldDescriptor(name))
+    return cls
+
+
+def defer(cls, raw_data):
+    """Split stored ``raw_data`` into data to convert now and ``Pending`` values."""
+    if not isinstance(raw_data, dict) or not raw_data.get('_rev'):
+        return raw_data, {}
+    raw_data = dict(raw_data)
+    pending = {}
+    for name in LAZY_FIELDS:
+        field = cls._fields.get(name)
+        if field is not None and not field.serialized_name and raw_data.get(name) is not None:
+            pending[name] = Pending(field, raw_data.pop(name))
+    return raw_data, pending
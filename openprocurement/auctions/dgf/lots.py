@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+# map name: (auction list, key attribute, grouped)
+LOT_MAPS = {
+    'lots': ('lots', 'id', False),
+    'awards': ('awards', 'id', False),
+    'lot_items': ('items', 'relatedLot', True),
+    'lot_complaints': ('complaints', 'relatedLot', True),
+}
+
+
+class LotIndex(object):
+    """Lookup maps of an auction's lots and of its lists keyed by lot.
+
+    A map is built on first use and rebuilt once its source list is replaced
+    or its length or last element changes. Changes that move an element to
+    another lot in place have to drop the index with
+    ``Auction.invalidate_lot_index``. Awards by lot are kept by the
+    ``AwardIndex`` of ``awarding``.
+    """
+
+    def __init__(self):
+        self._maps = {}
+
+    def get(self, auction, name):
+        attr, key, grouped = LOT_MAPS[name]
+        items = getattr(auction, attr)
+        mark = (len(items or ()), items[-1] if items else None)
+        cached = self._maps.get(name)
+        if cached is not None and cached[0] is items and cached[1] == mark[0] and cached[2] is mark[1]:
+            return cached[3]
+        if grouped:
+            lookup = {}
+            for i in items or ():
+                lookup.setdefault(getattr(i, key), []).append(i)
+        else:
+            lookup = dict([(getattr(i, key), i) for i in items or ()])
+        self._maps[name] = (items, mark[0], mark[1], lookup)
+        return lookup
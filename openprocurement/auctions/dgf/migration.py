@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import logging
+
+LOGGER = logging.getLogger(__name__)
+SCHEMA_VERSION = 1
+SCHEMA_DOC = 'openprocurement_auctions_dgf_schema'
+DGF_TYPES = ('dgfOtherAssets', 'dgfFinancialAssets')
+BATCH_SIZE = 2 ** 10
+
+
+def get_db_schema_version(db):
+    schema_doc = db.get(SCHEMA_DOC, {"_id": SCHEMA_DOC})
+    return schema_doc.get("version", SCHEMA_VERSION - 1)
+
+
+def set_db_schema_version(db, version):
+    schema_doc = db.get(SCHEMA_DOC, {"_id": SCHEMA_DOC})
+    schema_doc["version"] = version
+    db.save(schema_doc)
+
+
+def migrate_data(registry, destination=None):
+    if registry.settings.get('plugins') and 'auctions.dgf' not in registry.settings['plugins'].split(','):
+        return
+    cur_version = get_db_schema_version(registry.db)
+    if cur_version == SCHEMA_VERSION:
+        return cur_version
+    for step in range(cur_version, destination or SCHEMA_VERSION):
+        LOGGER.info("Migrate openprocurement auctions dgf schema from {} to {}".format(step, step + 1), extra={'MESSAGE_ID': 'migrate_data'})
+        migration_func = globals().get('from{}to{}'.format(step, step + 1))
+        if migration_func:
+            migration_func(registry)
+        set_db_schema_version(registry.db, step + 1)
+
+
+def from0to1(registry):
+    """Backfill complaintSequence from the complaints already filed."""
+    docs = []
+    for i in registry.db.iterview('_all_docs', BATCH_SIZE, include_docs=True):
+        doc = i.doc
+        if doc.get('doc_type') != 'Auction' or doc.get('procurementMethodType') not in DGF_TYPES or 'complaintSequence' in doc:
+            continue
+        complaints = len(doc.get('complaints', [])) + sum([len(a.get('complaints', [])) for a in doc.get('awards', [])])
+        if not complaints:
+            continue
+        doc['complaintSequence'] = complaints
+        docs.append(doc)
+        if len(docs) >= BATCH_SIZE:
+            registry.db.update(docs)
+            docs = []
+    if docs:
+        registry.db.update(docs)
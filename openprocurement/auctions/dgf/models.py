@@ -1,18 +1,23 @@
 # -*- coding: utf-8 -*-
 from datetime import timedelta
-from schematics.types import StringType, URLType
+from schematics.types import IntType, StringType, URLType
 from schematics.types.compound import ModelType
 from schematics.exceptions import ValidationError
-from schematics.transforms import blacklist, whitelist
+from schematics.transforms import Role, blacklist, whitelist
 from schematics.types.serializable import serializable
 from zope.interface import implementer
 from openprocurement.api.models import (
     BooleanType, ListType, Feature, Period, get_now, TZ, ComplaintModelType,
     validate_features_uniq, validate_lots_uniq, Identifier as BaseIdentifier,
-    Classification, validate_items_uniq, ORA_CODES
+    Classification, validate_items_uniq, ORA_CODES as BASE_ORA_CODES
 )
-from openprocurement.api.utils import calculate_business_date
 from openprocurement.auctions.core.models import IAuction
+from openprocurement.auctions.dgf.awarding import award_index
+from openprocurement.auctions.dgf.business_dates import business_date
+from openprocurement.auctions.dgf.codes import CodeRegistry, load_json as read_json
+from openprocurement.auctions.dgf.lazy import LAZY_FIELDS, defer, lazy_fields
+from openprocurement.auctions.dgf.lots import LotIndex
+from openprocurement.auctions.dgf.storage import STORAGE, decode
 from openprocurement.auctions.flash.models import (
     Auction as BaseAuction, Document as BaseDocument, Bid as BaseBid,
     Complaint as BaseComplaint, Cancellation as BaseCancellation,
@@ -23,19 +28,8 @@ from openprocurement.auctions.flash.models import (
 )
 
 
-def read_json(name):
-    import os.path
-    from json import loads
-    curr_dir = os.path.dirname(os.path.realpath(__file__))
-    file_path = os.path.join(curr_dir, name)
-    with open(file_path) as lang_file:
-        data = lang_file.read()
-    return loads(data)
-
-
-CAV_CODES = read_json('cav.json')
-ORA_CODES = ORA_CODES[:]
-ORA_CODES[0:0] = ["UA-IPN", "UA-FIN"]
+CAV_CODES = CodeRegistry(lambda: read_json('cav.json'))
+ORA_CODES = CodeRegistry(lambda: ["UA-IPN", "UA-FIN"] + BASE_ORA_CODES)
 
 
 class CAVClassification(Classification):
@@ -136,18 +130,35 @@ def validate_not_available(items, *args):
         raise ValidationError(u"Option not available in this procurementMethodType")
 
 
+def hide_fields(roles, *names):
+    """``roles`` with ``names`` left out of all but the stored ``plain`` and ``default`` roles."""
+    hidden = {}
+    for name, role in roles.items():
+        if name in ('plain', 'default'):
+            hidden[name] = role
+        elif role.function is Role.whitelist:
+            hidden[name] = role - set(names)
+        elif role.function is Role.blacklist:
+            hidden[name] = role + set(names)
+        else:
+            hidden[name] = blacklist(*names)
+    return hidden
+
+
+@lazy_fields
 @implementer(IAuction)
 class Auction(BaseAuction):
     """Data regarding auction process - publicly inviting prospective contractors to submit bids for evaluation and selecting a winner or winners."""
     class Options:
-        roles = {
+        roles = hide_fields(dict(BaseAuction._options.roles, **{
             'edit_active.tendering': (blacklist('enquiryPeriod', 'tenderPeriod', 'value', 'auction_value', 'minimalStep', 'guarantee', 'auction_guarantee') + edit_role),
-        }
+        }), 'complaintSequence')
 
     awards = ListType(ModelType(Award), default=list())
     bids = ListType(ModelType(Bid), default=list())  # A list of all the companies who entered submissions for the auction.
     cancellations = ListType(ModelType(Cancellation), default=list())
     complaints = ListType(ModelType(Complaint), default=list())
+    complaintSequence = IntType(min_value=0)  # Number of the last complaintID allocated, for auction and award complaints.
     contracts = ListType(ModelType(Contract), default=list())
     documents = ListType(ModelType(Document), default=list())  # All documents and attachments related to the auction.
     enquiryPeriod = ModelType(Period)  # The period during which enquiries may be made and will be answered.
@@ -164,7 +175,7 @@ class Auction(BaseAuction):
     def auction_tenderPeriod(self):
         if self.tenderPeriod and self.tenderPeriod.endDate:
             return self.tenderPeriod
-        endDate = calculate_business_date(self.auctionPeriod.startDate, -timedelta(days=1), self)
+        endDate = business_date(self.auctionPeriod.startDate, -timedelta(days=1), self)
         return Period(dict(endDate=endDate))
 
     def initialize(self):
@@ -178,6 +189,27 @@ class Auction(BaseAuction):
             for lot in self.lots:
                 lot.date = now
 
+    def __init__(self, raw_data=None, *args, **kwargs):
+        raw_data, pending = defer(self.__class__, decode(raw_data))
+        super(DGFOtherAssets, self).__init__(raw_data, *args, **kwargs)
+        self._data.update(pending)
+
+    def store(self, database, validate=True, role=None):
+        """Store the auction, its cold fields compressed if enabled (see ``storage``)."""
+        if validate:
+            self.validate()
+        self._id, self._rev = database.save(STORAGE.encode(self.to_primitive(role=role)))
+        return self
+
+    def materialize(self):
+        """Convert the lazy lists still held as stored data (see ``lazy``)."""
+        for name in LAZY_FIELDS:
+            getattr(self, name, None)
+
+    def validate(self, *args, **kwargs):
+        self.materialize()
+        return super(DGFOtherAssets, self).validate(*args, **kwargs)
+
     def validate_tenderPeriod(self, data, period):
         if not (period and period.endDate) and not ('auctionPeriod' in data and data['auctionPeriod'].startDate):
             raise ValidationError(u'This field is required.')
@@ -186,6 +218,46 @@ class Auction(BaseAuction):
         if value.currency != u'UAH':
             raise ValidationError(u"currency should be only UAH")
 
+    def _lot_map(self, name):
+        index = getattr(self, '_lot_index', None)
+        if index is None:
+            index = self._lot_index = LotIndex()
+        return index.get(self, name)
+
+    def invalidate_lot_index(self):
+        self._lot_index = self._award_index = None
+
+    def get_lot(self, lot_id):
+        return self._lot_map('lots').get(lot_id)
+
+    def get_award(self, award_id):
+        return self._lot_map('awards').get(award_id)
+
+    def lot_awards(self, lot_id):
+        return award_index(self).lots.get(lot_id, [])
+
+    def lot_items(self, lot_id):
+        return self._lot_map('lot_items').get(lot_id, [])
+
+    def lot_complaints(self, lot_id):
+        """Auction complaints related to the lot (``None`` for the auction itself)."""
+        return self._lot_map('lot_complaints').get(lot_id, [])
+
+    def lot_inactive(self, lot_id):
+        lot = self.get_lot(lot_id)
+        return lot is not None and lot.status != 'active'
+
+    def next_complaint_id(self, server_id):
+        """Allocate the next complaintID from the auction's complaint sequence.
+
+        Auctions stored before the sequence existed start it from the number
+        of complaints they already have.
+        """
+        if self.complaintSequence is None:
+            self.complaintSequence = sum([len(i.complaints) for i in self.awards], len(self.complaints))
+        self.complaintSequence += 1
+        return '{}.{}{}'.format(self.auctionID, server_id, self.complaintSequence)
+
     @serializable(serialize_when_none=False)
     def next_check(self):
         now = get_now()
@@ -195,16 +267,20 @@ class Auction(BaseAuction):
         elif not self.lots and self.status == 'active.auction' and self.auctionPeriod and self.auctionPeriod.startDate and not self.auctionPeriod.endDate:
             if now < self.auctionPeriod.startDate:
                 checks.append(self.auctionPeriod.startDate.astimezone(TZ))
-            elif now < calc_auction_end_time(self.numberOfBids, self.auctionPeriod.startDate).astimezone(TZ):
-                checks.append(calc_auction_end_time(self.numberOfBids, self.auctionPeriod.startDate).astimezone(TZ))
+            else:
+                end = calc_auction_end_time(self.numberOfBids, self.auctionPeriod.startDate).astimezone(TZ)
+                if now < end:
+                    checks.append(end)
         elif self.lots and self.status == 'active.auction':
             for lot in self.lots:
                 if lot.status != 'active' or not lot.auctionPeriod or not lot.auctionPeriod.startDate or lot.auctionPeriod.endDate:
                     continue
                 if now < lot.auctionPeriod.startDate:
                     checks.append(lot.auctionPeriod.startDate.astimezone(TZ))
-                elif now < calc_auction_end_time(lot.numberOfBids, lot.auctionPeriod.startDate).astimezone(TZ):
-                    checks.append(calc_auction_end_time(lot.numberOfBids, lot.auctionPeriod.startDate).astimezone(TZ))
+                else:
+                    end = calc_auction_end_time(lot.numberOfBids, lot.auctionPeriod.startDate).astimezone(TZ)
+                    if now < end:
+                        checks.append(end)
         elif not self.lots and self.status == 'active.awarded' and not any([
                 i.status in self.block_complaint_status
                 for i in self.complaints
@@ -223,16 +299,16 @@ class Auction(BaseAuction):
             if standStillEnds and last_award_status == 'unsuccessful':
                 checks.append(max(standStillEnds))
         elif self.lots and self.status in ['active.qualification', 'active.awarded'] and not any([
-                i.status in self.block_complaint_status and i.relatedLot is None
-                for i in self.complaints
+                i.status in self.block_complaint_status
+                for i in self.lot_complaints(None)
             ]):
             for lot in self.lots:
                 if lot['status'] != 'active':
                     continue
-                lot_awards = [i for i in self.awards if i.lotID == lot.id]
+                lot_awards = self.lot_awards(lot.id)
                 pending_complaints = any([
-                    i['status'] in self.block_complaint_status and i.relatedLot == lot.id
-                    for i in self.complaints
+                    i['status'] in self.block_complaint_status
+                    for i in self.lot_complaints(lot.id)
                 ])
                 pending_awards_complaints = any([
                     i.status in self.block_complaint_status
@@ -248,18 +324,17 @@ class Auction(BaseAuction):
                 if not pending_complaints and not pending_awards_complaints and standStillEnds and last_award_status == 'unsuccessful':
                     checks.append(max(standStillEnds))
         if self.status.startswith('active'):
-            from openprocurement.api.utils import calculate_business_date
             for complaint in self.complaints:
                 if complaint.status == 'claim' and complaint.dateSubmitted:
-                    checks.append(calculate_business_date(complaint.dateSubmitted, COMPLAINT_STAND_STILL_TIME, self))
+                    checks.append(business_date(complaint.dateSubmitted, COMPLAINT_STAND_STILL_TIME, self))
                 elif complaint.status == 'answered' and complaint.dateAnswered:
-                    checks.append(calculate_business_date(complaint.dateAnswered, COMPLAINT_STAND_STILL_TIME, self))
+                    checks.append(business_date(complaint.dateAnswered, COMPLAINT_STAND_STILL_TIME, self))
             for award in self.awards:
                 for complaint in award.complaints:
                     if complaint.status == 'claim' and complaint.dateSubmitted:
-                        checks.append(calculate_business_date(complaint.dateSubmitted, COMPLAINT_STAND_STILL_TIME, self))
+                        checks.append(business_date(complaint.dateSubmitted, COMPLAINT_STAND_STILL_TIME, self))
                     elif complaint.status == 'answered' and complaint.dateAnswered:
-                        checks.append(calculate_business_date(complaint.dateAnswered, COMPLAINT_STAND_STILL_TIME, self))
+                        checks.append(business_date(complaint.dateAnswered, COMPLAINT_STAND_STILL_TIME, self))
         return min(checks).isoformat() if checks else None
 
 
@@ -303,6 +378,7 @@ class Bid(Bid):
     eligible = BooleanType(required=True, choices=[True])
 
 
+@lazy_fields
 @implementer(IAuction)
 class Auction(DGFOtherAssets):
     """Data regarding auction process - publicly inviting prospective contractors to submit bids for evaluation and selecting a winner or winners."""
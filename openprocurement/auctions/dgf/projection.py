@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Serialization of a subset of fields (``?opt_fields``).
+
+``opt_fields`` is a comma separated list of field names; a dotted name such
+as ``items.classification`` selects a field of a compound field, for each
+model of a list. Only the requested fields are read and serialized, with the
+same role filters as a full ``serialize``; unknown names are ignored.
+"""
+from schematics.types.compound import ListType, ModelType
+from schematics.types.serializable import Serializable
+from openprocurement.auctions.dgf.serializers import exporter, role_filter
+
+
+def parse_fields(value):
+    """Turn ``'status,items.classification'`` into ``{'status': None, 'items': {'classification': None}}``.
+
+    ``None`` stands for the whole field.
+    """
+    fields = {}
+    for path in value.split(','):
+        names = [i.strip() for i in path.split('.')]
+        if not all(names):
+            continue
+        node = fields
+        for name in names[:-1]:
+            if name in node and node[name] is None:
+                break
+            node = node.setdefault(name, {})
+        else:
+            node[names[-1]] = None
+    return fields
+
+
+def project(model, role, fields):
+    """Serialize ``fields`` (as returned by ``parse_fields``) of ``model`` with ``role``."""
+    gottago = role_filter(model.__class__, role)
+    data = {}
+    for name, subfields in fields.items():
+        field = model._fields.get(name) or model._serializables.get(name)
+        if field is None:
+            continue
+        value = getattr(model, name)
+        if value is None or gottago(name, value):
+            continue
+        if subfields and isinstance(field, ModelType):
+            shaped = project(value, role, subfields)
+        elif subfields and isinstance(field, ListType) and isinstance(field.field, ModelType):
+            shaped = [project(i, role, subfields) for i in value]
+        else:
+            shaped = exporter(field.type if isinstance(field, Serializable) else field, role)(value)
+        if shaped is None or isinstance(shaped, (dict, list)) and not shaped:
+            continue
+        data[field.serialized_name or name] = shaped
+    return data
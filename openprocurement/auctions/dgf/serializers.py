@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Role serializers compiled once per model class and role.
+
+``serialize_role(model, role)`` returns what ``model.serialize(role)`` does.
+Instead of asking the role filter about every field of every instance, the
+fields a (model class, role) pair exports are worked out the first time the
+pair is serialized, together with an exporter per field, and reused from
+then on. Role filters other than plain white, black and whole lists are
+still called per value, and types with their own ``export_loop``, models
+with their own ``serialize`` or a ``fields_order`` are left to schematics.
+"""
+from schematics.models import Model
+from schematics.transforms import Role, allow_none, export_loop, wholelist
+from schematics.types.compound import ListType, ModelType
+from schematics.types.serializable import Serializable
+
+STATIC_FILTERS = (Role.wholelist, Role.whitelist, Role.blacklist)
+COMPILED = {}
+
+
+def function(method):
+    return getattr(method, '__func__', method)
+
+
+MODEL_EXPORT = function(ModelType.export_loop)
+LIST_EXPORT = function(ListType.export_loop)
+MODEL_SERIALIZE = (function(Model.serialize), function(Model.to_primitive))
+
+
+def to_primitive(field, value):
+    return field.to_primitive(value)
+
+
+def role_filter(cls, role, strict=False):
+    """The filter ``export_loop`` applies to ``cls`` for ``role``."""
+    if role in cls._options.roles:
+        return cls._options.roles[role]
+    if role and strict:
+        raise ValueError(u'%s Model has no role "%s"' % (cls.__name__, role))
+    return cls._options.roles.get('default', wholelist())
+
+
+def exporter(field, role):
+    """A function shaping values of ``field`` as its ``export_loop`` would."""
+    kind = function(getattr(type(field), 'export_loop', None))
+    if kind is MODEL_EXPORT:
+        model_class = field.model_class
+
+        def export(value):
+            cls = value.__class__ if isinstance(value, model_class) else model_class
+            return compiled(cls, role).export(value) or None
+        return export
+    if kind is LIST_EXPORT:
+        item = field.field
+        export_item = exporter(item, role)
+        keep_none = not hasattr(item, 'export_loop') and item.allow_none()
+
+        def export(value):
+            data = []
+            for i in value:
+                shaped = export_item(i)
+                if shaped is not None or keep_none:
+                    data.append(shaped)
+            if data or field.allow_none():
+                return data
+        return export
+    if hasattr(field, 'export_loop'):
+        return lambda value: field.export_loop(value, to_primitive, role=role)
+    return field.to_primitive
+
+
+class CompiledRole(object):
+
+    def __init__(self, cls, role):
+        self.cls = cls
+        self.role = role
+        self.fields = None
+        if cls._options.fields_order:
+            return
+        gottago = role_filter(cls, role)
+        static = isinstance(gottago, Role) and gottago.function in STATIC_FILTERS
+        self.fields = []
+        for name, field in list(cls._fields.items()) + list(cls._serializables.items()):
+            if static and gottago(name, None):
+                continue
+            self.fields.append((
+                name,
+                field.serialized_name or name,
+                exporter(field.type if isinstance(field, Serializable) else field, role),
+                allow_none(cls, field),
+                None if static else gottago,
+            ))
+
+    def export(self, instance, names=None):
+        """Export ``instance``, or only the fields in ``names`` if given."""
+        if self.fields is None:
+            return export_loop(self.cls, instance, to_primitive, role=self.role)
+        data = {}
+        for name, serialized_name, export, none_allowed, gottago in self.fields:
+            if names is not None and name not in names:
+                continue
+            value = instance[name]
+            if gottago is not None and gottago(name, value):
+                continue
+            if value is not None:
+                shaped = export(value)
+                if shaped is not None or none_allowed:
+                    data[serialized_name] = shaped
+            elif none_allowed:
+                data[serialized_name] = None
+        if data:
+            return data
+
+
+def compiled(cls, role):
+    try:
+        return COMPILED[(cls, role)]
+    except KeyError:
+        result = COMPILED[(cls, role)] = CompiledRole(cls, role)
+        return result
+
+
+def serialize_role(model, role=None):
+    """``model.serialize(role)`` through the compiled serializers."""
+    cls = model.__class__
+    if (function(cls.serialize), function(cls.to_primitive)) != MODEL_SERIALIZE:
+        return model.serialize(role)
+    role_filter(cls, role, strict=True)
+    return compiled(cls, role).export(model)
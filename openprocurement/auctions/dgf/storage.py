@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Compressed storage of the cold fields of auction documents.
+
+Revisions, item descriptions and documents are written once and rarely
+read back, yet they make up most of a large auction document. With
+``dgf.storage_codec`` set to ``zlib`` or ``lz4`` they are moved out of the
+stored document into one compressed ``compressedData`` field:
+
+    {"codec": "zlib", "data": "<base64>"}
+
+holding ``[tokens, value]`` pairs, ``tokens`` being the path of each value
+in the document. Documents whose cold fields take less than
+``dgf.storage_codec_min_size`` bytes (4096 by default) are stored as they
+are. ``decode`` puts the fields back and runs whenever an auction is built
+from stored data, so stored documents are read the same way whatever the
+codec setting is, as long as their codec can be imported. It decodes no
+more than ``dgf.storage_codec_max_size`` bytes (64 MiB by default).
+"""
+import json
+import zlib
+from base64 import b64decode, b64encode
+from copy import copy
+from logging import getLogger
+
+from schematics.exceptions import ModelConversionError
+
+LOGGER = getLogger(__name__)
+FIELD = 'compressedData'
+DESCRIPTIONS = ('description', 'description_en', 'description_ru')
+DEFAULT_MIN_SIZE = 4096
+DEFAULT_MAX_SIZE = 64 * 2 ** 20
+DECODE_ERRORS = (AttributeError, ImportError, IndexError, KeyError, RuntimeError, TypeError, ValueError, zlib.error)
+
+
+def zlib_codec():
+    def decompress(data, max_length):
+        decompressor = zlib.decompressobj()
+        result = decompressor.decompress(data, max_length + 1)
+        if len(result) > max_length or decompressor.unconsumed_tail:
+            raise ValueError('Compressed data exceeds {} bytes'.format(max_length))
+        return result
+    return lambda data: zlib.compress(data, 6), decompress
+
+
+def lz4_codec():
+    import lz4.frame
+
+    def decompress(data, max_length):
+        result = lz4.frame.LZ4FrameDecompressor().decompress(data, max_length=max_length + 1)
+        if len(result) > max_length:
+            raise ValueError('Compressed data exceeds {} bytes'.format(max_length))
+        return result
+    return lz4.frame.compress, decompress
+
+
+CODECS = [
+    ('zlib', zlib_codec),
+    ('lz4', lz4_codec),
+]
+
+
+def get_codec(name):
+    """``(compress, decompress)`` of codec ``name``; ImportError if it is unavailable.
+
+    ``decompress(data, max_length)`` raises ValueError rather than return
+    more than ``max_length`` bytes.
+    """
+    for codec_name, factory in CODECS:
+        if codec_name == name:
+            return factory()
+    raise ValueError(u'Unknown storage codec {}'.format(name))
+
+
+def cold_paths(doc):
+    """Paths of the cold fields of ``doc``: revisions, item descriptions and document lists."""
+    if 'revisions' in doc:
+        yield ['revisions']
+    for index, item in enumerate(doc.get('items', [])):
+        for key in DESCRIPTIONS:
+            if key in item:
+                yield ['items', index, key]
+    for path in document_paths(doc, []):
+        yield path
+
+
+def document_paths(data, path):
+    for key, value in data.items():
+        if key == 'documents':
+            yield path + [key]
+        elif key != 'revisions' and isinstance(value, list):
+            for index, item in enumerate(value):
+                if isinstance(item, dict):
+                    for i in document_paths(item, path + [key, index]):
+                        yield i
+
+
+class StorageCodec(object):
+    """Encoder of stored auction documents, configured with ``configure``."""
+
+    def __init__(self):
+        self.name = None
+        self.compress = None
+        self.min_size = DEFAULT_MIN_SIZE
+        self.max_size = DEFAULT_MAX_SIZE
+
+    def configure(self, name=None, min_size=DEFAULT_MIN_SIZE, max_size=DEFAULT_MAX_SIZE):
+        """Compress with codec ``name`` from now on, or stop compressing if it is None.
+
+        ``max_size`` caps the decompressed size of the cold fields on load.
+        """
+        self.min_size = min_size
+        self.max_size = max_size
+        if not name:
+            self.name = self.compress = None
+            return
+        try:
+            self.compress = get_codec(name)[0]
+        except ImportError:
+            LOGGER.warning('Storage codec {} is not available, using zlib'.format(name))
+            name, self.compress = 'zlib', get_codec('zlib')[0]
+        self.name = name
+
+    def encode(self, doc):
+        """Move the cold fields of ``doc``, a primitive auction, into ``compressedData``."""
+        if self.name is None:
+            return doc
+        cold = []
+        for path in cold_paths(doc):
+            parent = doc
+            for token in path[:-1]:
+                parent = parent[token]
+            cold.append((parent, path))
+        data = json.dumps([[path, parent[path[-1]]] for parent, path in cold], ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        if len(data) < self.min_size:
+            return doc
+        for parent, path in cold:
+            del parent[path[-1]]
+        doc[FIELD] = {'codec': self.name, 'data': b64encode(self.compress(data)).decode('ascii')}
+        return doc
+
+
+STORAGE = StorageCodec()
+
+
+def decode(doc):
+    """``doc`` with the fields of ``compressedData`` back in place; ``doc`` is not changed.
+
+    Only stored documents (with a ``_rev``) are decoded, ``compressedData``
+    is dropped from any other data. Undecodable data raises
+    ``ModelConversionError``.
+    """
+    if not isinstance(doc, dict) or FIELD not in doc:
+        return doc
+    doc = dict(doc)
+    stored = doc.pop(FIELD)
+    if not doc.get('_rev'):
+        return doc
+    try:
+        decompress = get_codec(stored['codec'])[1]
+        data = decompress(b64decode(stored['data']), STORAGE.max_size)
+        copied = set()
+        for path, value in json.loads(data.decode('utf-8')):
+            parent = doc
+            for token in path[:-1]:
+                child = parent[token]
+                if id(child) not in copied:
+                    child = parent[token] = copy(child)
+                    copied.add(id(child))
+                parent = child
+            parent[path[-1]] = value
+    except DECODE_ERRORS:
+        LOGGER.warning('Invalid compressed data of auction {}'.format(doc.get('_id') or doc.get('id')))
+        raise ModelConversionError({FIELD: [u'Invalid compressed data']})
+    return doc
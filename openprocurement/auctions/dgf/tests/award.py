@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 import unittest
 
+from mock import Mock
+
+from openprocurement.auctions.dgf.awarding import AwardIndex
 from openprocurement.auctions.dgf.tests.base import (
     BaseAuctionWebTest, test_auction_data, test_bids, test_lots,
     test_financial_auction_data, test_financial_bids,
@@ -2414,6 +2417,33 @@ class FinancialAuction2LotAwardDocumentResourceTest(Auction2LotAwardDocumentReso
     initial_organization = test_financial_organization
 
 
+class AwardIndexTest(unittest.TestCase):
+
+    def award(self, award_id, lot_id):
+        return Mock(id=award_id, lotID=lot_id)
+
+    def test_index(self):
+        auction = Mock(awards=[self.award('a1', 'l1'), self.award('a2', 'l2'), self.award('a3', 'l1')], contracts=[])
+        auction.contracts.append(Mock(awardID='a1'))
+        index = AwardIndex().update(auction)
+        self.assertEqual([i.id for i in index.lot_awards_from(auction.awards[0])], ['a1', 'a3'])
+        self.assertEqual([i.id for i in index.lot_awards_from(auction.awards[2])], ['a3'])
+        self.assertEqual(index.award_contracts('a1'), auction.contracts)
+        self.assertEqual(index.award_contracts('a2'), [])
+
+        auction.awards.append(self.award('a4', 'l1'))
+        auction.contracts.append(Mock(awardID='a3'))
+        index.update(auction)
+        self.assertEqual([i.id for i in index.lot_awards_from(auction.awards[2])], ['a3', 'a4'])
+        self.assertEqual(index.award_contracts('a3'), auction.contracts[1:])
+
+        auction.awards = [self.award('a5', 'l2')]
+        auction.contracts = []
+        index.update(auction)
+        self.assertEqual(index.lots.keys(), ['l2'])
+        self.assertEqual(index.award_contracts('a1'), [])
+
+
 def suite():
     suite = unittest.TestSuite()
     suite.addTest(unittest.makeSuite(Auction2LotAwardComplaintDocumentResourceTest))
@@ -2424,6 +2454,7 @@ def suite():
     suite.addTest(unittest.makeSuite(AuctionAwardComplaintResourceTest))
     suite.addTest(unittest.makeSuite(AuctionAwardDocumentResourceTest))
     suite.addTest(unittest.makeSuite(AuctionAwardResourceTest))
+    suite.addTest(unittest.makeSuite(AwardIndexTest))
     suite.addTest(unittest.makeSuite(AuctionLotAwardResourceTest))
     suite.addTest(unittest.makeSuite(FinancialAuction2LotAwardComplaintDocumentResourceTest))
     suite.addTest(unittest.makeSuite(FinancialAuction2LotAwardComplaintResourceTest))
@@ -2,6 +2,10 @@
 import unittest
 from copy import deepcopy
 
+import mock
+
+from openprocurement.auctions.dgf.conflicts import STATS as CONFLICT_STATS
+from openprocurement.auctions.dgf.models import DGFOtherAssets
 from openprocurement.auctions.dgf.tests.base import BaseAuctionWebTest, test_auction_data, test_features_auction_data, test_financial_organization, test_financial_auction_data
 
 
@@ -182,6 +186,87 @@ class AuctionBidderResourceTest(BaseAuctionWebTest):
         self.assertEqual(response.content_type, 'application/json')
         self.assertEqual(response.json['errors'][0]["description"], "Can't add bid in current (complete) auction status")
 
+    def test_create_auction_bidders_batch(self):
+        dateModified = self.db.get(self.auction_id).get('dateModified')
+        bid = {'tenderers': [self.initial_organization], "value": {"amount": 500}, 'qualified': True}
+        if self.initial_organization == test_financial_organization:
+            bid['eligible'] = True
+        invalid_bid = deepcopy(bid)
+        del invalid_bid['qualified']
+
+        response = self.app.post_json('/auctions/{}/bids_batch'.format(self.auction_id), {'data': [bid, invalid_bid, bid]}, status=422)
+        self.assertEqual(response.status, '422 Unprocessable Entity')
+        self.assertEqual(response.json['errors'], [
+            {u'description': [u'This field is required.'], u'location': u'body', u'name': u'data.1.qualified'}
+        ])
+        self.assertNotIn('bids', self.db.get(self.auction_id))
+
+        response = self.app.post_json('/auctions/{}/bids_batch'.format(self.auction_id), {'data': [bid, 'bid']}, status=422)
+        self.assertEqual(response.json['errors'], [
+            {u'description': u'Data not available', u'location': u'body', u'name': u'data.1.data'}
+        ])
+
+        response = self.app.post_json('/auctions/{}/bids_batch'.format(self.auction_id), {'data': [bid, bid]})
+        self.assertEqual(response.status, '201 Created')
+        self.assertEqual(response.content_type, 'application/json')
+        results = response.json['data']
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertEqual(result['data']['tenderers'][0]['name'], self.initial_organization['name'])
+            self.assertIn('token', result['access'])
+
+        auction = self.db.get(self.auction_id)
+        self.assertEqual([i['id'] for i in auction['bids']], [i['data']['id'] for i in results])
+        self.assertEqual(auction.get('dateModified'), dateModified)
+
+        response = self.app.patch_json('/auctions/{}/bids/{}?acc_token={}'.format(
+            self.auction_id, results[0]['data']['id'], results[0]['access']['token']), {"data": {"value": {"amount": 600}}})
+        self.assertEqual(response.status, '200 OK')
+
+        response = self.app.post_json('/auctions/{}/bids_batch'.format(self.auction_id), {'data': bid}, status=422)
+        self.assertEqual(response.json['errors'][0]['description'], 'Data not available')
+
+        self.set_status('complete')
+
+        response = self.app.post_json('/auctions/{}/bids_batch'.format(self.auction_id), {'data': [bid]}, status=403)
+        self.assertEqual(response.status, '403 Forbidden')
+        self.assertEqual(response.json['errors'][0]["description"], "Can't add bid in current (complete) auction status")
+
+    def concurrent_store(self, changes):
+        store = DGFOtherAssets.store
+        updates = []
+
+        def store_after_concurrent_update(auction, db):
+            if not updates:
+                doc = db.get(auction.id)
+                changes(doc)
+                db.save(doc)
+                updates.append(doc['_rev'])
+            return store(auction, db)
+        return mock.patch.object(DGFOtherAssets, 'store', store_after_concurrent_update)
+
+    def test_auction_bidder_conflict(self):
+        bid = {'tenderers': [self.initial_organization], "value": {"amount": 500}, 'qualified': True}
+        if self.initial_organization == test_financial_organization:
+            bid['eligible'] = True
+
+        merged = CONFLICT_STATS.merged
+        with self.concurrent_store(lambda doc: doc.update(title=u'concurrent title')):
+            response = self.app.post_json('/auctions/{}/bids'.format(self.auction_id), {'data': bid})
+        self.assertEqual(response.status, '201 Created')
+        bidder = response.json['data']
+        token = response.json['access']['token']
+        self.assertEqual(CONFLICT_STATS.merged, merged + 1)
+        auction = self.db.get(self.auction_id)
+        self.assertEqual(auction['title'], u'concurrent title')
+        self.assertEqual([i['id'] for i in auction['bids']], [bidder['id']])
+
+        with self.concurrent_store(lambda doc: doc['bids'][0]['value'].update(amount=550)):
+            response = self.app.patch_json('/auctions/{}/bids/{}?acc_token={}'.format(
+                self.auction_id, bidder['id'], token), {"data": {"value": {"amount": 600}}}, status=409)
+        self.assertEqual(response.status, '409 Conflict')
+        self.assertEqual(self.db.get(self.auction_id)['bids'][0]['value']['amount'], 550)
+
     def test_patch_auction_bidder(self):
         if self.initial_organization == test_financial_organization:
             response = self.app.post_json('/auctions/{}/bids'.format(
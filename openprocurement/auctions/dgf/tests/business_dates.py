@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import timedelta
+
+from openprocurement.api.models import get_now
+from openprocurement.api.utils import calculate_business_date
+from openprocurement.auctions.dgf.business_dates import BusinessCalendar
+
+
+class BusinessCalendarTest(unittest.TestCase):
+
+    def test_memoized(self):
+        calendar = BusinessCalendar(size=2)
+        now = get_now()
+        accelerated = {'procurementMethodDetails': 'quick, accelerator=1440'}
+        self.assertEqual(calendar.calculate(now, timedelta(days=3)), calculate_business_date(now, timedelta(days=3)))
+        self.assertEqual(calendar.calculate(now, timedelta(days=3), accelerated), calculate_business_date(now, timedelta(days=3), accelerated))
+        self.assertEqual(calendar.calculate(now, timedelta(days=3)), now + timedelta(days=3))
+        self.assertEqual(calendar.stats(), {'hits': 1, 'misses': 2, 'dates': 2})
+        calendar.calculate(now, timedelta(days=1))
+        self.assertEqual(calendar.stats()['dates'], 2)
+        calendar.calculate(now, timedelta(days=3), accelerated)
+        self.assertEqual(calendar.stats(), {'hits': 1, 'misses': 4, 'dates': 2})
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(BusinessCalendarTest))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
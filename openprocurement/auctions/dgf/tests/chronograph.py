@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 import unittest
 from datetime import datetime, timedelta
+from urllib import quote
+
+from iso8601 import parse_date
 from openprocurement.api.models import get_now
+from openprocurement.auctions.dgf.models import DGFOtherAssets, DGFFinancialAssets
 from openprocurement.auctions.dgf.tests.base import BaseAuctionWebTest, test_lots, test_bids, test_financial_auction_data, test_financial_organization, test_financial_bids
 
 
@@ -265,6 +269,24 @@ class AuctionComplaintSwitchResourceTest(BaseAuctionWebTest):
             self.assertEqual(response.status, '200 OK')
             self.assertEqual(response.json['data']["complaints"][-1]['status'], status)
 
+    def test_next_check(self):
+        for i in range(3):
+            response = self.app.post_json('/auctions/{}/complaints'.format(self.auction_id), {'data': {
+                'title': 'complaint title',
+                'description': 'complaint description',
+                'author': self.initial_organization,
+                'status': 'claim'
+            }})
+            self.assertEqual(response.status, '201 Created')
+
+        data = self.db.get(self.auction_id)
+        model = DGFFinancialAssets if data['procurementMethodType'] == 'dgfFinancialAssets' else DGFOtherAssets
+        auction = model(data)
+        self.assertEqual(auction.next_check, data['next_check'])
+
+        auction.complaints[0].status = 'cancelled'
+        self.assertEqual(auction.next_check, data['next_check'])
+
 
 @unittest.skip("option not available")
 class AuctionLotComplaintSwitchResourceTest(AuctionComplaintSwitchResourceTest):
@@ -434,9 +456,75 @@ class FinancialAuctionLotAwardComplaintSwitchResourceTest(AuctionLotAwardComplai
     initial_organization = test_financial_organization
 
 
+class AuctionChronographBatchResourceTest(BaseAuctionWebTest):
+
+    def test_check_auctions_batch(self):
+        self.set_status('active.auction', {'status': self.initial_status})
+        response = self.app.post_json('/auctions_chronograph', {'data': [self.auction_id]}, status=403)
+        self.assertEqual(response.status, '403 Forbidden')
+
+        self.app.authorization = ('Basic', ('chronograph', ''))
+        response = self.app.post_json('/auctions_chronograph', {'data': {}}, status=422)
+        self.assertEqual(response.json['errors'][0]['description'], 'Data should be a list of auction ids')
+
+        response = self.app.post_json('/auctions_chronograph', {'data': [self.auction_id, 'some_id', self.auction_id]})
+        self.assertEqual(response.status, '200 OK')
+        self.assertEqual(response.content_type, 'application/json')
+        self.assertEqual([(i['id'], i['result']) for i in response.json['data']], [
+            (self.auction_id, 'updated'), ('some_id', 'not found')
+        ])
+        auction = self.db.get(self.auction_id)
+        self.assertEqual(auction['status'], 'unsuccessful')
+        self.assertEqual(auction['revisions'][-1]['author'], 'chronograph')
+
+        response = self.app.post_json('/auctions_chronograph', {'data': [self.auction_id]})
+        self.assertEqual(response.json['data'], [{'id': self.auction_id, 'result': 'unchanged'}])
+
+    def test_due_auctions(self):
+        auction = self.db.get(self.auction_id)
+        next_check = auction['next_check']
+        other_type = 'dgfFinancialAssets' if auction['procurementMethodType'] == 'dgfOtherAssets' else 'dgfOtherAssets'
+
+        response = self.app.get('/auctions_due?before={}'.format(quote(next_check)))
+        self.assertEqual(response.status, '200 OK')
+        self.assertIn({
+            'id': self.auction_id,
+            'next_check': next_check,
+            'procurementMethodType': auction['procurementMethodType']
+        }, response.json['data'])
+
+        response = self.app.get('/auctions_due?before={}&procurementMethodType={}'.format(quote(next_check), auction['procurementMethodType']))
+        self.assertIn(self.auction_id, [i['id'] for i in response.json['data']])
+
+        response = self.app.get('/auctions_due?before={}&procurementMethodType={}'.format(quote(next_check), other_type))
+        self.assertNotIn(self.auction_id, [i['id'] for i in response.json['data']])
+
+        before = (parse_date(next_check) - timedelta(seconds=1)).isoformat()
+        response = self.app.get('/auctions_due?before={}'.format(quote(before)))
+        self.assertNotIn(self.auction_id, [i['id'] for i in response.json['data']])
+
+        response = self.app.post_json('/auctions', {'data': self.initial_data})
+        self.assertEqual(response.status, '201 Created')
+        response = self.app.get('/auctions_due?before={}&limit=1'.format(quote(get_now().replace(year=2100).isoformat())))
+        self.assertEqual(len(response.json['data']), 1)
+        offset = response.json['next_page']['offset']
+        response = self.app.get('/auctions_due?before={}&limit=1&offset={}'.format(quote(get_now().replace(year=2100).isoformat()), offset))
+        self.assertEqual(len(response.json['data']), 1)
+        self.assertEqual(response.json['data'][0]['id'], offset.split('.', 1)[1])
+
+        response = self.app.get('/auctions_due?limit=0', status=422)
+        self.assertEqual(response.json['errors'][0]['name'], 'limit')
+
+
+class FinancialAuctionChronographBatchResourceTest(AuctionChronographBatchResourceTest):
+    initial_data = test_financial_auction_data
+    initial_organization = test_financial_organization
+
+
 def suite():
     suite = unittest.TestSuite()
     suite.addTest(unittest.makeSuite(AuctionAwardComplaintSwitchResourceTest))
+    suite.addTest(unittest.makeSuite(AuctionChronographBatchResourceTest))
     suite.addTest(unittest.makeSuite(AuctionComplaintSwitchResourceTest))
     suite.addTest(unittest.makeSuite(AuctionLotAwardComplaintSwitchResourceTest))
     suite.addTest(unittest.makeSuite(AuctionLotComplaintSwitchResourceTest))
@@ -447,6 +535,7 @@ def suite():
     suite.addTest(unittest.makeSuite(AuctionSwitchQualificationResourceTest))
     suite.addTest(unittest.makeSuite(AuctionSwitchUnsuccessfulResourceTest))
     suite.addTest(unittest.makeSuite(FinancialAuctionAwardComplaintSwitchResourceTest))
+    suite.addTest(unittest.makeSuite(FinancialAuctionChronographBatchResourceTest))
     suite.addTest(unittest.makeSuite(FinancialAuctionComplaintSwitchResourceTest))
     suite.addTest(unittest.makeSuite(FinancialAuctionLotAwardComplaintSwitchResourceTest))
     suite.addTest(unittest.makeSuite(FinancialAuctionLotComplaintSwitchResourceTest))
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from openprocurement.auctions.dgf import codes
+from openprocurement.auctions.dgf.models import CAV_CODES, read_json
+
+# Builds the test app in a fresh interpreter, where no table is loaded yet.
+STARTUP = """
+import os
+import sys
+from paste.deploy import appconfig
+from openprocurement.api.app import main
+from openprocurement.auctions.dgf import codes
+from openprocurement.auctions.dgf.models import CAV_CODES, ORA_CODES
+
+conf = appconfig('config:tests.ini', relative_to=sys.argv[1])
+main(conf.global_conf, **dict(conf.local_conf, **{'dgf.codes_cache_dir': sys.argv[2]}))
+assert CAV_CODES._codes is None and ORA_CODES._codes is None and not codes._loaded
+assert u'06000000-2' in CAV_CODES
+assert os.path.exists(os.path.join(sys.argv[2], 'cav.json.marshal'))
+"""
+
+
+class CodeRegistryTest(unittest.TestCase):
+
+    def test_membership(self):
+        self.assertEqual(list(CAV_CODES), read_json('cav.json'))
+        self.assertIn(u'06000000-2', CAV_CODES)
+        self.assertNotIn(u'06000000-3', CAV_CODES)
+        self.assertNotIn(u'', CAV_CODES)
+
+    def test_hierarchy(self):
+        self.assertEqual(CAV_CODES.group(u'04111210-4'), u'041')
+        self.assertEqual(CAV_CODES.parent(u'04111210-4'), u'04111200-1')
+        self.assertEqual(CAV_CODES.parent(u'04100000-9'), u'04000000-8')
+        self.assertIsNone(CAV_CODES.parent(u'04000000-8'))
+        self.assertEqual(CAV_CODES.descendants(u'04111200-1'), (u'04111200-1', u'04111210-4', u'04111220-7'))
+
+
+class CodeTableCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        codes.configure_codes_cache(self.cache_dir)
+        codes._loaded.pop('cav.json', None)
+
+    def tearDown(self):
+        codes.configure_codes_cache(None)
+        shutil.rmtree(self.cache_dir)
+
+    def test_lazy_registry(self):
+        registry = codes.CodeRegistry(lambda: read_json('cav.json'))
+        self.assertIsNone(registry._codes)
+        self.assertIn(u'06000000-2', registry)
+        self.assertIsNotNone(registry._codes)
+
+    def test_startup(self):
+        subprocess.check_call([sys.executable, '-c', STARTUP, os.path.dirname(__file__), self.cache_dir])
+
+    def test_marshal_cache(self):
+        data = read_json('cav.json')
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir, 'cav.json.marshal')))
+        codes._loaded.pop('cav.json')
+        self.assertEqual(read_json('cav.json'), data)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(CodeRegistryTest))
+    suite.addTest(unittest.makeSuite(CodeTableCacheTest))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
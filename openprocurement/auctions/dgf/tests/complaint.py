@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 import unittest
 
+import mock
+
+from openprocurement.auctions.dgf.models import DGFOtherAssets
 from openprocurement.auctions.dgf.tests.base import (
     BaseAuctionWebTest, test_auction_data, test_lots,
     test_financial_auction_data, test_financial_organization
@@ -180,6 +183,55 @@ class AuctionComplaintResourceTest(BaseAuctionWebTest):
         self.assertEqual(response.content_type, 'application/json')
         self.assertEqual(response.json['errors'][0]["description"], "Can't add complaint in current (unsuccessful) auction status")
 
+    def test_complaint_sequence(self):
+        complaint_ids = []
+        for i in range(2):
+            response = self.app.post_json('/auctions/{}/complaints'.format(
+                self.auction_id), {'data': {'title': 'complaint title', 'description': 'complaint description', 'author': self.initial_organization}})
+            self.assertEqual(response.status, '201 Created')
+            complaint_ids.append(response.json['data']['complaintID'])
+        auction = self.db.get(self.auction_id)
+        self.assertEqual(auction['complaintSequence'], 2)
+        self.assertTrue(complaint_ids[0].endswith('1'))
+        self.assertTrue(complaint_ids[1].endswith('2'))
+
+        del auction['complaintSequence']
+        self.db.save(auction)
+        response = self.app.post_json('/auctions/{}/complaints'.format(
+            self.auction_id), {'data': {'title': 'complaint title', 'description': 'complaint description', 'author': self.initial_organization}})
+        self.assertEqual(response.status, '201 Created')
+        self.assertTrue(response.json['data']['complaintID'].endswith('3'))
+        self.assertEqual(self.db.get(self.auction_id)['complaintSequence'], 3)
+
+        response = self.app.patch_json('/auctions/{}'.format(self.auction_id), {'data': {'complaintSequence': 0}})
+        self.assertEqual(response.status, '200 OK')
+        self.assertEqual(self.db.get(self.auction_id)['complaintSequence'], 3)
+
+    def test_complaint_id_after_conflict(self):
+        store = DGFOtherAssets.store
+        updates = []
+
+        def store_after_concurrent_update(auction, db):
+            if not updates:
+                doc = db.get(auction.id)
+                doc['complaintSequence'] = (doc.get('complaintSequence') or 0) + 5
+                db.save(doc)
+                updates.append(doc['_rev'])
+            return store(auction, db)
+
+        with mock.patch.object(DGFOtherAssets, 'store', store_after_concurrent_update):
+            response = self.app.post_json('/auctions/{}/complaints'.format(
+                self.auction_id), {'data': {'title': 'complaint title', 'description': 'complaint description', 'author': self.initial_organization}})
+        self.assertEqual(response.status, '201 Created')
+        complaint = response.json['data']
+        saved = self.db.get(self.auction_id)['complaints'][-1]
+        self.assertEqual(saved['id'], complaint['id'])
+        self.assertEqual(complaint['complaintID'], saved['complaintID'])
+        self.assertTrue(saved['complaintID'].endswith('6'))
+
+        response = self.app.get('/auctions/{}'.format(self.auction_id))
+        self.assertNotIn('complaintSequence', response.json['data'])
+
     def test_patch_auction_complaint(self):
         response = self.app.post_json('/auctions/{}/complaints'.format(
             self.auction_id), {'data': {'title': 'complaint title', 'description': 'complaint description', 'author': self.initial_organization}})
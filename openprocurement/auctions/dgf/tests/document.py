@@ -1,6 +1,12 @@
 # -*- coding: utf-8 -*-
 import unittest
 from email.header import Header
+from io import BytesIO
+
+import mock
+from schematics.exceptions import ModelValidationError
+from openprocurement.auctions.dgf.files import HashingReader, UploadTooLarge
+from openprocurement.auctions.dgf.models import DGFOtherAssets
 from openprocurement.auctions.dgf.tests.base import BaseAuctionWebTest,  test_financial_auction_data
 
 
@@ -139,6 +145,14 @@ class AuctionDocumentResourceTest(BaseAuctionWebTest):
             self.assertEqual(response.content_type, 'application/msword')
             self.assertEqual(response.content_length, 7)
             self.assertEqual(response.body, 'content')
+            self.assertEqual(response.headers['Accept-Ranges'], 'bytes')
+
+            response = self.app.get('/auctions/{}/documents/{}?download={}'.format(
+                self.auction_id, doc_id, key), headers={'Range': 'bytes=1-3'})
+            self.assertEqual(response.status, '206 Partial Content')
+            self.assertEqual(response.content_length, 3)
+            self.assertEqual(response.headers['Content-Range'], 'bytes 1-3/7')
+            self.assertEqual(response.body, 'ont')
 
         response = self.app.get('/auctions/{}/documents/{}'.format(
             self.auction_id, doc_id))
@@ -389,6 +403,83 @@ class AuctionDocumentResourceTest(BaseAuctionWebTest):
         self.assertEqual(response.content_type, 'application/json')
         self.assertEqual(response.json['errors'][0]["description"], "Can't update document in current (active.auction) auction status")
 
+    def test_auction_documents_pagination(self):
+        doc_ids = []
+        for title in [u'1.doc', u'2.doc', u'3.doc']:
+            response = self.app.post('/auctions/{}/documents'.format(
+                self.auction_id), upload_files=[('file', title, 'content')])
+            self.assertEqual(response.status, '201 Created')
+            doc_ids.append(response.json["data"]['id'])
+
+        response = self.app.put('/auctions/{}/documents/{}'.format(
+            self.auction_id, doc_ids[0]), upload_files=[('file', u'1.doc', 'content2')])
+        self.assertEqual(response.status, '200 OK')
+
+        response = self.app.get('/auctions/{}/documents'.format(self.auction_id))
+        self.assertEqual([i['id'] for i in response.json['data']], doc_ids[1:] + doc_ids[:1])
+
+        response = self.app.get('/auctions/{}/documents?limit=2'.format(self.auction_id))
+        self.assertEqual([i['id'] for i in response.json['data']], doc_ids[1:])
+
+        response = self.app.get('/auctions/{}/documents?offset=1&limit=1'.format(self.auction_id))
+        self.assertEqual([i['id'] for i in response.json['data']], doc_ids[2:])
+
+        response = self.app.get('/auctions/{}/documents?all=1&offset=3'.format(self.auction_id))
+        self.assertEqual([i['id'] for i in response.json['data']], doc_ids[:1])
+
+        response = self.app.get('/auctions/{}/documents?limit=x'.format(self.auction_id), status=422)
+        self.assertEqual(response.json['errors'], [
+            {u'description': u'Should be a non-negative integer', u'location': u'querystring', u'name': u'limit'}
+        ])
+
+    def test_upload_size_limit(self):
+        settings = self.app.app.registry.settings
+        self.addCleanup(settings.pop, 'dgf.max_upload_size', None)
+        settings['dgf.max_upload_size'] = '5'
+        response = self.app.post('/auctions/{}/documents'.format(
+            self.auction_id), upload_files=[('file', u'укр.doc', 'content')], status=413)
+        self.assertEqual(response.status, '413 Request Entity Too Large')
+        self.assertEqual(response.json['errors'], [
+            {u'description': u'File size exceeds the limit of 5 bytes', u'location': u'body', u'name': u'file'}
+        ])
+        self.assertNotIn('documents', self.db.get(self.auction_id))
+
+        settings['dgf.max_upload_size'] = '7'
+        response = self.app.post('/auctions/{}/documents'.format(
+            self.auction_id), upload_files=[('file', u'укр.doc', 'content')])
+        self.assertEqual(response.status, '201 Created')
+        if not self.docservice:
+            self.assertEqual(response.json["data"]["hash"], 'md5:9a0364b9e99bb480dd25e1f0284c8555')
+            key = response.json["data"]["url"].split('?')[-1].split('=')[-1]
+            auction = self.db.get(self.auction_id)
+            attachment = auction['_attachments']['{}_{}'.format(response.json["data"]["id"], key)]
+            self.assertEqual(attachment['length'], 7)
+
+        reader = HashingReader(BytesIO('content'), limit=7)
+        self.assertEqual(reader.read(), 'content')
+        reader = HashingReader(BytesIO('content'), limit=6)
+        self.assertRaises(UploadTooLarge, reader.read)
+
+    def test_upload_failed_save(self):
+        attachments = self.db.get(self.auction_id).get('_attachments', {})
+        error = ModelValidationError({'documents': [u'Failed']})
+        with mock.patch.object(DGFOtherAssets, 'store', side_effect=error):
+            response = self.app.post('/auctions/{}/documents'.format(
+                self.auction_id), upload_files=[('file', u'укр.doc', 'content')], status=422)
+        self.assertEqual(response.json['errors'], [
+            {u'description': [u'Failed'], u'location': u'body', u'name': u'documents'}
+        ])
+        auction = self.db.get(self.auction_id)
+        self.assertNotIn('documents', auction)
+        self.assertEqual(auction.get('_attachments', {}), attachments)
+
+        response = self.app.post('/auctions/{}/documents'.format(
+            self.auction_id), upload_files=[('file', u'укр.doc', 'content')])
+        self.assertEqual(response.status, '201 Created')
+        if not self.docservice:
+            key = response.json["data"]["url"].split('?')[-1].split('=')[-1]
+            self.assertIn('{}_{}'.format(response.json["data"]["id"], key), self.db.get(self.auction_id)['_attachments'])
+
 
 class AuctionDocumentWithDSResourceTest(AuctionDocumentResourceTest):
     docservice = True
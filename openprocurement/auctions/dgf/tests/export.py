@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from openprocurement.auctions.dgf.export import export_auctions, public_auctions, read_column
+from openprocurement.auctions.dgf.tests.base import (
+    BaseAuctionWebTest, test_financial_auction_data, test_financial_organization
+)
+
+
+class ExportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_chunks(self):
+        auctions = [
+            {
+                'id': 'auction{}'.format(i),
+                'status': 'active.tendering' if i % 2 else 'complete',
+                'value': {'amount': i * 10.5, 'currency': u'UAH'},
+                'dateModified': '2016-01-01T00:00:{:02d}+02:00'.format(i),
+                'items': [{'id': 'item{}'.format(i), 'classification': {'id': u'06000000-2'}, 'quantity': i}],
+            }
+            for i in range(5)
+        ]
+        auctions.append({'id': u'аукціон', 'items': [{'id': 'item5', 'quantity': 2 ** 40}]})
+        self.assertEqual(export_auctions(iter(auctions), self.path, chunk_size=2), 6)
+
+        with open(os.path.join(self.path, 'manifest.json')) as f:
+            manifest = json.load(f)
+        self.assertEqual([i['rows'] for i in manifest['tables']['auctions']['chunks']], [2, 2, 2])
+        self.assertEqual([i['rows'] for i in manifest['tables']['items']['chunks']], [2, 2, 2])
+        self.assertEqual(manifest['tables']['bids']['chunks'], [])
+
+        self.assertEqual(sum(read_column(self.path, 'auctions', 'id'), []), [i['id'] for i in auctions])
+        self.assertEqual(sum(read_column(self.path, 'auctions', 'status'), []),
+                         ['complete', 'active.tendering', 'complete', 'active.tendering', 'complete', None])
+        self.assertEqual(sum(read_column(self.path, 'auctions', 'value.amount'), []), [0.0, 10.5, 21.0, 31.5, 42.0, None])
+        self.assertEqual(sum(read_column(self.path, 'auctions', 'dateModified'), [])[:2], [1451599200000, 1451599201000])
+        self.assertIsNone(sum(read_column(self.path, 'auctions', 'numberOfBids'), [])[0])
+        self.assertEqual(sum(read_column(self.path, 'items', 'auction_id'), []), [i['id'] for i in auctions])
+        self.assertEqual(sum(read_column(self.path, 'items', 'quantity'), []), list(range(5)) + [2 ** 40])
+
+
+class AuctionExportTest(BaseAuctionWebTest):
+
+    def setUp(self):
+        super(AuctionExportTest, self).setUp()
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+        super(AuctionExportTest, self).tearDown()
+
+    def test_export(self):
+        response = self.app.get('/auctions/{}'.format(self.auction_id))
+        auction = response.json['data']
+        self.assertEqual(export_auctions(public_auctions(self.db), self.path), 1)
+        self.assertEqual(list(read_column(self.path, 'auctions', 'id')), [[self.auction_id]])
+        self.assertEqual(list(read_column(self.path, 'auctions', 'procurementMethodType')), [[self.initial_data['procurementMethodType']]])
+        self.assertEqual(list(read_column(self.path, 'items', 'classification.id')), [[i['classification']['id'] for i in auction['items']]])
+        self.assertEqual(list(read_column(self.path, 'bids', 'id')), [])
+
+
+class FinancialAuctionExportTest(AuctionExportTest):
+    initial_data = test_financial_auction_data
+    initial_organization = test_financial_organization
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(ExportTest))
+    suite.addTest(unittest.makeSuite(AuctionExportTest))
+    suite.addTest(unittest.makeSuite(FinancialAuctionExportTest))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
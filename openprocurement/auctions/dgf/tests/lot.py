@@ -3,7 +3,10 @@ import unittest
 from copy import deepcopy
 from datetime import timedelta
 
+from mock import Mock
+
 from openprocurement.api.models import get_now
+from openprocurement.auctions.dgf.lots import LotIndex
 from openprocurement.auctions.dgf.tests.base import BaseWebTest, BaseAuctionWebTest, test_auction_data, test_lots, test_financial_auction_data, test_financial_bids, test_financial_organization
 
 
@@ -1774,12 +1777,36 @@ class FinancialAuctionLotProcessTest(AuctionLotProcessTest):
 
 
 
+class LotIndexTest(unittest.TestCase):
+
+    def test_lot_maps(self):
+        lots = [Mock(id='l1'), Mock(id='l2')]
+        items = [Mock(id='i1', relatedLot='l1'), Mock(id='i2', relatedLot='l2'), Mock(id='i3', relatedLot='l1')]
+        auction = Mock(lots=lots, awards=[], items=items, complaints=[])
+        index = LotIndex()
+        self.assertIs(index.get(auction, 'lots')['l2'], lots[1])
+        self.assertEqual(index.get(auction, 'lot_items')['l1'], [items[0], items[2]])
+        self.assertEqual(index.get(auction, 'awards'), {})
+        self.assertEqual(index.get(auction, 'lot_complaints'), {})
+
+        lot_items = index.get(auction, 'lot_items')
+        self.assertIs(index.get(auction, 'lot_items'), lot_items)
+        lot_complaints = index.get(auction, 'lot_complaints')
+        self.assertIs(index.get(auction, 'lot_complaints'), lot_complaints)
+        items.append(Mock(id='i4', relatedLot='l2'))
+        self.assertEqual(index.get(auction, 'lot_items')['l2'], [items[1], items[3]])
+
+        auction.lots = [lots[0]]
+        self.assertNotIn('l2', index.get(auction, 'lots'))
+
+
 def suite():
     suite = unittest.TestSuite()
     suite.addTest(unittest.makeSuite(AuctionLotResourceTest))
     suite.addTest(unittest.makeSuite(AuctionLotBidderResourceTest))
     suite.addTest(unittest.makeSuite(AuctionLotFeatureBidderResourceTest))
     suite.addTest(unittest.makeSuite(AuctionLotProcessTest))
+    suite.addTest(unittest.makeSuite(LotIndexTest))
     suite.addTest(unittest.makeSuite(FinancialAuctionLotResourceTest))
     suite.addTest(unittest.makeSuite(FinancialAuctionLotBidderResourceTest))
     suite.addTest(unittest.makeSuite(FinancialAuctionLotFeatureBidderResourceTest))
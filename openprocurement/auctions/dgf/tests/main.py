@@ -2,7 +2,7 @@
 
 import unittest
 
-from openprocurement.auctions.dgf.tests import auction, award, bidder, document, tender, question, complaint
+from openprocurement.auctions.dgf.tests import auction, award, bidder, business_dates, codes, document, tender, question, complaint, export, migration
 
 
 def suite():
@@ -10,8 +10,11 @@ def suite():
     suite.addTest(auction.suite())
     suite.addTest(award.suite())
     suite.addTest(bidder.suite())
+    suite.addTest(business_dates.suite())
+    suite.addTest(codes.suite())
     suite.addTest(complaint.suite())
     suite.addTest(document.suite())
+    suite.addTest(export.suite())
     suite.addTest(migration.suite())
     suite.addTest(question.suite())
     suite.addTest(tender.suite())
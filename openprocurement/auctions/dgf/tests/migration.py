@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from openprocurement.auctions.dgf.migration import migrate_data, get_db_schema_version, set_db_schema_version, SCHEMA_VERSION
+from openprocurement.auctions.dgf.tests.base import (
+    BaseWebTest, BaseAuctionWebTest, test_financial_auction_data, test_financial_organization
+)
+
+
+class MigrateTest(BaseWebTest):
+
+    def setUp(self):
+        super(MigrateTest, self).setUp()
+        migrate_data(self.app.app.registry)
+
+    def test_migrate(self):
+        self.assertEqual(get_db_schema_version(self.db), SCHEMA_VERSION)
+        migrate_data(self.app.app.registry, 1)
+        self.assertEqual(get_db_schema_version(self.db), SCHEMA_VERSION)
+
+
+class MigrateComplaintSequenceTest(BaseAuctionWebTest):
+
+    def test_migrate_from0to1(self):
+        for i in range(2):
+            response = self.app.post_json('/auctions/{}/complaints'.format(
+                self.auction_id), {'data': {'title': 'complaint title', 'description': 'complaint description', 'author': self.initial_organization}})
+            self.assertEqual(response.status, '201 Created')
+        auction = self.db.get(self.auction_id)
+        del auction['complaintSequence']
+        self.db.save(auction)
+
+        set_db_schema_version(self.db, 0)
+        migrate_data(self.app.app.registry, 1)
+        self.assertEqual(get_db_schema_version(self.db), 1)
+        auction = self.db.get(self.auction_id)
+        self.assertEqual(auction['complaintSequence'], 2)
+
+        response = self.app.post_json('/auctions/{}/complaints'.format(
+            self.auction_id), {'data': {'title': 'complaint title', 'description': 'complaint description', 'author': self.initial_organization}})
+        self.assertTrue(response.json['data']['complaintID'].endswith('3'))
+
+
+class FinancialMigrateComplaintSequenceTest(MigrateComplaintSequenceTest):
+    initial_data = test_financial_auction_data
+    initial_organization = test_financial_organization
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(MigrateTest))
+    suite.addTest(unittest.makeSuite(MigrateComplaintSequenceTest))
+    suite.addTest(unittest.makeSuite(FinancialMigrateComplaintSequenceTest))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
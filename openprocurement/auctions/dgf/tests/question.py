@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import unittest
 
+from jsonpatch import apply_patch
+
 from openprocurement.auctions.dgf.tests.base import BaseAuctionWebTest, test_lots, test_financial_auction_data, test_financial_organization
 
 
@@ -161,6 +163,26 @@ class AuctionQuestionResourceTest(BaseAuctionWebTest):
         self.assertEqual(response.content_type, 'application/json')
         self.assertEqual(response.json['errors'][0]["description"], "Can add question only in enquiryPeriod")
 
+    def test_patch_auction_question_revision(self):
+        response = self.app.post_json('/auctions/{}/questions'.format(
+            self.auction_id), {'data': {'title': 'question title', 'description': 'question description', 'author': self.initial_organization}})
+        self.assertEqual(response.status, '201 Created')
+        question = response.json['data']
+        before = self.db.get(self.auction_id)
+
+        response = self.app.patch_json('/auctions/{}/questions/{}'.format(self.auction_id, question['id']), {"data": {"answer": "answer"}})
+        self.assertEqual(response.status, '200 OK')
+        after = self.db.get(self.auction_id)
+        changes = after['revisions'][-1]['changes']
+        self.assertIn({u'op': u'remove', u'path': u'/questions/0/answer'}, changes)
+        changes = [i for i in changes if i['path'].startswith('/questions/')]
+        self.assertEqual(apply_patch({'questions': after['questions']}, changes), {'questions': before['questions']})
+        self.assertNotEqual(after['dateModified'], before['dateModified'])
+
+        response = self.app.patch_json('/auctions/{}/questions/{}'.format(self.auction_id, question['id']), {"data": {"answer": "answer"}})
+        self.assertEqual(response.status, '200 OK')
+        self.assertEqual(self.db.get(self.auction_id)['_rev'], after['_rev'])
+
     def test_patch_auction_question(self):
         response = self.app.post_json('/auctions/{}/questions'.format(
             self.auction_id), {'data': {'title': 'question title', 'description': 'question description', 'author': self.initial_organization}})
@@ -1,12 +1,23 @@
 # -*- coding: utf-8 -*-
 import unittest
+import zlib
+from base64 import b64encode
 from copy import deepcopy
-from datetime import timedelta
+from datetime import datetime, timedelta
+from decimal import Decimal
 from uuid import uuid4
 
+from schematics.exceptions import ModelConversionError
 from openprocurement.api.utils import ROUTE_PREFIX
 from openprocurement.api.models import get_now, SANDBOX_MODE
 from openprocurement.auctions.dgf.models import DGFOtherAssets, DGFFinancialAssets
+from openprocurement.auctions.dgf.chronograph import MODELS
+from openprocurement.auctions.dgf.design import CHANGES_FILTER
+from openprocurement.auctions.dgf.lazy import Pending
+from openprocurement.auctions.dgf.renderers import JSONRenderer
+from openprocurement.auctions.dgf.serializers import serialize_role
+from openprocurement.auctions.dgf.storage import STORAGE, decode
+from openprocurement.auctions.dgf.warmer import CacheWarmer
 from openprocurement.auctions.dgf.tests.base import test_auction_data, test_financial_auction_data, test_organization, test_financial_organization, BaseWebTest, BaseAuctionWebTest
 
 
@@ -1090,6 +1101,257 @@ class AuctionResourceTest(BaseWebTest):
         self.assertEqual(response.json['data'], auction)
         self.assertEqual(response.json['data']['dateModified'], dateModified)
 
+    def test_serialization_cache(self):
+        cache = self.app.app.registry.serialization_cache
+        response = self.app.post_json('/auctions', {'data': self.initial_data})
+        self.assertEqual(response.status, '201 Created')
+        auction = response.json['data']
+
+        hits, misses = cache.hits, cache.misses
+        response = self.app.get('/auctions/{}'.format(auction['id']))
+        self.assertEqual(response.json['data'], auction)
+        self.assertEqual((cache.hits, cache.misses), (hits, misses + 1))
+        response = self.app.get('/auctions/{}'.format(auction['id']))
+        self.assertEqual(response.json['data'], auction)
+        self.assertEqual((cache.hits, cache.misses), (hits + 1, misses + 1))
+
+        response = self.app.patch_json('/auctions/{}'.format(
+            auction['id']), {'data': {'procurementMethodRationale': 'Open'}})
+        self.assertEqual(response.status, '200 OK')
+        auction = response.json['data']
+        response = self.app.get('/auctions/{}'.format(auction['id']))
+        self.assertEqual(response.json['data'], auction)
+        self.assertEqual((cache.hits, cache.misses), (hits + 1, misses + 2))
+
+    def test_json_renderer(self):
+        response = self.app.post_json('/auctions', {'data': self.initial_data})
+        self.assertEqual(response.status, '201 Created')
+        auction = response.json['data']
+
+        response = self.app.get('/auctions/{}'.format(auction['id']))
+        self.assertEqual(response.content_type, 'application/json')
+        self.assertEqual(response.charset, 'UTF-8')
+        self.assertIn(self.initial_data['title'].encode('utf-8'), response.body)
+        self.assertNotIn('\\u', response.body)
+        self.assertEqual(response.json['data'], auction)
+
+        renderer = JSONRenderer('json')
+        self.assertEqual(renderer.encode({'amount': Decimal('1.5'), 'date': datetime(2016, 1, 1), 'title': u'футляри'}),
+                         u'{"amount":1.5,"date":"2016-01-01T00:00:00","title":"футляри"}'.encode('utf-8'))
+        self.assertEqual(JSONRenderer('unknown').name, 'json')
+
+    def test_compiled_serializers(self):
+        response = self.app.post_json('/auctions', {'data': self.initial_data})
+        self.assertEqual(response.status, '201 Created')
+        doc = self.db.get(response.json['data']['id'])
+        auction = MODELS[doc['procurementMethodType']](doc)
+        for role in auction._options.roles:
+            self.assertEqual(serialize_role(auction, role), auction.serialize(role))
+        for item in auction.items:
+            self.assertEqual(serialize_role(item, 'view'), item.serialize('view'))
+        self.assertRaises(ValueError, serialize_role, auction, 'unknown')
+
+    def test_lazy_fields(self):
+        response = self.app.post_json('/auctions', {'data': self.initial_data})
+        self.assertEqual(response.status, '201 Created')
+        auction_id = response.json['data']['id']
+        bid = {'tenderers': [self.initial_organization], "value": {"amount": 500}, 'qualified': True}
+        if self.initial_organization == test_financial_organization:
+            bid['eligible'] = True
+        response = self.app.post_json('/auctions/{}/bids'.format(auction_id), {'data': bid})
+        self.assertEqual(response.status, '201 Created')
+
+        doc = self.db.get(auction_id)
+        model = MODELS[doc['procurementMethodType']]
+        auction = model(doc)
+        self.assertIsInstance(auction._data['bids'], Pending)
+        self.assertEqual(auction.bids[0].id, response.json['data']['id'])
+        self.assertNotIsInstance(auction._data['bids'], Pending)
+
+        eager = model(dict((k, v) for k, v in doc.items() if k != '_rev'))
+        eager._rev = doc['_rev']
+        self.assertNotIsInstance(eager._data['bids'], Pending)
+        self.assertEqual(model(doc).serialize('plain'), eager.serialize('plain'))
+        self.assertEqual(serialize_role(model(doc), 'view'), eager.serialize('view'))
+        auction = model(doc)
+        auction.validate()
+        self.assertNotIsInstance(auction._data['bids'], Pending)
+
+    def test_revision_history(self):
+        settings = self.app.app.registry.settings
+        self.addCleanup(settings.pop, 'dgf.revisions_window', None)
+        settings['dgf.revisions_window'] = '2'
+        response = self.app.post_json('/auctions', {'data': self.initial_data})
+        self.assertEqual(response.status, '201 Created')
+        auction = response.json['data']
+        states = [auction]
+        for i in range(4):
+            response = self.app.patch_json('/auctions/{}'.format(
+                auction['id']), {'data': {'procurementMethodRationale': 'rationale {}'.format(i)}})
+            self.assertEqual(response.status, '200 OK')
+            states.append(response.json['data'])
+        auction = response.json['data']
+
+        doc = self.db.get(auction['id'])
+        self.assertEqual(len(doc['revisions']), 3)
+        self.assertIn('revisions-00000000-00000001.json.gz', doc['_attachments'])
+
+        response = self.app.get('/auctions/{}/history'.format(auction['id']))
+        self.assertEqual(response.status, '200 OK')
+        self.assertEqual([i['revision'] for i in response.json['data']], [1, 2, 3, 4, 5])
+        self.assertEqual(response.json['data'][-1]['date'], doc['revisions'][-1]['date'])
+        dates = [i['date'] for i in response.json['data']]
+
+        response = self.app.get('/auctions/{}/history/5'.format(auction['id']))
+        historic = response.json['data']
+        self.assertEqual(historic['dateModified'], doc['revisions'][-1]['date'])
+        historic.pop('dateModified')
+        self.assertEqual(historic, dict((k, v) for k, v in auction.items() if k != 'dateModified'))
+        for number in range(4, 0, -1):
+            response = self.app.get('/auctions/{}/history/{}'.format(auction['id'], number))
+            self.assertEqual(response.status, '200 OK')
+            historic = response.json['data']
+            self.assertEqual(historic.pop('dateModified'), dates[number - 1])
+            self.assertEqual(historic, dict((k, v) for k, v in states[number - 1].items() if k != 'dateModified'))
+
+        for number in ['0', '6', 'last']:
+            response = self.app.get('/auctions/{}/history/{}'.format(auction['id'], number), status=404)
+            self.assertEqual(response.json['errors'], [
+                {u'description': u'Not Found', u'location': u'url', u'name': u'revision'}
+            ])
+
+    def test_storage_codec(self):
+        self.addCleanup(STORAGE.configure, None)
+        STORAGE.configure('zlib', 0)
+        response = self.app.post_json('/auctions', {'data': self.initial_data})
+        self.assertEqual(response.status, '201 Created')
+        auction = response.json['data']
+        response = self.app.patch_json('/auctions/{}'.format(
+            auction['id']), {'data': {'procurementMethodRationale': 'Open'}})
+        self.assertEqual(response.status, '200 OK')
+        auction = response.json['data']
+
+        doc = self.db.get(auction['id'])
+        self.assertEqual(doc['compressedData']['codec'], 'zlib')
+        self.assertNotIn('revisions', doc)
+        self.assertNotIn('description', doc['items'][0])
+        self.assertEqual(len(decode(doc)['revisions']), 2)
+        self.assertEqual(decode(doc)['items'][0]['description'], auction['items'][0]['description'])
+        response = self.app.get('/auctions/{}'.format(auction['id']))
+        self.assertEqual(response.json['data'], auction)
+
+        STORAGE.configure(None)
+        response = self.app.patch_json('/auctions/{}'.format(
+            auction['id']), {'data': {'procurementMethodRationale': 'Open auction'}})
+        self.assertEqual(response.status, '200 OK')
+        doc = self.db.get(auction['id'])
+        self.assertNotIn('compressedData', doc)
+        self.assertEqual(len(doc['revisions']), 3)
+
+    def test_storage_codec_client_data(self):
+        self.addCleanup(STORAGE.configure, None)
+        STORAGE.configure('zlib', 0)
+        bomb = {'codec': 'zlib', 'data': b64encode(zlib.compress(b'[' + b'0,' * 10 ** 6 + b'0]'))}
+        data = dict(self.initial_data, compressedData=bomb)
+        response = self.app.post_json('/auctions', {'data': data})
+        self.assertEqual(response.status, '201 Created')
+        doc = self.db.get(response.json['data']['id'])
+        self.assertNotEqual(doc.get('compressedData'), bomb)
+
+        for compressed in [bomb, {'codec': 'zlib', 'data': '!'}, {'codec': 'unknown', 'data': ''}, 'data']:
+            response = self.app.post_json('/auctions', {'data': dict(self.initial_data, _rev='1-a', compressedData=compressed)}, status=422)
+            self.assertEqual(response.status, '422 Unprocessable Entity')
+            self.assertEqual(response.json['errors'], [
+                {u'description': [u'Invalid compressed data'], u'location': u'body', u'name': u'compressedData'}
+            ])
+        large = {'codec': 'zlib', 'data': b64encode(zlib.compress(b'[[["title"],"' + b'0' * 2000 + b'"]]'))}
+        self.assertEqual(len(decode({'_rev': '1-a', 'compressedData': large})['title']), 2000)
+        STORAGE.configure('zlib', 0, 1000)
+        self.assertRaises(ModelConversionError, decode, {'_rev': '1-a', 'compressedData': large})
+
+    def test_opt_fields(self):
+        response = self.app.post_json('/auctions', {'data': self.initial_data})
+        self.assertEqual(response.status, '201 Created')
+        auction = response.json['data']
+
+        response = self.app.get('/auctions/{}?opt_fields=status,next_check,items.classification,value,unknown'.format(auction['id']))
+        self.assertEqual(response.status, '200 OK')
+        self.assertEqual(set(response.json['data']), set(['status', 'next_check', 'items', 'value']))
+        self.assertEqual(response.json['data']['next_check'], auction['next_check'])
+        self.assertEqual(response.json['data']['value'], auction['value'])
+        self.assertEqual(response.json['data']['items'], [{'classification': i['classification']} for i in auction['items']])
+
+        response = self.app.get('/auctions/{}?opt_fields=items,items.classification'.format(auction['id']))
+        self.assertEqual(response.json['data'], {'items': auction['items']})
+
+        response = self.app.get('/auctions/{}/questions?opt_fields=id'.format(auction['id']))
+        self.assertEqual(response.json['data'], [])
+
+    def test_cache_warmer(self):
+        cache = self.app.app.registry.serialization_cache
+        warmer = CacheWarmer(self.db, cache)
+        warmer.poll()
+        since = warmer.since
+        self.db.save({'doc_type': 'Auction', 'procurementMethodType': 'belowThreshold'})
+        response = self.app.post_json('/auctions', {'data': self.initial_data})
+        self.assertEqual(response.status, '201 Created')
+        auction = response.json['data']
+        changes = self.db.changes(since=since, filter=CHANGES_FILTER)
+        self.assertEqual([i['id'] for i in changes['results']], [auction['id']])
+
+        warmer.poll()
+        self.assertEqual(warmer.warmed, 1)
+        hits, misses = cache.hits, cache.misses
+        response = self.app.get('/auctions/{}'.format(auction['id']))
+        self.assertEqual(response.json['data'], auction)
+        self.assertEqual((cache.hits, cache.misses), (hits + 1, misses))
+
+        response = self.app.patch_json('/auctions/{}'.format(
+            auction['id']), {'data': {'procurementMethodRationale': 'Open'}})
+        self.assertEqual(response.status, '200 OK')
+        auction = response.json['data']
+        warmer.poll()
+        self.assertEqual(warmer.warmed, 2)
+        response = self.app.get('/auctions/{}'.format(auction['id']))
+        self.assertEqual(response.json['data'], auction)
+        self.assertEqual((cache.hits, cache.misses), (hits + 2, misses))
+
+        warmer.warm({'id': auction['id'], 'deleted': True})
+        self.assertEqual(warmer.warmed, 2)
+        self.assertNotIn(auction['id'], cache._auctions)
+
+    def test_conditional_get(self):
+        response = self.app.post_json('/auctions', {'data': self.initial_data})
+        self.assertEqual(response.status, '201 Created')
+        auction = response.json['data']
+
+        response = self.app.get('/auctions/{}'.format(auction['id']))
+        self.assertEqual(response.status, '200 OK')
+        etag = response.headers['ETag']
+
+        response = self.app.get('/auctions/{}'.format(auction['id']), headers={'If-None-Match': etag}, status=304)
+        self.assertEqual(response.status, '304 Not Modified')
+        self.assertEqual(response.headers['ETag'], etag)
+        self.assertEqual(response.body, '')
+
+        response = self.app.get('/auctions/{}?opt_pretty=1'.format(auction['id']), headers={'If-None-Match': etag})
+        self.assertEqual(response.status, '200 OK')
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+        response = self.app.get('/auctions/{}/documents'.format(auction['id']))
+        self.assertEqual(response.status, '200 OK')
+        documents_etag = response.headers['ETag']
+        self.assertNotEqual(documents_etag, etag)
+        response = self.app.get('/auctions/{}/documents'.format(auction['id']), headers={'If-None-Match': documents_etag}, status=304)
+        self.assertEqual(response.status, '304 Not Modified')
+
+        response = self.app.patch_json('/auctions/{}'.format(
+            auction['id']), {'data': {'procurementMethodRationale': 'Open'}})
+        self.assertEqual(response.status, '200 OK')
+        response = self.app.get('/auctions/{}'.format(auction['id']), headers={'If-None-Match': etag})
+        self.assertEqual(response.status, '200 OK')
+        self.assertNotEqual(response.headers['ETag'], etag)
+
     def test_auction_not_found(self):
         response = self.app.get('/auctions')
         self.assertEqual(response.status, '200 OK')
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Revision changes of a sub-resource PATCH without serializing the auction.
+
+A PATCH of a lot, question, bid or document only changes that object and
+the computed fields (serializables) of the models above it. ``tracked_parts``
+finds where the object lives in the auction and serializes just it and
+those computed fields; ``revision_changes`` diffs them against the same
+parts of ``auction_src``, giving the changes a diff of two plain
+serializations of the whole auction would record. Objects it cannot place
+(a new object, a broken ``__parent__`` chain, a moved index) give None and
+the caller diffs the whole auction as before.
+"""
+from copy import deepcopy
+
+from schematics.models import Model
+from openprocurement.api.utils import get_revision_changes
+from openprocurement.auctions.dgf.conflicts import join_pointer
+from openprocurement.auctions.dgf.serializers import compiled
+
+ROLE = 'plain'
+
+
+def computed_fields(cls):
+    """Names of the serializables of ``cls`` that are not stored fields."""
+    return set(i for i in cls._serializables if i not in cls._fields)
+
+
+def locate(auction, obj):
+    """``(model, tokens)`` for ``obj`` and each model above it in ``auction``.
+
+    ``tokens`` are the JSON pointer tokens of the model in the auction. The
+    ``__parent__`` links set by traversal are followed and only lists already
+    converted are searched, so lazy lists stay lazy. Returns None if ``obj``
+    is not linked to ``auction``.
+    """
+    models = [obj]
+    steps = []
+    while obj is not auction:
+        parent = getattr(obj, '__parent__', None)
+        if not isinstance(parent, Model):
+            return None
+        for name, value in parent._data.items():
+            field = parent._fields.get(name)
+            if field is None:
+                continue
+            if value is obj:
+                steps.append([field.serialized_name or name])
+                break
+            if isinstance(value, list):
+                index = next((i for i, item in enumerate(value) if item is obj), None)
+                if index is not None:
+                    steps.append([field.serialized_name or name, str(index)])
+                    break
+        else:
+            return None
+        models.append(parent)
+        obj = parent
+    chain = []
+    tokens = []
+    for model, step in zip(reversed(models), [[]] + steps[::-1]):
+        tokens = tokens + step
+        chain.append((model, tokens))
+    chain.reverse()
+    return chain
+
+
+def resolve(data, tokens):
+    for token in tokens:
+        if isinstance(data, list):
+            index = int(token)
+            data = data[index] if index < len(data) else None
+        elif isinstance(data, dict):
+            data = data.get(token)
+        else:
+            return None
+    return data
+
+
+def tracked_parts(auction, obj, src):
+    """The parts of ``src`` (the plain source of ``auction``) changed through ``obj``.
+
+    Returns ``(tokens, new, old)`` for ``obj`` and for the computed fields of
+    each model above it, or None if ``obj`` cannot be placed in ``src``. Only
+    valid when nothing but ``obj`` was modified since ``src`` was taken.
+    """
+    if obj is None or obj is auction:
+        return None
+    chain = locate(auction, obj)
+    if chain is None:
+        return None
+    tokens = chain[0][1]
+    old = resolve(src, tokens)
+    shaped = compiled(obj.__class__, ROLE)
+    if not isinstance(old, dict) or shaped.fields is None or old.get('id') != getattr(obj, 'id', None):
+        return None
+    parts = [(tokens, shaped.export(obj) or {}, old)]
+    for parent, tokens in chain[1:]:
+        names = computed_fields(parent.__class__)
+        if not names:
+            continue
+        shaped = compiled(parent.__class__, ROLE)
+        if shaped.fields is None:
+            return None
+        keys = set(i[1] for i in shaped.fields if i[0] in names)
+        old = dict((k, v) for k, v in (resolve(src, tokens) or {}).items() if k in keys)
+        parts.append((tokens, shaped.export(parent, names) or {}, old))
+    return parts
+
+
+def revision_changes(parts):
+    """What ``get_revision_changes(dst, src)`` returns for the changed ``parts``."""
+    changes = []
+    for tokens, new, old in parts:
+        prefix = join_pointer(tokens)
+        for operation in get_revision_changes(new, old):
+            operation['path'] = prefix + operation['path']
+            if 'from' in operation:
+                operation['from'] = prefix + operation['from']
+            changes.append(operation)
+    return changes
+
+
+def replay(src, parts):
+    """The plain serialization being saved: ``src`` with the changed ``parts``."""
+    dst = deepcopy(src)
+    for tokens, new, old in parts:
+        target = resolve(dst, tokens)
+        for key in old:
+            if key not in new:
+                del target[key]
+        target.update(deepcopy(new))
+    return dst
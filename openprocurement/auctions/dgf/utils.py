@@ -1,11 +1,204 @@
 # -*- coding: utf-8 -*-
+from functools import partial
+from logging import getLogger
+
+from couchdb.http import ResourceConflict
+from schematics.exceptions import ModelValidationError
+from openprocurement.api.models import get_now
 from openprocurement.api.utils import (
-    upload_file as base_upload_file, get_file as base_get_file,
-    DOCUMENT_BLACKLISTED_FIELDS,
+    upload_file as base_upload_file, get_file as base_get_file, json_view as base_json_view,
+    DOCUMENT_BLACKLISTED_FIELDS, apply_data_patch, context_unpack,
+    get_revision_changes, set_modetest_titles,
+)
+from openprocurement.auctions.dgf.conflicts import (
+    DEFAULT_CONFLICT_RETRIES, STATS as CONFLICT_STATS, merge_conflict,
 )
+from openprocurement.auctions.dgf.files import stream_attachment, stream_upload
+from openprocurement.auctions.dgf.history import compact_revisions
+from openprocurement.auctions.dgf.projection import parse_fields, project
+from openprocurement.auctions.dgf.serializers import serialize_role
+from openprocurement.auctions.dgf.tracking import replay, revision_changes, tracked_parts
+
+LOGGER = getLogger(__name__)
+json_view = partial(base_json_view, renderer='dgf_json')
+
+
+def save_auction(request, changed=None):
+    """Store the validated auction, replaying the request on revision conflicts.
+
+    Up to ``dgf.conflict_retries`` times a conflicting save is merged onto
+    the current document (see ``conflicts``) and retried. Old revisions are
+    archived past ``dgf.revisions_window`` (see ``history``). Attachments
+    streamed by the request are only kept if the save succeeds (see
+    ``files.discard_uploads``). ``changed`` is the only object the request
+    modified, if known; its revision changes are then worked out without
+    serializing the whole auction (see ``tracking``).
+    """
+    auction = request.validated['auction']
+    if auction.mode == u'test':
+        set_modetest_titles(auction)
+        changed = None
+    retries = int(request.registry.settings.get('dgf.conflict_retries', DEFAULT_CONFLICT_RETRIES))
+    window = int(request.registry.settings.get('dgf.revisions_window', 0))
+    attempt = 0
+    while True:
+        src = request.validated['auction_src']
+        parts = tracked_parts(auction, changed, src)
+        if parts is None:
+            dst = auction.serialize("plain")
+            patch = get_revision_changes(dst, src)
+        else:
+            dst = None
+            patch = revision_changes(parts)
+        old_dateModified = auction.dateModified
+        if not add_revision(request, auction, patch):
+            return
+        compact_revisions(auction, window)
+        CONFLICT_STATS.saves += 1
+        try:
+            auction.store(request.registry.db)
+        except ModelValidationError as e:
+            for i in e.message:
+                request.errors.add('body', i, e.message[i])
+            request.errors.status = 422
+            return
+        except ResourceConflict as e:
+            CONFLICT_STATS.conflicts += 1
+            if attempt < retries:
+                merged = merge_conflict(request, auction, dst if dst is not None else replay(src, parts))
+            else:
+                merged = None
+            if merged is None:
+                CONFLICT_STATS.failed += 1
+                LOGGER.warning('Conflict saving auction {} after {} retries'.format(auction.id, attempt),
+                               extra=context_unpack(request, {'MESSAGE_ID': 'save_auction_conflict'}, {'RETRIES': attempt}))
+                request.errors.add('body', 'data', str(e))
+                request.errors.status = 409
+                return
+            attempt += 1
+            CONFLICT_STATS.retries += 1
+            auction, request.validated['auction_src'] = merged
+            changed = None
+            request.validated['auction'] = auction
+            reallocate_complaint_ids(request, auction)
+        except Exception as e:  # pragma: no cover
+            request.errors.add('body', 'data', str(e))
+            return
+        else:
+            if attempt:
+                CONFLICT_STATS.merged += 1
+            LOGGER.info('Saved auction {}: dateModified {} -> {}'.format(auction.id, old_dateModified and old_dateModified.isoformat(), auction.dateModified.isoformat()),
+                        extra=context_unpack(request, {'MESSAGE_ID': 'save_auction'}, {'RESULT': auction.rev, 'RETRIES': attempt}))
+            request.validated.pop('uploads', None)
+            invalidate_cached(request, auction.id)
+            return True
+
+
+def add_revision(request, auction, patch):
+    """Record ``patch``, the changes back to ``auction_src``, as a revision of ``auction``.
+
+    Returns False if there are no changes to save.
+    """
+    if not patch:
+        return False
+    auction.revisions.append(type(auction).revisions.model_class({'author': request.authenticated_userid, 'changes': patch, 'rev': auction.rev}))
+    if getattr(auction, 'modified', True):
+        auction.dateModified = get_now()
+    return True
+
+
+def invalidate_cached(request, auction_id):
+    cache = getattr(request.registry, 'serialization_cache', None)
+    if cache is not None:
+        cache.invalidate(auction_id)
+
+
+def allocate_complaint_id(request, complaint):
+    """Give a new complaint the next complaintID of the validated auction."""
+    auction = request.validated['auction']
+    complaint.complaintID = auction.next_complaint_id(request.registry.server_id)
+    request.validated.setdefault('allocated_complaints', []).append(complaint.id)
+
+
+def saved_complaint(request, complaint):
+    """``complaint`` as saved, from the auction a conflict merge may have replaced (see ``save_auction``)."""
+    auction = request.validated['auction']
+    complaints = list(auction.complaints)
+    for award in auction.awards:
+        complaints.extend(award.complaints)
+    return next((i for i in complaints if i.id == complaint.id), complaint)
+
+
+def reallocate_complaint_ids(request, auction):
+    """Number again the complaints this request created, after a conflict merge.
+
+    The sequence is not merged (see ``conflicts``), so ``auction`` carries
+    the value stored by the concurrent writer and the allocation continues
+    from there.
+    """
+    allocated = request.validated.get('allocated_complaints')
+    if not allocated:
+        return
+    complaints = dict([(i.id, i) for i in auction.complaints])
+    for award in auction.awards:
+        complaints.update([(i.id, i) for i in award.complaints])
+    if auction.complaintSequence is None:
+        auction.complaintSequence = len(complaints) - len([i for i in allocated if i in complaints])
+    for complaint_id in allocated:
+        if complaint_id in complaints:
+            complaints[complaint_id].complaintID = auction.next_complaint_id(request.registry.server_id)
+
+
+def apply_patch(request, data=None, save=True, src=None):
+    data = request.validated['data'] if data is None else data
+    patch = data and apply_data_patch(src or request.context.serialize(), data)
+    if patch:
+        request.context.import_data(patch)
+        request.validated['auction'].invalidate_lot_index()
+        if save:
+            return save_auction(request, changed=request.context)
+
+
+def serialize_cached(request, key, serialize):
+    """Serialize through the worker's serialization cache when it is enabled.
+
+    ``key`` must identify both the object and the role, e.g.
+    ``('lots', 'view')``; the auction revision is added by the cache.
+    """
+    cache = getattr(request.registry, 'serialization_cache', None)
+    if cache is None:
+        return serialize()
+    return cache.get(request.validated['auction'], key, serialize)
+
+
+def serialize_view(request, key, data, role):
+    """Serialize ``data``, a model or a list of models, with ``role``.
+
+    With ``?opt_fields`` only the listed fields are serialized (see
+    ``projection``); full views go through the serialization cache under
+    ``key`` unless it is None.
+    """
+    fields = parse_fields(request.params.get('opt_fields', ''))
+    if fields:
+        if isinstance(data, list):
+            return [project(i, role, fields) for i in data]
+        return project(data, role, fields)
+    if isinstance(data, list):
+        serialize = lambda: [serialize_role(i, role) for i in data]
+    else:
+        serialize = lambda: serialize_role(data, role)
+    if key is None:
+        return serialize()
+    return serialize_cached(request, key, serialize)
 
 
 def upload_file(request, blacklisted_fields=DOCUMENT_BLACKLISTED_FIELDS):
+    """Attach an uploaded document to the auction.
+
+    Uploaded files are streamed into CouchDB attachments unless a document
+    service is configured; JSON registrations of document service files and
+    virtual data rooms are handled as before.
+    """
     first_document = request.validated['documents'][0] if 'documents' in request.validated and request.validated['documents'] else None
     if 'data' in request.validated and request.validated['data']:
         document = request.validated['document']
@@ -15,13 +208,28 @@ def upload_file(request, blacklisted_fields=DOCUMENT_BLACKLISTED_FIELDS):
                     if attr_name not in blacklisted_fields:
                         setattr(document, attr_name, getattr(first_document, attr_name))
             return document
-    return base_upload_file(request, blacklisted_fields)
+        return base_upload_file(request, blacklisted_fields)
+    if getattr(request.registry, 'docservice_url', None):
+        return base_upload_file(request, blacklisted_fields)
+    return stream_upload(request, first_document, blacklisted_fields)
 
 
 def get_file(request):
+    """Serve a document download.
+
+    Files kept as auction attachments are streamed in blocks with Range
+    support; virtual data rooms and files in the document service are
+    redirected to.
+    """
     document = request.validated['document']
     if document.documentType == 'virtualDataRoom':
         request.response.status = '302 Moved Temporarily'
         request.response.location = document.url
         return document.url
-    return base_get_file(request)
+    auction = request.validated['auction']
+    key = request.params.get('download')
+    filename = "{}_{}".format(document.id, key)
+    if not key or filename not in (auction._attachments or {}) or \
+            not any([key in i.url for i in request.validated['documents']]):
+        return base_get_file(request)
+    return stream_attachment(request, auction, document, filename)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+from openprocurement.api.utils import update_logging_context
+from openprocurement.api.validation import (
+    validate_data,
+    validate_file_upload as base_validate_file_upload,
+    validate_file_update as base_validate_file_update,
+)
+from openprocurement.auctions.dgf.files import file_size, upload_too_large
+
+MAX_BIDS_BATCH = 100
+MAX_CHRONOGRAPH_BATCH = 500
+
+
+def validate_bids_batch_data(request):
+    """Validate each bid of a batch the way ``validate_bid_data`` validates one.
+
+    Errors are named after the index of their bid (``data.<index>.<name>``)
+    and any of them rejects the whole batch.
+    """
+    update_logging_context(request, {'bid_id': '__new__'})
+    try:
+        json = request.json_body
+    except ValueError as e:
+        request.errors.add('body', 'data', e.message)
+        request.errors.status = 422
+        return
+    data = json.get('data') if isinstance(json, dict) else None
+    if not isinstance(data, list) or not data:
+        request.errors.add('body', 'data', "Data not available")
+        request.errors.status = 422
+        return
+    if len(data) > MAX_BIDS_BATCH:
+        request.errors.add('body', 'data', "Batch can contain at most {} bids".format(MAX_BIDS_BATCH))
+        request.errors.status = 422
+        return
+    model = type(request.auction).bids.model_class
+    bids = []
+    for index, bid_data in enumerate(data):
+        errors = len(request.errors)
+        if not isinstance(bid_data, dict):
+            request.errors.add('body', 'data', "Data not available")
+            request.errors.status = 422
+        elif validate_data(request, model, data=bid_data) is not None:
+            bids.append(request.validated[model.__name__.lower()])
+        for error in request.errors[errors:]:
+            error['name'] = 'data.{}.{}'.format(index, error['name'])
+    request.validated.pop('data', None)
+    request.validated.pop(model.__name__.lower(), None)
+    if request.errors:
+        return
+    request.validated['bids'] = bids
+    return bids
+
+
+def validate_chronograph_batch_data(request):
+    try:
+        json = request.json_body
+    except ValueError as e:
+        request.errors.add('body', 'data', e.message)
+        request.errors.status = 422
+        return
+    data = json.get('data') if isinstance(json, dict) else None
+    if not isinstance(data, list) or not data or not all([isinstance(i, basestring) and i for i in data]):
+        request.errors.add('body', 'data', "Data should be a list of auction ids")
+        request.errors.status = 422
+        return
+    if len(data) > MAX_CHRONOGRAPH_BATCH:
+        request.errors.add('body', 'data', "Batch can contain at most {} auctions".format(MAX_CHRONOGRAPH_BATCH))
+        request.errors.status = 422
+        return
+    seen = set()
+    auction_ids = [i for i in data if not (i in seen or seen.add(i))]
+    request.validated['auction_ids'] = auction_ids
+    return auction_ids
+
+
+def validate_upload_size(request, validate):
+    """Run ``validate`` unless the upload is over the size limit.
+
+    A plain body is checked by Content-Length before it is read. A multipart
+    body also holds boundaries, part headers and other fields, so there the
+    file spooled by webob is checked instead.
+    """
+    if request.content_type != 'multipart/form-data':
+        if not upload_too_large(request, request.content_length):
+            validate(request)
+        return
+    validate(request)
+    if 'file' in request.validated:
+        upload_too_large(request, file_size(request.validated['file'].file))
+
+
+def validate_file_upload(request):
+    validate_upload_size(request, base_validate_file_upload)
+
+
+def validate_file_update(request):
+    validate_upload_size(request, base_validate_file_update)
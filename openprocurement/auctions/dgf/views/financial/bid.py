@@ -5,6 +5,7 @@ from openprocurement.auctions.core.utils import (
 )
 from openprocurement.auctions.dgf.views.other.bid import (
     AuctionBidResource,
+    AuctionBidsBatchResource,
 )
 
 
@@ -15,3 +16,11 @@ from openprocurement.auctions.dgf.views.other.bid import (
             description="Financial auction bids")
 class FinancialAuctionBidResource(AuctionBidResource):
     pass
+
+
+@opresource(name='Financial Auction Bids Batch',
+            path='/auctions/{auction_id}/bids_batch',
+            auctionsprocurementMethodType="dgfFinancialAssets",
+            description="Batch registration of financial auction bids")
+class FinancialAuctionBidsBatchResource(AuctionBidsBatchResource):
+    pass
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+from openprocurement.auctions.core.utils import (
+    opresource,
+)
+from openprocurement.auctions.dgf.views.other.history import (
+    AuctionHistoryResource,
+)
+
+
+@opresource(name='Financial Auction History',
+            collection_path='/auctions/{auction_id}/history',
+            path='/auctions/{auction_id}/history/{revision}',
+            auctionsprocurementMethodType="dgfFinancialAssets",
+            description="Financial auction revision history")
+class FinancialAuctionHistoryResource(AuctionHistoryResource):
+    pass
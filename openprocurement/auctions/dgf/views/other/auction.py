@@ -1,19 +1,21 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.utils import (
-    json_view,
     context_unpack,
     cleanup_bids_for_cancelled_lots,
     APIResource,
 )
 from openprocurement.auctions.core.utils import (
-    save_auction,
-    apply_patch,
     add_next_award,
     opresource,
 )
 from openprocurement.auctions.core.validation import (
     validate_auction_auction_data,
 )
+from openprocurement.auctions.dgf.utils import (
+    json_view,
+    save_auction,
+    apply_patch,
+)
 
 
 @opresource(name='Auction Auction',
@@ -1,21 +1,24 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.models import STAND_STILL_TIME, get_now
 from openprocurement.api.utils import (
-    json_view,
     context_unpack,
     APIResource,
     calculate_business_date,
 )
 from openprocurement.auctions.core.utils import (
-    apply_patch,
-    save_auction,
-    add_next_award,
     opresource,
 )
 from openprocurement.auctions.core.validation import (
     validate_award_data,
     validate_patch_award_data,
 )
+from openprocurement.auctions.dgf.awarding import apply_award_transition
+from openprocurement.auctions.dgf.utils import (
+    json_view,
+    apply_patch,
+    save_auction,
+    serialize_view,
+)
 
 
 @opresource(name='Auction Awards',
@@ -78,7 +81,8 @@ class AuctionAwardResource(APIResource):
             }
 
         """
-        return {'data': [i.serialize("view") for i in self.request.validated['auction'].awards]}
+        auction = self.request.validated['auction']
+        return {'data': serialize_view(self.request, ('awards', 'view'), auction.awards, 'view')}
 
     @json_view(content_type="application/json", permission='create_award', validators=(validate_award_data,))
     def collection_post(self):
@@ -167,7 +171,7 @@ class AuctionAwardResource(APIResource):
             self.request.errors.status = 403
             return
         award = self.request.validated['award']
-        if any([i.status != 'active' for i in auction.lots if i.id == award.lotID]):
+        if auction.lot_inactive(award.lotID):
             self.request.errors.add('body', 'data', 'Can create award only in active lot status')
             self.request.errors.status = 403
             return
@@ -230,7 +234,7 @@ class AuctionAwardResource(APIResource):
             }
 
         """
-        return {'data': self.request.validated['award'].serialize("view")}
+        return {'data': serialize_view(self.request, None, self.request.validated['award'], 'view')}
 
     @json_view(content_type="application/json", permission='edit_auction', validators=(validate_patch_award_data,))
     def patch(self):
@@ -296,61 +300,13 @@ class AuctionAwardResource(APIResource):
             self.request.errors.status = 403
             return
         award = self.request.context
-        if any([i.status != 'active' for i in auction.lots if i.id == award.lotID]):
+        if auction.lot_inactive(award.lotID):
             self.request.errors.add('body', 'data', 'Can update award only in active lot status')
             self.request.errors.status = 403
             return
         award_status = award.status
         apply_patch(self.request, save=False, src=self.request.context.serialize())
-        if award_status == 'pending' and award.status == 'active':
-            award.complaintPeriod.endDate = get_now()
-            auction.contracts.append(type(auction).contracts.model_class({
-                'awardID': award.id,
-                'suppliers': award.suppliers,
-                'value': award.value,
-                'date': get_now(),
-                'items': [i for i in auction.items if i.relatedLot == award.lotID ],
-                'contractID': '{}-{}{}'.format(auction.auctionID, self.server_id, len(auction.contracts) + 1) }))
-            add_next_award(self.request)
-        elif award_status == 'active' and award.status == 'cancelled':
-            now = get_now()
-            if award.complaintPeriod.endDate > now:
-                award.complaintPeriod.endDate = now
-            for j in award.complaints:
-                if j.status not in ['invalid', 'resolved', 'declined']:
-                    j.status = 'cancelled'
-                    j.cancellationReason = 'cancelled'
-                    j.dateCanceled = now
-            for i in auction.contracts:
-                if i.awardID == award.id:
-                    i.status = 'cancelled'
-            add_next_award(self.request)
-        elif award_status == 'pending' and award.status == 'unsuccessful':
-            award.complaintPeriod.endDate = get_now()
-            add_next_award(self.request)
-        elif award_status == 'unsuccessful' and award.status == 'cancelled' and any([i.status in ['claim', 'answered', 'pending', 'resolved'] for i in award.complaints]):
-            if auction.status == 'active.awarded':
-                auction.status = 'active.qualification'
-                auction.awardPeriod.endDate = None
-            now = get_now()
-            award.complaintPeriod.endDate = now
-            cancelled_awards = []
-            for i in auction.awards[auction.awards.index(award):]:
-                if i.lotID != award.lotID:
-                    continue
-                i.complaintPeriod.endDate = now
-                i.status = 'cancelled'
-                for j in i.complaints:
-                    if j.status not in ['invalid', 'resolved', 'declined']:
-                        j.status = 'cancelled'
-                        j.cancellationReason = 'cancelled'
-                        j.dateCanceled = now
-                cancelled_awards.append(i.id)
-            for i in auction.contracts:
-                if i.awardID in cancelled_awards:
-                    i.status = 'cancelled'
-            add_next_award(self.request)
-        elif self.request.authenticated_role != 'Administrator' and not(award_status == 'pending' and award.status == 'pending'):
+        if not apply_award_transition(self.request, auction, award, award_status) and self.request.authenticated_role != 'Administrator':
             self.request.errors.add('body', 'data', 'Can\'t update award in current ({}) status'.format(award_status))
             self.request.errors.status = 403
             return
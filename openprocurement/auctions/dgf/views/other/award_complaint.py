@@ -2,21 +2,26 @@
 from openprocurement.api.models import get_now
 from openprocurement.api.utils import (
     context_unpack,
-    json_view,
     set_ownership,
     APIResource,
 )
 from openprocurement.auctions.core.utils import (
-    apply_patch,
     check_auction_status,
     opresource,
-    save_auction,
 
 )
 from openprocurement.auctions.core.validation import (
     validate_complaint_data,
     validate_patch_complaint_data,
 )
+from openprocurement.auctions.dgf.utils import (
+    json_view,
+    allocate_complaint_id,
+    apply_patch,
+    save_auction,
+    saved_complaint,
+    serialize_view,
+)
 
 
 @opresource(name='Auction Award Complaints',
@@ -35,7 +40,7 @@ class AuctionAwardComplaintResource(APIResource):
             self.request.errors.add('body', 'data', 'Can\'t add complaint in current ({}) auction status'.format(auction.status))
             self.request.errors.status = 403
             return
-        if any([i.status != 'active' for i in auction.lots if i.id == self.context.lotID]):
+        if auction.lot_inactive(self.context.lotID):
             self.request.errors.add('body', 'data', 'Can add complaint only in active lot status')
             self.request.errors.status = 403
             return
@@ -52,10 +57,11 @@ class AuctionAwardComplaintResource(APIResource):
             complaint.dateSubmitted = get_now()
         else:
             complaint.status = 'draft'
-        complaint.complaintID = '{}.{}{}'.format(auction.auctionID, self.server_id, sum([len(i.complaints) for i in auction.awards], len(auction.complaints)) + 1)
+        allocate_complaint_id(self.request, complaint)
         set_ownership(complaint, self.request)
         self.context.complaints.append(complaint)
         if save_auction(self.request):
+            complaint = saved_complaint(self.request, complaint)
             self.LOGGER.info('Created auction award complaint {}'.format(complaint.id),
                         extra=context_unpack(self.request, {'MESSAGE_ID': 'auction_award_complaint_create'}, {'complaint_id': complaint.id}))
             self.request.response.status = 201
@@ -71,13 +77,13 @@ class AuctionAwardComplaintResource(APIResource):
     def collection_get(self):
         """List complaints for award
         """
-        return {'data': [i.serialize("view") for i in self.context.complaints]}
+        return {'data': serialize_view(self.request, None, self.context.complaints, 'view')}
 
     @json_view(permission='view_auction')
     def get(self):
         """Retrieving the complaint for award
         """
-        return {'data': self.context.serialize("view")}
+        return {'data': serialize_view(self.request, None, self.context, 'view')}
 
     @json_view(content_type="application/json", permission='edit_complaint', validators=(validate_patch_complaint_data,))
     def patch(self):
@@ -88,7 +94,7 @@ class AuctionAwardComplaintResource(APIResource):
             self.request.errors.add('body', 'data', 'Can\'t update complaint in current ({}) auction status'.format(auction.status))
             self.request.errors.status = 403
             return
-        if any([i.status != 'active' for i in auction.lots if i.id == self.request.validated['award'].lotID]):
+        if auction.lot_inactive(self.request.validated['award'].lotID):
             self.request.errors.add('body', 'data', 'Can update complaint only in active lot status')
             self.request.errors.status = 403
             return
@@ -1,23 +1,28 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.utils import (
-    get_file,
-    upload_file,
     update_file_content_type,
-    json_view,
     context_unpack,
     APIResource,
 )
 from openprocurement.api.validation import (
-    validate_file_update,
-    validate_file_upload,
     validate_patch_document_data,
 )
 from openprocurement.auctions.core.utils import (
-    save_auction,
-    apply_patch,
     opresource,
 )
 from openprocurement.api.views.complaint_document import STATUS4ROLE
+from openprocurement.auctions.dgf.documents import documents_collection
+from openprocurement.auctions.dgf.utils import (
+    json_view,
+    save_auction,
+    apply_patch,
+    get_file,
+    upload_file,
+)
+from openprocurement.auctions.dgf.validation import (
+    validate_file_update,
+    validate_file_upload,
+)
 
 
 @opresource(name='Auction Award Complaint Documents',
@@ -30,14 +35,7 @@ class AuctionAwardComplaintDocumentResource(APIResource):
     @json_view(permission='view_auction')
     def collection_get(self):
         """Auction Award Complaint Documents List"""
-        if self.request.params.get('all', ''):
-            collection_data = [i.serialize("view") for i in self.context.documents]
-        else:
-            collection_data = sorted(dict([
-                (i.id, i.serialize("view"))
-                for i in self.context.documents
-            ]).values(), key=lambda i: i['dateModified'])
-        return {'data': collection_data}
+        return documents_collection(self.request, self.context)
 
     @json_view(permission='edit_complaint', validators=(validate_file_upload,))
     def collection_post(self):
@@ -47,7 +45,7 @@ class AuctionAwardComplaintDocumentResource(APIResource):
             self.request.errors.add('body', 'data', 'Can\'t add document in current ({}) auction status'.format(self.request.validated['auction_status']))
             self.request.errors.status = 403
             return
-        if any([i.status != 'active' for i in self.request.validated['auction'].lots if i.id == self.request.validated['award'].lotID]):
+        if self.request.validated['auction'].lot_inactive(self.request.validated['award'].lotID):
             self.request.errors.add('body', 'data', 'Can add document only in active lot status')
             self.request.errors.status = 403
             return
@@ -91,7 +89,7 @@ class AuctionAwardComplaintDocumentResource(APIResource):
             self.request.errors.add('body', 'data', 'Can\'t update document in current ({}) auction status'.format(self.request.validated['auction_status']))
             self.request.errors.status = 403
             return
-        if any([i.status != 'active' for i in self.request.validated['auction'].lots if i.id == self.request.validated['award'].lotID]):
+        if self.request.validated['auction'].lot_inactive(self.request.validated['award'].lotID):
             self.request.errors.add('body', 'data', 'Can update document only in active lot status')
             self.request.errors.status = 403
             return
@@ -118,7 +116,7 @@ class AuctionAwardComplaintDocumentResource(APIResource):
             self.request.errors.add('body', 'data', 'Can\'t update document in current ({}) auction status'.format(self.request.validated['auction_status']))
             self.request.errors.status = 403
             return
-        if any([i.status != 'active' for i in self.request.validated['auction'].lots if i.id == self.request.validated['award'].lotID]):
+        if self.request.validated['auction'].lot_inactive(self.request.validated['award'].lotID):
             self.request.errors.add('body', 'data', 'Can update document only in active lot status')
             self.request.errors.status = 403
             return
@@ -1,21 +1,26 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.utils import (
-    get_file,
-    upload_file,
     update_file_content_type,
-    json_view,
     context_unpack,
     APIResource,
 )
 from openprocurement.api.validation import (
-    validate_file_update,
-    validate_file_upload,
     validate_patch_document_data,
 )
 from openprocurement.auctions.core.utils import (
+    opresource,
+)
+from openprocurement.auctions.dgf.documents import documents_collection
+from openprocurement.auctions.dgf.utils import (
+    json_view,
     save_auction,
     apply_patch,
-    opresource,
+    get_file,
+    upload_file,
+)
+from openprocurement.auctions.dgf.validation import (
+    validate_file_update,
+    validate_file_upload,
 )
 
 
@@ -33,8 +38,7 @@ class AuctionAwardDocumentResource(APIResource):
                                                                                                                   'auction_status']))
             self.request.errors.status = 403
             return
-        if any([i.status != 'active' for i in self.request.validated['auction'].lots if
-                i.id == self.request.validated['award'].lotID]):
+        if self.request.validated['auction'].lot_inactive(self.request.validated['award'].lotID):
             self.request.errors.add('body', 'data', 'Can {} document only in active lot status'.format(operation))
             self.request.errors.status = 403
             return
@@ -43,14 +47,7 @@ class AuctionAwardDocumentResource(APIResource):
     @json_view(permission='view_auction')
     def collection_get(self):
         """Auction Award Documents List"""
-        if self.request.params.get('all', ''):
-            collection_data = [i.serialize("view") for i in self.context.documents]
-        else:
-            collection_data = sorted(dict([
-                (i.id, i.serialize("view"))
-                for i in self.context.documents
-            ]).values(), key=lambda i: i['dateModified'])
-        return {'data': collection_data}
+        return documents_collection(self.request, self.context)
 
     @json_view(validators=(validate_file_upload,), permission='edit_auction')
     def collection_post(self):
@@ -1,20 +1,26 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.models import get_now
 from openprocurement.api.utils import (
-    json_view,
     context_unpack,
     APIResource,
     set_ownership,
 )
 from openprocurement.auctions.core.utils import (
-    save_auction,
-    apply_patch,
     opresource,
 )
 from openprocurement.auctions.core.validation import (
     validate_bid_data,
     validate_patch_bid_data,
 )
+from openprocurement.auctions.dgf.utils import (
+    json_view,
+    save_auction,
+    apply_patch,
+    serialize_view,
+)
+from openprocurement.auctions.dgf.validation import (
+    validate_bids_batch_data,
+)
 
 
 
@@ -172,7 +178,8 @@ class AuctionBidResource(APIResource):
             self.request.errors.add('body', 'data', 'Can\'t view bids in current ({}) auction status'.format(self.request.validated['auction_status']))
             self.request.errors.status = 403
             return
-        return {'data': [i.serialize(self.request.validated['auction_status']) for i in auction.bids]}
+        role = self.request.validated['auction_status']
+        return {'data': serialize_view(self.request, ('bids', role), auction.bids, role)}
 
     @json_view(permission='view_auction')
     def get(self):
@@ -327,3 +334,42 @@ class AuctionBidResource(APIResource):
             self.LOGGER.info('Deleted auction bid {}'.format(self.request.context.id),
                         extra=context_unpack(self.request, {'MESSAGE_ID': 'auction_bid_delete'}))
             return {'data': res}
+
+
+@opresource(name='Auction Bids Batch',
+            path='/auctions/{auction_id}/bids_batch',
+            auctionsprocurementMethodType="dgfOtherAssets",
+            description="Batch registration of auction bids")
+class AuctionBidsBatchResource(APIResource):
+
+    @json_view(content_type="application/json", permission='create_bid', validators=(validate_bids_batch_data,))
+    def post(self):
+        """Registration of several bid proposals in one request
+
+        The bids are validated one by one as a single bid registration
+        would be; if any of them is invalid the whole batch is rejected with
+        the errors of each bid. Otherwise they are saved together in a single
+        auction update and listed, in request order, with their access tokens.
+        """
+        auction = self.request.validated['auction']
+        if self.request.validated['auction_status'] != 'active.tendering':
+            self.request.errors.add('body', 'data', 'Can\'t add bid in current ({}) auction status'.format(self.request.validated['auction_status']))
+            self.request.errors.status = 403
+            return
+        if auction.tenderPeriod.startDate and get_now() < auction.tenderPeriod.startDate or get_now() > auction.tenderPeriod.endDate:
+            self.request.errors.add('body', 'data', 'Bid can be added only during the tendering period: from ({}) to ({}).'.format(auction.tenderPeriod.startDate and auction.tenderPeriod.startDate.isoformat(), auction.tenderPeriod.endDate.isoformat()))
+            self.request.errors.status = 403
+            return
+        bids = self.request.validated['bids']
+        for bid in bids:
+            set_ownership(bid, self.request)
+            auction.bids.append(bid)
+        auction.modified = False
+        if save_auction(self.request):
+            self.LOGGER.info('Created auction bids {}'.format(', '.join([bid.id for bid in bids])),
+                        extra=context_unpack(self.request, {'MESSAGE_ID': 'auction_bids_batch_create'}, {'bids_count': len(bids)}))
+            self.request.response.status = 201
+            return {'data': [
+                {'data': bid.serialize('view'), 'access': {'token': bid.owner_token}}
+                for bid in bids
+            ]}
@@ -1,22 +1,27 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.models import get_now
 from openprocurement.api.utils import (
-    get_file,
-    upload_file,
     update_file_content_type,
-    json_view,
     context_unpack,
     APIResource,
 )
 from openprocurement.api.validation import (
-    validate_file_update,
-    validate_file_upload,
     validate_patch_document_data,
 )
 from openprocurement.auctions.core.utils import (
+    opresource,
+)
+from openprocurement.auctions.dgf.documents import documents_collection
+from openprocurement.auctions.dgf.utils import (
+    json_view,
     save_auction,
     apply_patch,
-    opresource,
+    get_file,
+    upload_file,
+)
+from openprocurement.auctions.dgf.validation import (
+    validate_file_update,
+    validate_file_upload,
 )
 
 
@@ -34,14 +39,7 @@ class AuctionBidDocumentResource(APIResource):
             self.request.errors.add('body', 'data', 'Can\'t view bid documents in current ({}) auction status'.format(self.request.validated['auction_status']))
             self.request.errors.status = 403
             return
-        if self.request.params.get('all', ''):
-            collection_data = [i.serialize("view") for i in self.context.documents]
-        else:
-            collection_data = sorted(dict([
-                (i.id, i.serialize("view"))
-                for i in self.context.documents
-            ]).values(), key=lambda i: i['dateModified'])
-        return {'data': collection_data}
+        return documents_collection(self.request, self.context)
 
     @json_view(validators=(validate_file_upload,), permission='edit_bid')
     def collection_post(self):
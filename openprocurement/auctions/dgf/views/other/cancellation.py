@@ -1,13 +1,10 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.utils import (
-    json_view,
     context_unpack,
     APIResource,
     get_now
 )
 from openprocurement.auctions.core.utils import (
-    apply_patch,
-    save_auction,
     add_next_award,
     opresource,
 
@@ -16,6 +13,12 @@ from openprocurement.auctions.core.validation import (
     validate_cancellation_data,
     validate_patch_cancellation_data,
 )
+from openprocurement.auctions.dgf.utils import (
+    json_view,
+    apply_patch,
+    save_auction,
+    serialize_view,
+)
 
 
 @opresource(name='Auction Cancellations',
@@ -36,7 +39,9 @@ class AuctionCancellationResource(APIResource):
         if not cancellation:
             cancellation = self.context
         auction = self.request.validated['auction']
-        [setattr(i, 'status', 'cancelled') for i in auction.lots if i.id == cancellation.relatedLot]
+        lot = auction.get_lot(cancellation.relatedLot)
+        if lot is not None:
+            lot.status = 'cancelled'
         statuses = set([lot.status for lot in auction.lots])
         if statuses == set(['cancelled']):
             self.cancel_auction()
@@ -62,7 +67,7 @@ class AuctionCancellationResource(APIResource):
             return
         cancellation = self.request.validated['cancellation']
         cancellation.date = get_now()
-        if any([i.status != 'active' for i in auction.lots if i.id == cancellation.relatedLot]):
+        if auction.lot_inactive(cancellation.relatedLot):
             self.request.errors.add('body', 'data', 'Can add cancellation only in active lot status')
             self.request.errors.status = 403
             return
@@ -82,13 +87,13 @@ class AuctionCancellationResource(APIResource):
     def collection_get(self):
         """List cancellations
         """
-        return {'data': [i.serialize("view") for i in self.request.validated['auction'].cancellations]}
+        return {'data': serialize_view(self.request, None, self.request.validated['auction'].cancellations, 'view')}
 
     @json_view(permission='view_auction')
     def get(self):
         """Retrieving the cancellation
         """
-        return {'data': self.request.validated['cancellation'].serialize("view")}
+        return {'data': serialize_view(self.request, None, self.request.validated['cancellation'], 'view')}
 
     @json_view(content_type="application/json", validators=(validate_patch_cancellation_data,), permission='edit_auction')
     def patch(self):
@@ -99,7 +104,7 @@ class AuctionCancellationResource(APIResource):
             self.request.errors.add('body', 'data', 'Can\'t update cancellation in current ({}) auction status'.format(auction.status))
             self.request.errors.status = 403
             return
-        if any([i.status != 'active' for i in auction.lots if i.id == self.request.context.relatedLot]):
+        if auction.lot_inactive(self.request.context.relatedLot):
             self.request.errors.add('body', 'data', 'Can update cancellation only in active lot status')
             self.request.errors.status = 403
             return
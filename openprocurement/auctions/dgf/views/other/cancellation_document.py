@@ -1,21 +1,26 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.utils import (
-    get_file,
-    upload_file,
     update_file_content_type,
-    json_view,
     context_unpack,
     APIResource,
 )
 from openprocurement.api.validation import (
-    validate_file_update,
-    validate_file_upload,
     validate_patch_document_data,
 )
 from openprocurement.auctions.core.utils import (
+    opresource,
+)
+from openprocurement.auctions.dgf.documents import documents_collection
+from openprocurement.auctions.dgf.utils import (
+    json_view,
     save_auction,
     apply_patch,
-    opresource,
+    get_file,
+    upload_file,
+)
+from openprocurement.auctions.dgf.validation import (
+    validate_file_update,
+    validate_file_upload,
 )
 
 
@@ -29,14 +34,7 @@ class AuctionCancellationDocumentResource(APIResource):
     @json_view(permission='view_auction')
     def collection_get(self):
         """Auction Cancellation Documents List"""
-        if self.request.params.get('all', ''):
-            collection_data = [i.serialize("view") for i in self.context.documents]
-        else:
-            collection_data = sorted(dict([
-                (i.id, i.serialize("view"))
-                for i in self.context.documents
-            ]).values(), key=lambda i: i['dateModified'])
-        return {'data': collection_data}
+        return documents_collection(self.request, self.context)
 
     @json_view(validators=(validate_file_upload,), permission='edit_auction')
     def collection_post(self):
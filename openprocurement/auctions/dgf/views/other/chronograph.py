@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import re
+
+from iso8601 import ParseError, parse_date
+from openprocurement.api.models import get_now
+from openprocurement.api.utils import (
+    APIResource,
+)
+from openprocurement.auctions.core.utils import (
+    opresource,
+)
+from openprocurement.auctions.dgf.chronograph import (
+    DEFAULT_DUE_LIMIT, MODELS, check_auctions, due_auctions,
+)
+from openprocurement.auctions.dgf.utils import (
+    json_view,
+)
+from openprocurement.auctions.dgf.validation import (
+    validate_chronograph_batch_data,
+)
+
+OFFSET = re.compile(r'^\d+\.\w+$')
+
+
+@opresource(name='Auctions Chronograph',
+            path='/auctions_chronograph',
+            description="Chronograph checks of dgf auctions in bulk")
+class AuctionsChronographResource(APIResource):
+
+    @json_view(content_type="application/json", validators=(validate_chronograph_batch_data,), permission='view_listing')
+    def post(self):
+        """Check auctions in bulk
+
+        The chronograph posts a list of auction ids; each auction is checked
+        as with a chronograph PATCH of the auction and the changed ones are
+        saved with one bulk write. The response lists a result per id.
+        """
+        if self.request.authenticated_role != 'chronograph':
+            self.request.errors.add('body', 'data', 'Forbidden')
+            self.request.errors.status = 403
+            return
+        return {'data': check_auctions(self.request, self.request.validated['auction_ids'])}
+
+
+@opresource(name='Auctions Due',
+            path='/auctions_due',
+            description="dgf auctions due for a chronograph check")
+class AuctionsDueResource(APIResource):
+
+    @json_view(permission='view_listing')
+    def get(self):
+        """Auctions due for a check
+
+        Lists ``id``, ``next_check`` and ``procurementMethodType`` of dgf
+        auctions with ``next_check`` up to ``before`` (now by default),
+        earliest first. ``procurementMethodType`` narrows the list to one
+        type; pages are ``limit`` long and continue from ``offset``.
+        """
+        params = self.request.params
+        try:
+            before = parse_date(params['before']) if params.get('before') else get_now()
+        except ParseError:
+            self.request.errors.add('querystring', 'before', 'Invalid date')
+            self.request.errors.status = 422
+            return
+        procurementMethodType = params.get('procurementMethodType')
+        if procurementMethodType and procurementMethodType not in MODELS:
+            self.request.errors.add('querystring', 'procurementMethodType', 'Should be one of {}'.format(', '.join(sorted(MODELS))))
+            self.request.errors.status = 422
+            return
+        limit = params.get('limit', str(DEFAULT_DUE_LIMIT))
+        if not limit.isdigit() or not 0 < int(limit) <= 1000:
+            self.request.errors.add('querystring', 'limit', 'Should be an integer from 1 to 1000')
+            self.request.errors.status = 422
+            return
+        offset = params.get('offset')
+        if offset and not OFFSET.match(offset):
+            self.request.errors.add('querystring', 'offset', 'Invalid offset')
+            self.request.errors.status = 422
+            return
+        data, next_offset = due_auctions(self.request.registry.db, before, procurementMethodType, int(limit), offset)
+        result = {'data': data}
+        if next_offset:
+            next_params = dict(params, offset=next_offset)
+            result['next_page'] = {
+                'offset': next_offset,
+                'path': self.request.route_path('Auctions Due', _query=next_params),
+                'uri': self.request.route_url('Auctions Due', _query=next_params),
+            }
+        return result
@@ -2,21 +2,26 @@
 from openprocurement.api.models import get_now
 from openprocurement.api.utils import (
     context_unpack,
-    json_view,
     set_ownership,
     APIResource,
 )
 from openprocurement.auctions.core.utils import (
-    apply_patch,
     check_auction_status,
     opresource,
-    save_auction,
 
 )
 from openprocurement.auctions.core.validation import (
     validate_complaint_data,
     validate_patch_complaint_data,
 )
+from openprocurement.auctions.dgf.utils import (
+    json_view,
+    allocate_complaint_id,
+    apply_patch,
+    save_auction,
+    saved_complaint,
+    serialize_view,
+)
 
 
 @opresource(name='Auction Complaints',
@@ -41,10 +46,12 @@ class AuctionComplaintResource(APIResource):
             complaint.dateSubmitted = get_now()
         else:
             complaint.status = 'draft'
-        complaint.complaintID = '{}.{}{}'.format(auction.auctionID, self.server_id, sum([len(i.complaints) for i in auction.awards], len(auction.complaints)) + 1)
+        allocate_complaint_id(self.request, complaint)
         set_ownership(complaint, self.request)
         auction.complaints.append(complaint)
         if save_auction(self.request):
+            auction = self.request.validated['auction']
+            complaint = saved_complaint(self.request, complaint)
             self.LOGGER.info('Created auction complaint {}'.format(complaint.id),
                         extra=context_unpack(self.request, {'MESSAGE_ID': 'auction_complaint_create'}, {'complaint_id': complaint.id}))
             self.request.response.status = 201
@@ -60,13 +67,13 @@ class AuctionComplaintResource(APIResource):
     def collection_get(self):
         """List complaints
         """
-        return {'data': [i.serialize("view") for i in self.context.complaints]}
+        return {'data': serialize_view(self.request, None, self.context.complaints, 'view')}
 
     @json_view(permission='view_auction')
     def get(self):
         """Retrieving the complaint
         """
-        return {'data': self.context.serialize("view")}
+        return {'data': serialize_view(self.request, None, self.context, 'view')}
 
     @json_view(content_type="application/json", validators=(validate_patch_complaint_data,), permission='edit_complaint')
     def patch(self):
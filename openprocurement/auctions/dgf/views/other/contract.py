@@ -1,13 +1,10 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.models import get_now
 from openprocurement.api.utils import (
-    json_view,
     context_unpack,
     APIResource,
 )
 from openprocurement.auctions.core.utils import (
-    apply_patch,
-    save_auction,
     check_auction_status,
     opresource,
 )
@@ -15,6 +12,12 @@ from openprocurement.auctions.core.validation import (
     validate_contract_data,
     validate_patch_contract_data,
 )
+from openprocurement.auctions.dgf.utils import (
+    json_view,
+    apply_patch,
+    save_auction,
+    serialize_view,
+)
 
 
 @opresource(name='Auction Contracts',
@@ -46,13 +49,13 @@ class AuctionAwardContractResource(APIResource):
     def collection_get(self):
         """List contracts for award
         """
-        return {'data': [i.serialize() for i in self.request.context.contracts]}
+        return {'data': serialize_view(self.request, None, self.request.context.contracts, None)}
 
     @json_view(permission='view_auction')
     def get(self):
         """Retrieving the contract for award
         """
-        return {'data': self.request.validated['contract'].serialize()}
+        return {'data': serialize_view(self.request, None, self.request.validated['contract'], None)}
 
     @json_view(content_type="application/json", permission='edit_auction', validators=(validate_patch_contract_data,))
     def patch(self):
@@ -63,7 +66,8 @@ class AuctionAwardContractResource(APIResource):
             self.request.errors.status = 403
             return
         auction = self.request.validated['auction']
-        if any([i.status != 'active' for i in auction.lots if i.id in [a.lotID for a in auction.awards if a.id == self.request.context.awardID]]):
+        award = auction.get_award(self.request.context.awardID)
+        if award is not None and auction.lot_inactive(award.lotID):
             self.request.errors.add('body', 'data', 'Can update contract only in active lot status')
             self.request.errors.status = 403
             return
@@ -76,14 +80,12 @@ class AuctionAwardContractResource(APIResource):
                     self.request.errors.status = 403
                     return
 
-            award = [a for a in auction.awards if a.id == self.request.context.awardID][0]
             if data['value']['amount'] < award.value.amount:
                 self.request.errors.add('body', 'data', 'Value amount should be greater or equal to awarded amount ({})'.format(award.value.amount))
                 self.request.errors.status = 403
                 return
 
         if self.request.context.status != 'active' and 'status' in data and data['status'] == 'active':
-            award = [a for a in auction.awards if a.id == self.request.context.awardID][0]
             stand_still_end = award.complaintPeriod.endDate
             if stand_still_end > get_now():
                 self.request.errors.add('body', 'data', 'Can\'t sign contract before stand-still period end ({})'.format(stand_still_end.isoformat()))
@@ -91,14 +93,14 @@ class AuctionAwardContractResource(APIResource):
                 return
             pending_complaints = [
                 i
-                for i in auction.complaints
-                if i.status in ['claim', 'answered', 'pending'] and i.relatedLot in [None, award.lotID]
+                for i in auction.lot_complaints(None) + (auction.lot_complaints(award.lotID) if award.lotID else [])
+                if i.status in ['claim', 'answered', 'pending']
             ]
             pending_awards_complaints = [
                 i
-                for a in auction.awards
+                for a in auction.lot_awards(award.lotID)
                 for i in a.complaints
-                if i.status in ['claim', 'answered', 'pending'] and a.lotID == award.lotID
+                if i.status in ['claim', 'answered', 'pending']
             ]
             if pending_complaints or pending_awards_complaints:
                 self.request.errors.add('body', 'data', 'Can\'t sign contract before reviewing all complaints')
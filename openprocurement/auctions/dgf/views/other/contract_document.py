@@ -1,21 +1,26 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.utils import (
-    get_file,
-    upload_file,
     update_file_content_type,
-    json_view,
     context_unpack,
     APIResource,
 )
 from openprocurement.api.validation import (
-    validate_file_update,
-    validate_file_upload,
     validate_patch_document_data,
 )
 from openprocurement.auctions.core.utils import (
+    opresource,
+)
+from openprocurement.auctions.dgf.documents import documents_collection
+from openprocurement.auctions.dgf.utils import (
+    json_view,
     save_auction,
     apply_patch,
-    opresource,
+    get_file,
+    upload_file,
+)
+from openprocurement.auctions.dgf.validation import (
+    validate_file_update,
+    validate_file_upload,
 )
 
 
@@ -33,9 +38,9 @@ class AuctionAwardContractDocumentResource(APIResource):
                                                                                                                   'auction_status']))
             self.request.errors.status = 403
             return
-        if any([i.status != 'active' for i in self.request.validated['auction'].lots if
-                i.id in [a.lotID for a in self.request.validated['auction'].awards if
-                         a.id == self.request.validated['contract'].awardID]]):
+        auction = self.request.validated['auction']
+        award = auction.get_award(self.request.validated['contract'].awardID)
+        if award is not None and auction.lot_inactive(award.lotID):
             self.request.errors.add('body', 'data', 'Can {} document only in active lot status'.format(operation))
             self.request.errors.status = 403
             return
@@ -48,14 +53,7 @@ class AuctionAwardContractDocumentResource(APIResource):
     @json_view(permission='view_auction')
     def collection_get(self):
         """Auction Contract Documents List"""
-        if self.request.params.get('all', ''):
-            collection_data = [i.serialize("view") for i in self.context.documents]
-        else:
-            collection_data = sorted(dict([
-                (i.id, i.serialize("view"))
-                for i in self.context.documents
-            ]).values(), key=lambda i: i['dateModified'])
-        return {'data': collection_data}
+        return documents_collection(self.request, self.context)
 
     @json_view(permission='edit_auction', validators=(validate_file_upload,))
     def collection_post(self):
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from openprocurement.api.utils import (
+    APIResource,
+)
+from openprocurement.auctions.core.utils import (
+    opresource,
+)
+from openprocurement.auctions.dgf.history import (
+    historic_auction,
+    load_revisions,
+)
+from openprocurement.auctions.dgf.serializers import (
+    serialize_role,
+)
+from openprocurement.auctions.dgf.utils import (
+    json_view,
+)
+
+
+@opresource(name='Auction History',
+            collection_path='/auctions/{auction_id}/history',
+            path='/auctions/{auction_id}/history/{revision}',
+            auctionsprocurementMethodType="dgfOtherAssets",
+            description="Auction revision history")
+class AuctionHistoryResource(APIResource):
+
+    @json_view(permission='view_auction')
+    def collection_get(self):
+        """List of the auction revisions
+
+        Each revision is listed with its number and the date it was saved,
+        archived revisions included.
+        """
+        revisions = load_revisions(self.request.registry.db, self.request.validated['auction'])
+        return {'data': [{'revision': number, 'date': revision['date']} for number, revision in enumerate(revisions, 1)]}
+
+    @json_view(permission='view_auction')
+    def get(self):
+        """The auction as saved by a revision
+
+        Returns the auction, as a GET of the auction would have at the time,
+        after the changes of the revision with the given number (1 is the
+        auction as created).
+        """
+        auction = self.request.validated['auction']
+        revisions = load_revisions(self.request.registry.db, auction)
+        number = self.request.matchdict['revision']
+        if not number.isdigit() or not 0 < int(number) <= len(revisions):
+            self.request.errors.add('url', 'revision', 'Not Found')
+            self.request.errors.status = 404
+            return
+        historic = historic_auction(auction, auction.serialize('plain'), revisions, int(number))
+        return {'data': serialize_role(historic, historic.status)}
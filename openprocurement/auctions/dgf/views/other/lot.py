@@ -1,19 +1,22 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.utils import (
-    json_view,
     context_unpack,
     APIResource,
     get_now
 )
 from openprocurement.auctions.core.utils import (
-    apply_patch,
-    save_auction,
     opresource,
 )
 from openprocurement.auctions.core.validation import (
     validate_lot_data,
     validate_patch_lot_data,
 )
+from openprocurement.auctions.dgf.utils import (
+    json_view,
+    apply_patch,
+    save_auction,
+    serialize_view,
+)
 
 
 @opresource(name='Auction Lots',
@@ -46,13 +49,14 @@ class AuctionLotResource(APIResource):
     def collection_get(self):
         """Lots Listing
         """
-        return {'data': [i.serialize("view") for i in self.request.validated['auction'].lots]}
+        auction = self.request.validated['auction']
+        return {'data': serialize_view(self.request, ('lots', 'view'), auction.lots, 'view')}
 
     @json_view(permission='view_auction')
     def get(self):
         """Retrieving the lot
         """
-        return {'data': self.request.context.serialize("view")}
+        return {'data': serialize_view(self.request, None, self.request.context, 'view')}
 
     @json_view(content_type="application/json", validators=(validate_patch_lot_data,), permission='edit_auction')
     def patch(self):
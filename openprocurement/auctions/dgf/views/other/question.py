@@ -1,13 +1,10 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.models import get_now
 from openprocurement.api.utils import (
-    json_view,
     context_unpack,
     APIResource,
 )
 from openprocurement.auctions.core.utils import (
-    apply_patch,
-    save_auction,
     opresource,
 
 )
@@ -15,6 +12,12 @@ from openprocurement.auctions.core.validation import (
     validate_question_data,
     validate_patch_question_data,
 )
+from openprocurement.auctions.dgf.utils import (
+    json_view,
+    apply_patch,
+    save_auction,
+    serialize_view,
+)
 
 
 @opresource(name='Auction Questions',
@@ -34,7 +37,7 @@ class AuctionQuestionResource(APIResource):
             self.request.errors.status = 403
             return
         question = self.request.validated['question']
-        if any([i.status != 'active' for i in auction.lots if i.id == question.relatedItem]):
+        if auction.lot_inactive(question.relatedItem):
             self.request.errors.add('body', 'data', 'Can add question only in active lot status')
             self.request.errors.status = 403
             return
@@ -50,13 +53,14 @@ class AuctionQuestionResource(APIResource):
     def collection_get(self):
         """List questions
         """
-        return {'data': [i.serialize(self.request.validated['auction'].status) for i in self.request.validated['auction'].questions]}
+        auction = self.request.validated['auction']
+        return {'data': serialize_view(self.request, ('questions', auction.status), auction.questions, auction.status)}
 
     @json_view(permission='view_auction')
     def get(self):
         """Retrieving the question
         """
-        return {'data': self.request.validated['question'].serialize(self.request.validated['auction'].status)}
+        return {'data': serialize_view(self.request, None, self.request.validated['question'], self.request.validated['auction'].status)}
 
     @json_view(content_type="application/json", permission='edit_auction', validators=(validate_patch_question_data,))
     def patch(self):
@@ -67,7 +71,7 @@ class AuctionQuestionResource(APIResource):
             self.request.errors.add('body', 'data', 'Can\'t update question in current ({}) auction status'.format(auction.status))
             self.request.errors.status = 403
             return
-        if any([i.status != 'active' for i in auction.lots if i.id == self.request.context.relatedItem]):
+        if auction.lot_inactive(self.request.context.relatedItem):
             self.request.errors.add('body', 'data', 'Can update question only in active lot status')
             self.request.errors.status = 403
             return
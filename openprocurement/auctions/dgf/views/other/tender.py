@@ -1,18 +1,21 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.utils import (
     context_unpack,
-    json_view,
     APIResource,
 )
 from openprocurement.auctions.core.utils import (
-    apply_patch,
     check_status,
     opresource,
-    save_auction,
 )
 from openprocurement.auctions.core.validation import (
     validate_patch_auction_data,
 )
+from openprocurement.auctions.dgf.utils import (
+    json_view,
+    apply_patch,
+    save_auction,
+    serialize_view,
+)
 
 
 @opresource(name='Auction',
@@ -108,10 +111,9 @@ class AuctionResource(APIResource):
             }
 
         """
-        if self.request.authenticated_role == 'chronograph':
-            auction_data = self.context.serialize('chronograph_view')
-        else:
-            auction_data = self.context.serialize(self.context.status)
+        auction = self.context
+        role = 'chronograph_view' if self.request.authenticated_role == 'chronograph' else auction.status
+        auction_data = serialize_view(self.request, ('auction', role), auction, role)
         return {'data': auction_data}
 
     #@json_view(content_type="application/json", validators=(validate_auction_data, ), permission='edit_auction')
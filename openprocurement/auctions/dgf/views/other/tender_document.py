@@ -1,21 +1,27 @@
 # -*- coding: utf-8 -*-
 from openprocurement.api.utils import (
     update_file_content_type,
-    json_view,
     context_unpack,
     APIResource,
 )
 from openprocurement.api.validation import (
-    validate_file_update,
-    validate_file_upload,
     validate_patch_document_data,
 )
 from openprocurement.auctions.core.utils import (
+    opresource,
+)
+from openprocurement.auctions.dgf.documents import documents_collection
+from openprocurement.auctions.dgf.utils import (
+    json_view,
     save_auction,
     apply_patch,
-    opresource,
+    get_file,
+    upload_file,
+)
+from openprocurement.auctions.dgf.validation import (
+    validate_file_update,
+    validate_file_upload,
 )
-from openprocurement.auctions.dgf.utils import upload_file, get_file
 
 
 @opresource(name='Auction Documents',
@@ -28,14 +34,7 @@ class AuctionDocumentResource(APIResource):
     @json_view(permission='view_auction')
     def collection_get(self):
         """Auction Documents List"""
-        if self.request.params.get('all', ''):
-            collection_data = [i.serialize("view") for i in self.context.documents]
-        else:
-            collection_data = sorted(dict([
-                (i.id, i.serialize("view"))
-                for i in self.context.documents
-            ]).values(), key=lambda i: i['dateModified'])
-        return {'data': collection_data}
+        return documents_collection(self.request, self.context)
 
     @json_view(permission='upload_auction_documents', validators=(validate_file_upload,))
     def collection_post(self):
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Keep the serialization cache warm from the CouchDB changes feed.
+
+Each worker runs a ``CacheWarmer`` thread that long-polls ``_changes`` for
+dgf auctions, selected by the ``auctions_dgf/changes`` filter of the design
+document. For every new revision it drops the cached views of the auction
+and serializes the public view of its status again, so the first read
+after a save, made by any worker, is already served from the cache.
+Deleted auctions are only dropped. The feed starts from the moment the
+thread starts; older revisions are warmed by reads as before.
+"""
+import threading
+from logging import getLogger
+
+from couchdb.http import ResourceNotFound
+from openprocurement.auctions.dgf.chronograph import MODELS
+from openprocurement.auctions.dgf.design import CHANGES_FILTER, sync_design
+from openprocurement.auctions.dgf.serializers import serialize_role
+
+LOGGER = getLogger(__name__)
+DEFAULT_WARMER_TIMEOUT = 60000
+RETRY_DELAY = 5
+
+
+class CacheWarmer(threading.Thread):
+
+    def __init__(self, db, cache, timeout=DEFAULT_WARMER_TIMEOUT):
+        super(CacheWarmer, self).__init__(name='dgf-cache-warmer')
+        self.daemon = True
+        self.db = db
+        self.cache = cache
+        self.timeout = timeout
+        self.since = None
+        self.warmed = 0
+        self.stopped = threading.Event()
+
+    def warm(self, change):
+        """Refresh the cached public view of the auction in ``change``."""
+        self.cache.invalidate(change['id'])
+        doc = change.get('doc')
+        if change.get('deleted') or not doc or doc.get('doc_type') != 'Auction' or doc.get('procurementMethodType') not in MODELS:
+            return
+        auction = MODELS[doc['procurementMethodType']](doc)
+        role = auction.status
+        self.cache.get(auction, ('auction', role), lambda: serialize_role(auction, role))
+        self.warmed += 1
+
+    def poll(self, **params):
+        """Warm the auctions changed since the last poll."""
+        if self.since is None:
+            self.since = self.db.info()['update_seq']
+        params.update(since=self.since, include_docs=True, filter=CHANGES_FILTER)
+        try:
+            changes = self.db.changes(**params)
+        except ResourceNotFound:
+            sync_design(self.db)
+            changes = self.db.changes(**params)
+        for change in changes['results']:
+            try:
+                self.warm(change)
+            except Exception:
+                LOGGER.exception('Failed to warm auction {}'.format(change['id']), extra={'MESSAGE_ID': 'dgf_cache_warmer'})
+        self.since = changes['last_seq']
+
+    def run(self):
+        while not self.stopped.is_set():
+            try:
+                self.poll(feed='longpoll', timeout=self.timeout)
+            except Exception:
+                LOGGER.exception('Changes feed failed', extra={'MESSAGE_ID': 'dgf_cache_warmer'})
+                self.stopped.wait(RETRY_DELAY)
+
+    def stop(self):
+        self.stopped.set()
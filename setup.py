@@ -6,6 +6,12 @@ version = '0.1'
 entry_points = {
     'openprocurement.auctions.core.plugins': [
         'auctions.dgf = openprocurement.auctions.dgf:includeme'
+    ],
+    'openprocurement.api.migrations': [
+        'auctions.dgf = openprocurement.auctions.dgf.migration:migrate_data'
+    ],
+    'console_scripts': [
+        'dgf_export = openprocurement.auctions.dgf.export:main'
     ]
 }
 